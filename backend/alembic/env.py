@@ -1,8 +1,8 @@
 import sys
 import os
 
-# Add the project root to sys.path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Add the project root to sys.path, so the app's `backend.` imports resolve
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
 from logging.config import fileConfig
 
@@ -10,7 +10,8 @@ from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 
 from alembic import context
-from models import Base
+from backend.models import Base
+from backend.search import SEARCH_COLUMNS
 
 
 # this is the Alembic Config object, which provides
@@ -33,6 +34,21 @@ target_metadata = Base.metadata
 # my_important_option = config.get_main_option("my_important_option")
 # ... etc.
 
+# SQLite's FTS5 search tables, their shadow and key tables are created by
+# raw DDL from backend/search.py, not declared as tables
+FTS_TABLE_PREFIXES = tuple(f"{table}_fts" for table in SEARCH_COLUMNS)
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Leave out objects the models only create on another dialect."""
+    if type_ == "table" and reflected and compare_to is None and name.startswith(FTS_TABLE_PREFIXES):
+        return False
+    ddl_if = getattr(object, "_ddl_if", None)
+    if ddl_if is not None and ddl_if.dialect and ddl_if.dialect != context.get_context().dialect.name:
+        # e.g. the pg_trgm indexes, which SQLite databases never get
+        return False
+    return True
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -50,6 +66,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -73,7 +90,8 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
@@ -0,0 +1,46 @@
+"""Add unique (user_id, event_id) and event_id index to registrations
+
+Revision ID: 4b1e9c2d7a10
+Revises: 703c5c9c7f02
+Create Date: 2026-10-18 10:12:31.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b1e9c2d7a10'
+down_revision: Union[str, Sequence[str], None] = '703c5c9c7f02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Drop duplicate registrations left behind by the old check-then-insert
+    # race, keeping the earliest one for each (user_id, event_id) pair
+    op.execute(
+        """
+        DELETE FROM registrations
+        WHERE id NOT IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY user_id, event_id ORDER BY registered_at, id
+                ) AS rn
+                FROM registrations
+            ) ranked
+            WHERE rn = 1
+        )
+        """
+    )
+    op.create_index('uq_registrations_user_event', 'registrations', ['user_id', 'event_id'], unique=True)
+    op.create_index(op.f('ix_registrations_event_id'), 'registrations', ['event_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_registrations_event_id'), table_name='registrations')
+    op.drop_index('uq_registrations_user_event', table_name='registrations')
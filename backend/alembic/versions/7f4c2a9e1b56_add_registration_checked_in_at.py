@@ -0,0 +1,28 @@
+"""Add registrations.checked_in_at
+
+Revision ID: 7f4c2a9e1b56
+Revises: e21b6d0f4a93
+Create Date: 2026-10-18 13:05:12.804117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f4c2a9e1b56'
+down_revision: Union[str, Sequence[str], None] = 'e21b6d0f4a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('registrations', sa.Column('checked_in_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('registrations', 'checked_in_at')
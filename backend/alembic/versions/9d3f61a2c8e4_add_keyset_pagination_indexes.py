@@ -0,0 +1,37 @@
+"""Add keyset pagination indexes
+
+Revision ID: 9d3f61a2c8e4
+Revises: 4b1e9c2d7a10
+Create Date: 2026-10-18 11:02:54.730611
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3f61a2c8e4'
+down_revision: Union[str, Sequence[str], None] = '4b1e9c2d7a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_registrations_registered_at_id', 'registrations', ['registered_at', 'id'], unique=False)
+    op.create_index('ix_registrations_event_registered_at_id', 'registrations', ['event_id', 'registered_at', 'id'], unique=False)
+    # Covered by the leading column of the composite index above
+    op.drop_index('ix_registrations_event_id', table_name='registrations')
+    op.create_index('ix_users_registered_at_id', 'users', ['registered_at', 'id'], unique=False)
+    op.create_index('ix_events_date_id', 'events', ['date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_events_date_id', table_name='events')
+    op.drop_index('ix_users_registered_at_id', table_name='users')
+    op.create_index('ix_registrations_event_id', 'registrations', ['event_id'], unique=False)
+    op.drop_index('ix_registrations_event_registered_at_id', table_name='registrations')
+    op.drop_index('ix_registrations_registered_at_id', table_name='registrations')
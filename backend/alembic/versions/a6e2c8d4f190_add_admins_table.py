@@ -0,0 +1,41 @@
+"""Add admins table
+
+Revision ID: a6e2c8d4f190
+Revises: f3b9a6d1c072
+Create Date: 2026-10-18 19:12:40.518337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6e2c8d4f190'
+down_revision: Union[str, Sequence[str], None] = 'f3b9a6d1c072'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Databases that ran the app before startup stopped calling create_all
+    # already have this table
+    if sa.inspect(op.get_bind()).has_table('admins'):
+        return
+    op.create_table('admins',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('username', sa.String(), nullable=True),
+    sa.Column('hashed_password', sa.String(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_admins_id'), 'admins', ['id'], unique=False)
+    op.create_index(op.f('ix_admins_username'), 'admins', ['username'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_admins_username'), table_name='admins')
+    op.drop_index(op.f('ix_admins_id'), table_name='admins')
+    op.drop_table('admins')
@@ -0,0 +1,31 @@
+"""Add registrations.updated_at
+
+Revision ID: b8e5d2f7c341
+Revises: 7f4c2a9e1b56
+Create Date: 2026-10-18 15:21:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e5d2f7c341'
+down_revision: Union[str, Sequence[str], None] = '7f4c2a9e1b56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('registrations', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE registrations SET updated_at = COALESCE(checked_in_at, registered_at)")
+    op.create_index('ix_registrations_updated_at', 'registrations', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_registrations_updated_at', table_name='registrations')
+    op.drop_column('registrations', 'updated_at')
@@ -0,0 +1,60 @@
+"""Add global_stats and event_stats counter tables
+
+Revision ID: c57a0e8b3f21
+Revises: 9d3f61a2c8e4
+Create Date: 2026-10-18 11:47:09.125384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c57a0e8b3f21'
+down_revision: Union[str, Sequence[str], None] = '9d3f61a2c8e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('global_stats',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('total_events', sa.Integer(), nullable=False),
+    sa.Column('total_registrations', sa.Integer(), nullable=False),
+    sa.Column('total_users', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('event_stats',
+    sa.Column('event_id', sa.String(), nullable=False),
+    sa.Column('registration_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('event_id')
+    )
+
+    # Seed the counters from the existing rows
+    op.execute(
+        """
+        INSERT INTO global_stats (id, total_events, total_registrations, total_users)
+        SELECT 1,
+            (SELECT count(*) FROM events),
+            (SELECT count(*) FROM registrations),
+            (SELECT count(*) FROM users)
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO event_stats (event_id, registration_count)
+        SELECT events.id,
+            (SELECT count(*) FROM registrations WHERE registrations.event_id = events.id)
+        FROM events
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('event_stats')
+    op.drop_table('global_stats')
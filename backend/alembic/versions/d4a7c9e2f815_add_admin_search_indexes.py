@@ -0,0 +1,50 @@
+"""Add admin search indexes
+
+Revision ID: d4a7c9e2f815
+Revises: b8e5d2f7c341
+Create Date: 2026-10-18 16:44:09.275310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.search import SEARCH_COLUMNS, sqlite_search_ddl, sqlite_search_drop_ddl
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7c9e2f815'
+down_revision: Union[str, Sequence[str], None] = 'b8e5d2f7c341'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for table, columns in SEARCH_COLUMNS.items():
+            for column in columns:
+                op.create_index(
+                    f'ix_{table}_{column}_trgm', table, [column], unique=False,
+                    postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'}
+                )
+    elif dialect == 'sqlite':
+        for table, columns in SEARCH_COLUMNS.items():
+            for statement in sqlite_search_ddl(table, columns):
+                op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for table, columns in SEARCH_COLUMNS.items():
+            for column in columns:
+                op.drop_index(f'ix_{table}_{column}_trgm', table_name=table)
+    elif dialect == 'sqlite':
+        for table in SEARCH_COLUMNS:
+            for statement in sqlite_search_drop_ddl(table):
+                op.execute(statement)
@@ -0,0 +1,33 @@
+"""Add event capacity, seat counter and registration status
+
+Revision ID: e21b6d0f4a93
+Revises: c57a0e8b3f21
+Create Date: 2026-10-18 12:31:40.518276
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e21b6d0f4a93'
+down_revision: Union[str, Sequence[str], None] = 'c57a0e8b3f21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing events keep unlimited capacity, so nothing needs seeding
+    op.add_column('events', sa.Column('capacity', sa.Integer(), nullable=True))
+    op.add_column('event_stats', sa.Column('seats_remaining', sa.Integer(), nullable=True))
+    op.add_column('registrations', sa.Column('status', sa.String(), server_default='confirmed', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('registrations', 'status')
+    op.drop_column('event_stats', 'seats_remaining')
+    op.drop_column('events', 'capacity')
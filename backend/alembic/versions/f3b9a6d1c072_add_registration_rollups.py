@@ -0,0 +1,52 @@
+"""Add registration_rollups
+
+Revision ID: f3b9a6d1c072
+Revises: d4a7c9e2f815
+Create Date: 2026-10-18 17:58:23.604118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b9a6d1c072'
+down_revision: Union[str, Sequence[str], None] = 'd4a7c9e2f815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# bucket_seconds -> how to truncate registered_at to the bucket start
+BUCKETS = {
+    'postgresql': {60: "date_trunc('minute', registered_at)", 3600: "date_trunc('hour', registered_at)"},
+    # Same text format SQLAlchemy stores SQLite datetimes in
+    'sqlite': {
+        60: "strftime('%Y-%m-%d %H:%M:00.000000', registered_at)",
+        3600: "strftime('%Y-%m-%d %H:00:00.000000', registered_at)",
+    },
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('registration_rollups',
+    sa.Column('event_id', sa.String(), nullable=False),
+    sa.Column('bucket_seconds', sa.Integer(), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(), nullable=False),
+    sa.Column('registrations', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('event_id', 'bucket_seconds', 'bucket_start')
+    )
+    # Backfill from existing registrations
+    for seconds, bucket in BUCKETS.get(op.get_bind().dialect.name, {}).items():
+        op.execute(
+            f"INSERT INTO registration_rollups (event_id, bucket_seconds, bucket_start, registrations) "
+            f"SELECT event_id, {seconds}, {bucket}, count(*) FROM registrations "
+            f"WHERE registered_at IS NOT NULL GROUP BY event_id, {bucket}"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('registration_rollups')
@@ -0,0 +1,117 @@
+# backend/analytics.py
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.models import EventStats, Registration, RegistrationRollup
+
+# Bucket widths kept in registration_rollups, in seconds
+RESOLUTIONS = {"minute": 60, "hour": 3600}
+
+
+def utc_naive(ts: datetime) -> datetime:
+    """Convert an offset-aware timestamp to the naive UTC the rollups are stored in."""
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return ts
+
+
+def bucket_start(ts: datetime, seconds: int) -> datetime:
+    """Floor a naive UTC timestamp to its bucket; `seconds` must divide a day."""
+    midnight = ts.replace(hour=0, minute=0, second=0, microsecond=0)
+    offset = int((ts - midnight).total_seconds())
+    return midnight + timedelta(seconds=offset - offset % seconds)
+
+
+async def record(db: AsyncSession, registrations, delta: int = 1):
+    """Count registrations into their rollup buckets inside the caller's transaction.
+
+    `registrations` is an iterable of (event_id, registered_at). Buckets are
+    upserted in key order so concurrent batches lock rows in the same order.
+    A hot event's bucket row is locked until commit, much like its
+    event_stats row already is.
+    """
+    counts = Counter()
+    for event_id, registered_at in registrations:
+        if registered_at is None:
+            continue
+        for seconds in RESOLUTIONS.values():
+            counts[(event_id, seconds, bucket_start(registered_at, seconds))] += delta
+    rows = [
+        {"event_id": event_id, "bucket_seconds": seconds, "bucket_start": start, "registrations": n}
+        for (event_id, seconds, start), n in sorted(counts.items()) if n
+    ]
+    if not rows:
+        return
+
+    # Imported here because crud records through this module
+    from backend.crud import dialect_insert
+
+    stmt = dialect_insert(db, RegistrationRollup)
+    if stmt is not None:
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    RegistrationRollup.event_id, RegistrationRollup.bucket_seconds, RegistrationRollup.bucket_start
+                ],
+                set_={"registrations": RegistrationRollup.registrations + stmt.excluded.registrations},
+            ),
+            rows,
+        )
+        return
+
+    for row in rows:
+        result = await db.execute(
+            update(RegistrationRollup)
+            .where(
+                RegistrationRollup.event_id == row["event_id"],
+                RegistrationRollup.bucket_seconds == row["bucket_seconds"],
+                RegistrationRollup.bucket_start == row["bucket_start"],
+            )
+            .values(registrations=RegistrationRollup.registrations + row["registrations"])
+        )
+        if result.rowcount == 0:
+            await db.execute(insert(RegistrationRollup).values(**row))
+
+
+async def rebuild(db: AsyncSession, event_id: str) -> int:
+    """Recompute an event's buckets from its registrations; returns how many were counted.
+
+    One pass over the (event_id, registered_at) index, for repairs after
+    writes that bypassed record(), such as raw SQL loads.
+    """
+    # Every registration write locks the event's stats row first, so
+    # holding it keeps new registrations out until the rebuild commits
+    await db.execute(
+        update(EventStats).where(EventStats.event_id == event_id)
+        .values(registration_count=EventStats.registration_count)
+    )
+    await db.execute(delete(RegistrationRollup).where(RegistrationRollup.event_id == event_id))
+    registered = (await db.scalars(
+        select(Registration.registered_at).where(
+            Registration.event_id == event_id, Registration.registered_at.is_not(None)
+        )
+    )).all()
+    await record(db, [(event_id, registered_at) for registered_at in registered])
+    await db.commit()
+    return len(registered)
+
+
+async def series(db: AsyncSession, event_id: str, resolution: str, start: datetime, end: datetime):
+    """Return (registrations before `start`, [(bucket_start, registrations), ...] in [start, end)).
+
+    Both are range scans of the rollup primary key, so the cost depends on
+    the number of buckets asked for, never on the number of registrations.
+    """
+    seconds = RESOLUTIONS[resolution]
+    key = (RegistrationRollup.event_id == event_id, RegistrationRollup.bucket_seconds == seconds)
+    before = await db.scalar(
+        select(func.coalesce(func.sum(RegistrationRollup.registrations), 0))
+        .where(*key, RegistrationRollup.bucket_start < start)
+    )
+    buckets = (await db.execute(
+        select(RegistrationRollup.bucket_start, RegistrationRollup.registrations)
+        .where(*key, RegistrationRollup.bucket_start >= start, RegistrationRollup.bucket_start < end)
+        .order_by(RegistrationRollup.bucket_start)
+    )).all()
+    return before, buckets
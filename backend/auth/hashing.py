@@ -1,9 +1,100 @@
-from passlib.context import CryptContext
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from backend.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+_pwd_context = None
+
+def get_pwd_context():
+    """Build the CryptContext on first use; passlib isn't needed until someone logs in."""
+    global _pwd_context
+    if _pwd_context is None:
+        from passlib.context import CryptContext
+        # Pinning min/max to the target cost makes needs_update() flag hashes made
+        # at any other cost, so changing BCRYPT_ROUNDS rehashes admins as they log in
+        _pwd_context = CryptContext(
+            schemes=["bcrypt"],
+            deprecated="auto",
+            bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+            bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+            bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+        )
+    return _pwd_context
 
 def hash_password(password: str):
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 def verify_password(plain_pw: str, hashed_pw: str):
-    return pwd_context.verify(plain_pw, hashed_pw)
+    return get_pwd_context().verify(plain_pw, hashed_pw)
+
+def verify_and_update(plain_pw: str, hashed_pw: str):
+    return get_pwd_context().verify_and_update(plain_pw, hashed_pw)
+
+
+class HashingBusy(Exception):
+    """Raised when the hashing queue is full and the request should be shed."""
+
+
+class HashingPool:
+    """Dedicated, bounded executor for bcrypt.
+
+    bcrypt releases the GIL, so a few threads keep the cores busy without
+    borrowing from the shared threadpool the rest of the app runs on. At
+    most `max_pending` calls may be running or queued; beyond that callers
+    get `HashingBusy` straight away instead of waiting behind the backlog.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rejected = 0
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="bcrypt"
+            )
+        return self._executor
+
+    async def run(self, fn, *args):
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise HashingBusy()
+            self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self.pending,
+                "rejected": self.rejected,
+            }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+hashing_pool = HashingPool(
+    max_workers=settings.BCRYPT_WORKERS,
+    max_pending=settings.BCRYPT_MAX_PENDING,
+)
+
+
+async def hash_password_async(password: str):
+    return await hashing_pool.run(hash_password, password)
+
+async def verify_and_update_async(plain_pw: str, hashed_pw: str):
+    """Return (valid, new_hash); new_hash is set when the stored hash needs an upgrade."""
+    return await hashing_pool.run(verify_and_update, plain_pw, hashed_pw)
@@ -1,19 +1,145 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from jose import jwt, JWTError
+from backend.config import settings
 
 SECRET_KEY = "your-secret"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
+
+class TokenCache:
+    """Bounded LRU of verified tokens, each kept until the token's own `exp`.
+
+    Tokens are keyed by a SHA-256 digest so raw bearer tokens never sit in
+    memory. Revoked digests are remembered until they would have expired
+    anyway, and `revoke_subject` rejects every token issued to a subject
+    before the call.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._revoked = {}
+        self._not_before = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, digest: str):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                self.misses += 1
+                return None
+            subject, exp = entry
+            if exp <= now:
+                del self._entries[digest]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return subject
+
+    def put(self, digest: str, subject: str, exp: float, iat: float):
+        with self._lock:
+            # Re-checked under the lock so a concurrent revoke can't be undone
+            if self._is_revoked(digest, subject, iat):
+                return
+            self._entries[digest] = (subject, exp)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def is_revoked(self, digest: str, subject: str, iat: float) -> bool:
+        with self._lock:
+            return self._is_revoked(digest, subject, iat)
+
+    def _is_revoked(self, digest: str, subject: str, iat: float) -> bool:
+        if digest in self._revoked:
+            return True
+        not_before = self._not_before.get(subject)
+        return not_before is not None and iat < not_before
+
+    def revoke(self, digest: str, exp: float):
+        with self._lock:
+            self._entries.pop(digest, None)
+            self._revoked[digest] = exp
+            self._prune_revoked()
+
+    def revoke_subject(self, subject: str):
+        now = time.time()
+        with self._lock:
+            self._not_before[subject] = now
+            for digest in [d for d, entry in self._entries.items() if entry[0] == subject]:
+                del self._entries[digest]
+
+    def _prune_revoked(self):
+        now = time.time()
+        for digest in [d for d, exp in self._revoked.items() if exp <= now]:
+            del self._revoked[digest]
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "revoked": len(self._revoked),
+            }
+
+
+token_cache = TokenCache(max_size=settings.TOKEN_CACHE_SIZE)
+
+
 def create_access_token(data: dict):
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
+    now = datetime.utcnow()
+    expire = now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    # Sub-second iat so revoke_subject() never spares a token issued in the same second
+    to_encode.update({"exp": expire, "iat": time.time()})
+    # python-jose pulls in cryptography, so it's imported on first use
+    from jose import jwt
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
-def verify_token(token: str):
+
+def _decode(token: str):
+    from jose import jwt, JWTError
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload.get("sub")
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
         return None
+
+
+def verify_token(token: str):
+    digest = TokenCache.digest(token)
+    # Revoking evicts from the cache, so a hit is always still valid
+    subject = token_cache.get(digest)
+    if subject is not None:
+        return subject
+
+    payload = _decode(token)
+    if payload is None:
+        return None
+    subject = payload.get("sub")
+    iat = payload.get("iat", 0)
+    if subject is None or token_cache.is_revoked(digest, subject, iat):
+        return None
+    token_cache.put(digest, subject, payload["exp"], iat)
+    return subject
+
+
+def revoke_token(token: str):
+    payload = _decode(token)
+    if payload is not None:
+        token_cache.revoke(TokenCache.digest(token), payload["exp"])
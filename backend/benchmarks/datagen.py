@@ -0,0 +1,324 @@
+# backend/benchmarks/datagen.py
+"""Bulk-load deterministic synthetic users, events and registrations.
+
+    python -m backend.benchmarks.datagen --users 500000 --events 2000 \\
+        --registrations 5000000 --seed 1 --database-url postgresql://...
+
+Rows are generated in chunks and written with COPY on PostgreSQL and
+executemany inserts elsewhere, so memory stays flat at any scale. Event
+sizes follow a Zipf curve (a few hot events, a long tail of small ones) and
+a small share of heavy users account for many registrations. The same seed
+always produces the same rows and ids. Rollups are written chunk by chunk
+and the counter tables at the end, so the app starts with consistent
+dashboard stats and charts. --reset drops every table, so it only runs
+against an explicit --database-url.
+"""
+import argparse
+import csv
+import hashlib
+import io
+import math
+import random
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+from sqlalchemy import func, insert, select
+from backend.database import create_db_engine
+from backend.models import (
+    Base, Event, EventStats, GlobalStats, Registration, RegistrationRollup, User,
+    REGISTRATION_CONFIRMED, REGISTRATION_WAITLISTED,
+)
+from backend.analytics import RESOLUTIONS, bucket_start
+from backend.qr import qr_url
+from backend.stats import GLOBAL_STATS_ID
+
+FIRST_NAMES = [
+    "Aarav", "Aditi", "Ananya", "Arjun", "Diya", "Ishaan", "Kabir", "Meera", "Neha", "Nikhil",
+    "Priya", "Rahul", "Riya", "Rohan", "Saanvi", "Sara", "Tanvi", "Vihaan", "Vivaan", "Zara",
+]
+LAST_NAMES = [
+    "Agarwal", "Bose", "Chopra", "Das", "Gupta", "Iyer", "Joshi", "Kapoor", "Khan", "Kumar",
+    "Mehta", "Nair", "Pandey", "Patel", "Rao", "Reddy", "Shah", "Sharma", "Singh", "Verma",
+]
+EVENT_KINDS = ["Hackathon", "Workshop", "Meetup", "Talk", "CTF", "Bootcamp", "Summit", "Game Jam"]
+
+# Event sizes fall off as 1/rank**ZIPF_EXPONENT
+ZIPF_EXPONENT = 1.1
+# Higher values concentrate registrations on fewer, heavier users
+USER_SKEW = 2.5
+# Share of events with a capacity; the rest are unlimited
+CAPACITY_SHARE = 0.3
+# Share of confirmed registrations to past events that were checked in
+CHECK_IN_SHARE = 0.7
+
+EPOCH = datetime(2026, 1, 1)
+
+
+def _stable_id(seed: int, kind: str, n: int) -> str:
+    """A UUID4-shaped id derived from (seed, kind, n), so ids never need storing."""
+    return str(uuid.UUID(bytes=hashlib.md5(f"{seed}:{kind}:{n}".encode()).digest(), version=4))
+
+
+def event_sizes(events: int, registrations: int, users: int) -> list:
+    """Registrations per event by popularity rank, summing to `registrations` where possible."""
+    weights = [1 / (rank + 1) ** ZIPF_EXPONENT for rank in range(events)]
+    total = sum(weights)
+    sizes = [min(users, int(registrations * w / total)) for w in weights]
+    leftover = min(registrations, users * events) - sum(sizes)
+    rank = 0
+    while leftover > 0:
+        if sizes[rank] < users:
+            sizes[rank] += 1
+            leftover -= 1
+        rank = (rank + 1) % events
+    return sizes
+
+
+def _pick_users(rng: random.Random, users: int, k: int) -> list:
+    """Choose k distinct user indexes, biased towards the heavy users at low indexes."""
+    chosen = set()
+    attempts = 0
+    while len(chosen) < k and attempts < 3 * k:
+        chosen.add(int(users * rng.random() ** USER_SKEW))
+        attempts += 1
+    if len(chosen) < k:
+        # Near-total events: top up uniformly rather than rejection-sample forever
+        for index in rng.sample(range(users), users):
+            if len(chosen) >= k:
+                break
+            chosen.add(index)
+    return list(chosen)
+
+
+def _chunks(rows, size: int):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class _Writer:
+    """Writes row dicts to a table with COPY on PostgreSQL, executemany elsewhere."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.use_copy = conn.dialect.name == "postgresql"
+
+    def write(self, model, rows: list):
+        if not rows:
+            return
+        if not self.use_copy:
+            self.conn.execute(insert(model), rows)
+            return
+        columns = list(rows[0])
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for row in rows:
+            writer.writerow([_copy_value(row[column]) for column in columns])
+        buf.seek(0)
+        cursor = self.conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {model.__tablename__} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buf
+            )
+        finally:
+            cursor.close()
+
+
+def _copy_value(value):
+    # An unquoted empty field is NULL in COPY's csv format
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
+
+
+def generate_users(seed: int, users: int):
+    rng = random.Random(f"{seed}:users")
+    for n in range(users):
+        yield {
+            "id": _stable_id(seed, "user", n),
+            "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "email": f"user{n}@example.test",
+            "role": "user",
+            "registered_at": EPOCH - timedelta(seconds=rng.randrange(365 * 86400)),
+        }
+
+
+def generate_events(seed: int, sizes: list):
+    """Yield (event row, capacity) by popularity rank."""
+    rng = random.Random(f"{seed}:events")
+    for rank, size in enumerate(sizes):
+        capacity = None
+        if rng.random() < CAPACITY_SHARE:
+            # Anywhere from undersubscribed to well oversubscribed
+            capacity = max(1, int(size * rng.uniform(0.6, 1.3)))
+        team_size = rng.choice([1, 1, 2, 3, 4])
+        yield {
+            "id": _stable_id(seed, "event", rank),
+            "title": f"{rng.choice(EVENT_KINDS)} #{rank + 1}",
+            "description": f"Synthetic event ranked {rank + 1} by popularity",
+            "date": EPOCH + timedelta(days=rng.randrange(-180, 180), hours=rng.randrange(9, 20)),
+            "max_team_size": team_size,
+            "capacity": capacity,
+            "solo": team_size == 1,
+            "created_by": "datagen",
+        }
+
+
+def generate_registrations(seed: int, event: dict, size: int, users: int, first_n: int):
+    """Yield one event's registrations in sign-up order, waitlisting past capacity."""
+    rng = random.Random(f"{seed}:registrations:{event['id']}")
+    opened = event["date"] - timedelta(days=rng.randrange(7, 60))
+    # Sign-ups spread over the window before the event, front-loaded
+    window = max(1.0, (event["date"] - opened).total_seconds())
+    offsets = sorted(window * (1 - math.sqrt(rng.random())) for _ in range(size))
+    past = event["date"] < EPOCH
+    capacity = event["capacity"]
+    for i, (user_index, offset) in enumerate(zip(_pick_users(rng, users, size), offsets)):
+        confirmed = capacity is None or i < capacity
+        reg_id = _stable_id(seed, "registration", first_n + i)
+        checked_in = past and confirmed and rng.random() < CHECK_IN_SHARE
+        registered_at = opened + timedelta(seconds=offset)
+        checked_in_at = event["date"] + timedelta(minutes=rng.randrange(-30, 90)) if checked_in else None
+        yield {
+            "id": reg_id,
+            "event_id": event["id"],
+            "user_id": _stable_id(seed, "user", user_index),
+            "team_name": f"Team {rng.randrange(1, size // 3 + 2)}" if event["max_team_size"] > 1 else None,
+            "phone": f"9{rng.randrange(10 ** 9):09d}",
+            "qr_code": qr_url(reg_id),
+            "status": REGISTRATION_CONFIRMED if confirmed else REGISTRATION_WAITLISTED,
+            "registered_at": registered_at,
+            "checked_in_at": checked_in_at,
+            "updated_at": checked_in_at or registered_at,
+        }
+
+
+def _rollup_rows(rollups: Counter, keep=()) -> list:
+    """Pop every counted bucket except those in `keep` as RegistrationRollup rows."""
+    rows = [
+        {"event_id": event_id, "bucket_seconds": seconds, "bucket_start": start, "registrations": n}
+        for (event_id, seconds, start), n in rollups.items() if (event_id, seconds, start) not in keep
+    ]
+    for row in rows:
+        del rollups[(row["event_id"], row["bucket_seconds"], row["bucket_start"])]
+    return rows
+
+
+def generate(engine, users: int, events: int, registrations: int, seed: int = 0,
+             chunk_size: int = 20000, reset: bool = False, progress=None) -> dict:
+    """Load the dataset into `engine`'s database and return what was written."""
+    if reset:
+        Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with engine.connect() as conn:
+        if conn.scalar(select(func.count()).select_from(User)):
+            raise RuntimeError("Target database already has users; use reset (--reset) to replace them")
+
+    report = progress or (lambda message: None)
+    sizes = event_sizes(events, registrations, users)
+    written = {"users": 0, "events": 0, "registrations": 0}
+    event_stats = []
+    started = time.perf_counter()
+
+    with engine.begin() as conn:
+        if conn.dialect.name == "sqlite":
+            # A crash mid-load just means re-running with --reset
+            conn.exec_driver_sql("PRAGMA synchronous = OFF")
+        writer = _Writer(conn)
+
+        for chunk in _chunks(generate_users(seed, users), chunk_size):
+            writer.write(User, chunk)
+            written["users"] += len(chunk)
+            report(f"users: {written['users']}/{users}")
+
+        event_rows = list(generate_events(seed, sizes))
+        writer.write(Event, event_rows)
+        written["events"] = len(event_rows)
+        report(f"events: {written['events']}")
+
+        def registration_rows():
+            for event, size in zip(event_rows, sizes):
+                confirmed = size if event["capacity"] is None else min(size, event["capacity"])
+                event_stats.append({
+                    "event_id": event["id"],
+                    "registration_count": size,
+                    "seats_remaining": None if event["capacity"] is None else event["capacity"] - confirmed,
+                })
+                yield from generate_registrations(seed, event, size, users, written["registrations"])
+                written["registrations"] += size
+
+        loaded = 0
+        rollups = Counter()
+        for chunk in _chunks(registration_rows(), chunk_size):
+            writer.write(Registration, chunk)
+            for row in chunk:
+                for seconds in RESOLUTIONS.values():
+                    rollups[(row["event_id"], seconds, bucket_start(row["registered_at"], seconds))] += 1
+            # Rows arrive event by event in sign-up order, so only the last
+            # row's buckets can still grow in the next chunk
+            last = chunk[-1]
+            writer.write(RegistrationRollup, _rollup_rows(rollups, keep={
+                (last["event_id"], seconds, bucket_start(last["registered_at"], seconds))
+                for seconds in RESOLUTIONS.values()
+            }))
+            loaded += len(chunk)
+            report(f"registrations: {loaded}/{sum(sizes)}")
+
+        writer.write(EventStats, event_stats)
+        writer.write(RegistrationRollup, _rollup_rows(rollups))
+        writer.write(GlobalStats, [{
+            "id": GLOBAL_STATS_ID,
+            "total_events": written["events"],
+            "total_users": written["users"],
+            "total_registrations": written["registrations"],
+        }])
+
+    written["seconds"] = round(time.perf_counter() - started, 1)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="Defaults to DATABASE_URL from the settings")
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--registrations", type=int, default=1000000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=20000)
+    parser.add_argument("--reset", action="store_true", help="Drop and recreate every table first")
+    args = parser.parse_args(argv)
+    if args.reset and not args.database_url:
+        parser.error("--reset drops every table, so it needs an explicit --database-url")
+
+    engine = create_db_engine(args.database_url)
+    try:
+        written = generate(
+            engine, args.users, args.events, args.registrations, seed=args.seed,
+            chunk_size=args.chunk_size, reset=args.reset,
+            progress=lambda message: print(message, file=sys.stderr),
+        )
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        engine.dispose()
+    print(
+        f"Loaded {written['users']} users, {written['events']} events and "
+        f"{written['registrations']} registrations in {written['seconds']}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+# backend/benchmarks/run.py
+"""Load-test the API in-process and record a comparable baseline.
+
+    python -m backend.benchmarks.run --output baseline.json
+    python -m backend.benchmarks.run --compare baseline.json
+
+The app from backend/main.py is driven through httpx's ASGI transport, so
+numbers cover routing, validation, serialization and the database, not the
+network or the ASGI server. By default each run seeds a fresh SQLite file;
+pass --database-url to point at a local Postgres instead (it must be empty
+unless --skip-seed is given). Exits non-zero when --compare finds a
+regression.
+"""
+import argparse
+import asyncio
+import contextvars
+import itertools
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime
+
+# Queries issued by the request currently being timed
+_query_count = contextvars.ContextVar("bench_query_count", default=None)
+
+SCENARIOS = ("register_burst", "events_list", "admin_dashboard", "registration_list", "mixed")
+MIXED_WEIGHTS = {"events_list": 60, "register_burst": 20, "registration_list": 15, "admin_dashboard": 5}
+
+
+def _count_query(*args):
+    box = _query_count.get()
+    if box is not None:
+        box[0] += 1
+
+
+class BenchContext:
+    def __init__(self, event_ids, token: str, run_id: str):
+        self.event_ids = event_ids
+        # The most registered-for events
+        self.hot_event_ids = event_ids[:max(1, len(event_ids) // 20)]
+        self.auth = {"Authorization": f"Bearer {token}"}
+        self.run_id = run_id
+
+
+async def register_burst(client, ctx: BenchContext, i: int):
+    return await client.post("/api/register", json={
+        "event_id": ctx.hot_event_ids[i % len(ctx.hot_event_ids)],
+        "name": f"Burst {i}",
+        "email": f"burst-{ctx.run_id}-{i}@bench.example",
+    })
+
+
+async def events_list(client, ctx: BenchContext, i: int):
+    return await client.get("/api/events", params={"limit": 50})
+
+
+async def admin_dashboard(client, ctx: BenchContext, i: int):
+    return await client.get("/api/admin/dashboard", headers=ctx.auth)
+
+
+async def registration_list(client, ctx: BenchContext, i: int):
+    if i % 2:
+        return await client.get("/api/admin/registrations", params={"limit": 50}, headers=ctx.auth)
+    event_id = ctx.hot_event_ids[i % len(ctx.hot_event_ids)]
+    return await client.get(f"/api/admin/registrations/event/{event_id}", params={"limit": 50}, headers=ctx.auth)
+
+
+async def mixed(client, ctx: BenchContext, i: int):
+    names = list(MIXED_WEIGHTS)
+    name = random.Random(i).choices(names, [MIXED_WEIGHTS[n] for n in names])[0]
+    return await REQUESTS[name](client, ctx, i)
+
+
+REQUESTS = {
+    "register_burst": register_burst,
+    "events_list": events_list,
+    "admin_dashboard": admin_dashboard,
+    "registration_list": registration_list,
+    "mixed": mixed,
+}
+
+
+def percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[rank]
+
+
+async def run_scenario(client, ctx: BenchContext, name: str, requests: int, concurrency: int, offset: int) -> dict:
+    make_request = REQUESTS[name]
+    latencies = []
+    queries = []
+    statuses = Counter()
+    counter = itertools.count()
+
+    async def worker():
+        while True:
+            i = next(counter)
+            if i >= requests:
+                return
+            box = [0]
+            token = _query_count.set(box)
+            start = time.perf_counter()
+            try:
+                response = await make_request(client, ctx, offset + i)
+                statuses[response.status_code] += 1
+            except Exception as e:
+                statuses[e.__class__.__name__] += 1
+            latencies.append(time.perf_counter() - start)
+            _query_count.reset(token)
+            queries.append(box[0])
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    errors = sum(n for status, n in statuses.items() if not (isinstance(status, int) and status < 400))
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "status_codes": {str(status): n for status, n in sorted(statuses.items(), key=str)},
+        "throughput_rps": round(requests / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 2),
+            "p95": round(percentile(latencies, 95) * 1000, 2),
+            "p99": round(percentile(latencies, 99) * 1000, 2),
+            "mean": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0,
+            "max": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+        },
+        "queries_per_request": round(sum(queries) / len(queries), 2) if queries else 0.0,
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def _admin_token(client) -> str:
+    credentials = {"username": "bench-admin", "password": "bench-password"}
+    await client.post("/api/admin/signup", json=credentials)
+    response = await client.post("/api/admin/login", json=credentials)
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def run_benchmarks(args) -> dict:
+    import httpx
+    from sqlalchemy import event, select
+    from backend import database, stats
+    from backend.main import app
+    from backend.models import Base, EventStats
+    from backend.benchmarks.datagen import generate
+
+    Base.metadata.create_all(bind=database.engine)
+    scale = None
+    if not args.skip_seed:
+        print(f"Seeding {args.users} users, {args.events} events, {args.registrations} registrations...")
+        scale = generate(database.engine, args.users, args.events, args.registrations, seed=args.seed)
+    async with database.open_session() as db:
+        await stats.reconcile(db)
+        # Most popular first, so the scenarios can aim at the hot events
+        event_ids = list(await db.scalars(
+            select(EventStats.event_id).order_by(EventStats.registration_count.desc(), EventStats.event_id)
+        ))
+
+    for engine in (database.engine, database.async_engine.sync_engine):
+        event.listen(engine, "before_cursor_execute", _count_query)
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            ctx = BenchContext(event_ids, await _admin_token(client), run_id=f"{args.seed}-{int(time.time())}")
+            offset = 0
+            for name in args.scenarios:
+                # Warm caches and pools so the first scenario isn't penalised
+                await run_scenario(client, ctx, name, args.warmup, args.concurrency, offset)
+                offset += args.warmup
+                print(f"Running {name} ({args.requests} requests, concurrency {args.concurrency})...")
+                results[name] = await run_scenario(client, ctx, name, args.requests, args.concurrency, offset)
+                offset += args.requests
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "python": platform.python_version(),
+            "database": database.engine.dialect.name,
+            "db_async": database.settings.DB_ASYNC,
+            "seed": args.seed,
+            "scale": scale,
+        },
+        "scenarios": results,
+    }
+
+
+def print_report(report: dict):
+    print(f"\n{'scenario':<20}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'q/req':>7}{'errors':>8}")
+    for name, result in report["scenarios"].items():
+        latency = result["latency_ms"]
+        print(
+            f"{name:<20}{result['throughput_rps']:>9}{latency['p50']:>9}{latency['p95']:>9}"
+            f"{latency['p99']:>9}{result['queries_per_request']:>7}{result['errors']:>8}"
+        )
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list:
+    """Return human-readable regressions of `report` against `baseline`."""
+    regressions = []
+    print(f"\nCompared with {baseline['meta'].get('commit') or 'baseline'}:")
+    for name, result in report["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            continue
+        p95, base_p95 = result["latency_ms"]["p95"], before["latency_ms"]["p95"]
+        rps, base_rps = result["throughput_rps"], before["throughput_rps"]
+        queries, base_queries = result["queries_per_request"], before["queries_per_request"]
+        print(
+            f"  {name:<20} p95 {base_p95} -> {p95} ms, {base_rps} -> {rps} rps, "
+            f"{base_queries} -> {queries} queries/request"
+        )
+        if base_p95 and p95 > base_p95 * (1 + tolerance):
+            regressions.append(f"{name}: p95 {base_p95} -> {p95} ms")
+        if base_rps and rps < base_rps * (1 - tolerance):
+            regressions.append(f"{name}: throughput {base_rps} -> {rps} rps")
+        if queries > base_queries:
+            regressions.append(f"{name}: queries/request {base_queries} -> {queries}")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", dest="scenarios", action="append", choices=SCENARIOS,
+                        help="Scenario to run; repeat for several (default: all)")
+    parser.add_argument("--requests", type=int, default=500, help="Timed requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=50, help="Untimed requests before each scenario")
+    parser.add_argument("--database-url", help="Defaults to a fresh SQLite file in a temp directory")
+    parser.add_argument("--skip-seed", action="store_true", help="Benchmark the data already in the database")
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--events", type=int, default=100)
+    parser.add_argument("--registrations", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the report as JSON to this path")
+    parser.add_argument("--compare", help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed fractional slowdown before a metric counts as a regression")
+    args = parser.parse_args(argv)
+    args.scenarios = args.scenarios or list(SCENARIOS)
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    workdir = tempfile.mkdtemp(prefix="zettabyte-bench-")
+    # Settings are read at import time, so configure before importing the app
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ.setdefault("QR_CODE_DIR", os.path.join(workdir, "qr_codes"))
+
+    report = asyncio.run(run_benchmarks(args))
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved report to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
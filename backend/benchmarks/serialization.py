@@ -0,0 +1,122 @@
+# backend/benchmarks/serialization.py
+"""Per-row cost of building and serializing a large registration listing.
+
+    python -m backend.benchmarks.serialization --rows 10000
+
+Rows come from a real SELECT against an in-memory SQLite database, so
+the numbers cover model construction and JSON rendering but no I/O. Three
+paths are compared:
+
+  standard  models built by hand, then validated and serialized again by
+            FastAPI's response_model handling and rendered by JSONResponse
+  orjson    the same, but rendered by FastJSONResponse (FAST_JSON's
+            default response class)
+  trusted   models built once with model_validate from the row mapping and
+            rendered directly by FastJSONResponse, as trusted() does
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy import create_engine, insert
+from sqlalchemy.pool import StaticPool
+
+from backend.crud import registration_out, select_registrations
+from backend.models import Base, Event, Registration, User
+from backend.responses import FastJSONResponse
+from backend.schemas import RegistrationOut, UserOut
+
+
+def load_rows(n: int):
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    now = datetime(2026, 1, 1)
+    event_id = str(uuid.UUID(int=0))
+    users = [
+        {"id": str(uuid.UUID(int=i + 1)), "name": f"User {i}", "email": f"user{i}@bench.example",
+         "registered_at": now}
+        for i in range(n)
+    ]
+    registrations = [
+        {"id": str(uuid.UUID(int=n + i + 1)), "user_id": user["id"], "event_id": event_id,
+         "team_name": f"Team {i % 50}" if i % 3 else None, "qr_code": f"/qr_codes/{i}.png",
+         "registered_at": now + timedelta(seconds=i)}
+        for i, user in enumerate(users)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(Event), [{"id": event_id, "title": "Bench", "date": now,
+                                      "max_team_size": 1, "solo": True, "created_by": "bench"}])
+        conn.execute(insert(User), users)
+        conn.execute(insert(Registration), registrations)
+    with engine.connect() as conn:
+        rows = conn.execute(select_registrations()).all()
+    engine.dispose()
+    return rows
+
+
+def _hand_built(row) -> RegistrationOut:
+    # How listings built their models before registration_out used model_validate
+    return RegistrationOut(
+        id=row.id,
+        user=UserOut(id=row.user_id, name=row.user_name, email=row.user_email),
+        team_name=row.team_name,
+        event_id=row.event_id,
+        qr_code=row.qr_code,
+        status=row.status
+    )
+
+
+def _validated(rows, response_class) -> bytes:
+    field = create_response_field("Response_bench", list[RegistrationOut], mode="serialization")
+    content = asyncio.run(serialize_response(field=field, response_content=[_hand_built(r) for r in rows]))
+    return response_class(content).body
+
+
+PATHS = {
+    "standard": lambda rows: _validated(rows, JSONResponse),
+    "orjson": lambda rows: _validated(rows, FastJSONResponse),
+    "trusted": lambda rows: FastJSONResponse([registration_out(r) for r in rows]).body,
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=7, help="Timed runs per path; the median is reported")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    rows = load_rows(args.rows)
+
+    bodies = {}
+    print(f"{'path':<10}{'total ms':>10}{'us/row':>9}{'bytes':>10}")
+    for name, path in PATHS.items():
+        bodies[name] = path(rows)  # warm-up
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            path(rows)
+            timings.append(time.perf_counter() - start)
+        total = statistics.median(timings)
+        print(f"{name:<10}{total * 1000:>10.1f}{total / len(rows) * 1e6:>9.2f}{len(bodies[name]):>10}")
+
+    # Whitespace aside, every path must produce the same document
+    documents = {name: json.loads(body) for name, body in bodies.items()}
+    if any(doc != documents["standard"] for doc in documents.values()):
+        print("\nOutputs differ between paths")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+# backend/benchmarks/startup.py
+"""Measure worker cold start: import time and time until /ready answers.
+
+    python -m backend.benchmarks.startup --output startup.json
+    python -m backend.benchmarks.startup --compare startup.json
+
+Every run is a fresh interpreter, so nothing is shared with a warm
+import cache. "import" is how long `import backend.main` takes; "ready" is
+from spawning uvicorn until GET /ready first returns 200, which includes
+the lifespan startup. Exits non-zero when --compare finds a regression.
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+
+from backend.benchmarks.run import _git_commit
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+IMPORT_SNIPPET = (
+    "import time; t = time.perf_counter(); import backend.main; "
+    "print(time.perf_counter() - t)"
+)
+
+
+def _env(database_url: str) -> dict:
+    env = dict(os.environ)
+    env["DATABASE_URL"] = database_url
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [REPO_ROOT, env.get("PYTHONPATH")]))
+    return env
+
+
+def _summary(samples) -> dict:
+    ms = [s * 1000 for s in samples]
+    return {
+        "runs": len(ms),
+        "median_ms": round(statistics.median(ms), 1),
+        "min_ms": round(min(ms), 1),
+        "max_ms": round(max(ms), 1),
+    }
+
+
+def measure_import(env: dict) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        env=env, cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    return float(out.strip().splitlines()[-1])
+
+
+def slowest_imports(env: dict, top: int) -> list:
+    """Direct imports of backend.main with the largest cumulative `-X importtime`."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import backend.main"],
+        env=env, cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)", line)
+        # One level below backend.main, so parents don't double count their children
+        if match and len(match.group(3)) == 3:
+            rows.append({"module": match.group(4), "cumulative_ms": round(int(match.group(2)) / 1000, 1)})
+    rows.sort(key=lambda row: row["cumulative_ms"], reverse=True)
+    return rows[:top]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def measure_ready(env: dict, timeout: float) -> float:
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/ready"
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env, cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with status {proc.returncode}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError):
+                pass
+            time.sleep(0.01)
+        raise RuntimeError(f"/ready did not answer within {timeout}s")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    print(f"\nCompared with {baseline['meta'].get('commit') or 'baseline'}:")
+    for name in ("import", "ready"):
+        before, after = baseline.get(name), report.get(name)
+        if not before or not after:
+            continue
+        print(f"  {name:<8} {before['median_ms']} -> {after['median_ms']} ms")
+        if after["median_ms"] > before["median_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: {before['median_ms']} -> {after['median_ms']} ms")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--database-url",
+                        help="Defaults to a SQLite file in a temp directory; /ready needs it to be reachable")
+    parser.add_argument("--skip-ready", action="store_true", help="Only measure import time")
+    parser.add_argument("--ready-timeout", type=float, default=30)
+    parser.add_argument("--top-imports", type=int, default=10,
+                        help="How many of the slowest imports to list (0 to skip)")
+    parser.add_argument("--output", help="Write the report as JSON to this path")
+    parser.add_argument("--compare", help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed fractional slowdown before a metric counts as a regression")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    workdir = tempfile.mkdtemp(prefix="zettabyte-startup-")
+    env = _env(args.database_url or f"sqlite:///{os.path.join(workdir, 'startup.db')}")
+
+    # One untimed import so .pyc files exist before anything is measured
+    measure_import(env)
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "python": platform.python_version(),
+        },
+        "import": _summary([measure_import(env) for _ in range(args.runs)]),
+    }
+    print(f"import   median {report['import']['median_ms']} ms over {args.runs} runs")
+    if not args.skip_ready:
+        report["ready"] = _summary([measure_ready(env, args.ready_timeout) for _ in range(args.runs)])
+        print(f"ready    median {report['ready']['median_ms']} ms over {args.runs} runs")
+    if args.top_imports:
+        report["slowest_imports"] = slowest_imports(env, args.top_imports)
+        print("\nslowest imports:")
+        for row in report["slowest_imports"]:
+            print(f"  {row['cumulative_ms']:>8} ms  {row['module']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved report to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+# backend/cache.py
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from backend.config import settings
+
+
+def etag_matches(request, etag: str) -> bool:
+    """Weak If-None-Match comparison, as RFC 9110 asks for on GET."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    bare = etag[2:] if etag.startswith("W/") else etag
+    for tag in header.split(","):
+        tag = tag.strip()
+        if (tag[2:] if tag.startswith("W/") else tag) == bare:
+            return True
+    return False
+
+
+def weak_etag(*parts) -> str:
+    digest = hashlib.sha256(":".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+class LocalVersionBackend:
+    """Keeps cache versions in this process only.
+
+    Versions are prefixed with a per-process id so an ETag handed out before
+    a restart never matches data served after it. A write only bumps the
+    version in the worker that handled it, so with several workers versions
+    also roll over every `max_age` seconds: other workers serve a stale
+    listing for at most that long, at the cost of a full response after
+    every rollover. A `max_age` of 0 never rolls over, which is right for a
+    single worker. Use the Redis backend when running more than one worker.
+    """
+
+    def __init__(self, max_age: float):
+        self.max_age = max_age
+        self._boot_id = uuid.uuid4().hex[:8]
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    async def get(self, namespace: str) -> str:
+        with self._lock:
+            version = f"{self._boot_id}.{self._versions.get(namespace, 0)}"
+        if self.max_age > 0:
+            version += f".{int(time.time() // self.max_age)}"
+        return version
+
+    async def bump(self, namespace: str):
+        with self._lock:
+            self._versions[namespace] = self._versions.get(namespace, 0) + 1
+
+
+class RedisVersionBackend:
+    """Keeps cache versions in Redis so every worker sees an invalidation."""
+
+    def __init__(self, url: str):
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package")
+        self._redis = redis.from_url(url)
+
+    def _key(self, namespace: str) -> str:
+        return f"cache-version:{namespace}"
+
+    async def get(self, namespace: str) -> str:
+        version = await self._redis.get(self._key(namespace))
+        return version.decode() if version else "0"
+
+    async def bump(self, namespace: str):
+        await self._redis.incr(self._key(namespace))
+
+
+def create_version_backend():
+    if settings.CACHE_BACKEND == "redis":
+        return RedisVersionBackend(settings.CACHE_REDIS_URL)
+    if settings.CACHE_BACKEND == "local":
+        return LocalVersionBackend(max_age=settings.CACHE_LOCAL_MAX_AGE)
+    raise RuntimeError(f"Unknown CACHE_BACKEND {settings.CACHE_BACKEND!r}")
+
+
+class VersionedCache:
+    """Read-through cache of serialized responses under one version number.
+
+    Entries are tagged with the version they were built at, and writers bump
+    the shared version instead of deleting entries, so a stale entry simply
+    stops matching. A response built while a write lands is stored under the
+    old version and therefore never served.
+    """
+
+    def __init__(self, namespace: str, backend, max_entries: int):
+        self.namespace = namespace
+        self.backend = backend
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def version(self) -> str:
+        return await self.backend.get(self.namespace)
+
+    async def invalidate(self):
+        await self.backend.bump(self.namespace)
+
+    def etag(self, version: str, key: str) -> str:
+        return weak_etag(self.namespace, version, key)
+
+    def get(self, key: str, version: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, version: str, body: bytes):
+        with self._lock:
+            self._entries[key] = (version, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+version_backend = create_version_backend()
+events_cache = VersionedCache("events", version_backend, max_entries=settings.EVENTS_CACHE_SIZE)
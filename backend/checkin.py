@@ -0,0 +1,216 @@
+# backend/checkin.py
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from sqlalchemy import bindparam, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.analytics import utc_naive
+from backend.config import settings
+from backend.models import Registration, REGISTRATION_CONFIRMED
+from backend.qr import parse_qr_payload
+
+CHECKED_IN = "checked_in"
+ALREADY_CHECKED_IN = "already_checked_in"
+INVALID = "invalid"
+WRONG_EVENT = "wrong_event"
+NOT_FOUND = "not_found"
+
+
+class EventCheckIns:
+    __slots__ = ("valid", "checked_in")
+
+    def __init__(self):
+        # Confirmed registration ids, and check-in times for those already in
+        self.valid = set()
+        self.checked_in = {}
+
+
+class CheckInIndex:
+    """In-memory index of confirmed registrations for the events being checked in.
+
+    A plain hash set rather than a Bloom filter: a false positive would let
+    someone through the door. A miss is not trusted either; it falls back
+    to one primary-key lookup, so registrations made or promoted after the
+    preload are still admitted. Only the `max_events` most recently used
+    events are kept.
+    """
+
+    def __init__(self, max_events: int):
+        self.max_events = max_events
+        self._events = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, event_id: str):
+        with self._lock:
+            index = self._events.get(event_id)
+            if index is not None:
+                self._events.move_to_end(event_id)
+            return index
+
+    async def load(self, db: AsyncSession, event_id: str) -> EventCheckIns:
+        rows = await db.execute(
+            select(Registration.id, Registration.checked_in_at).where(
+                Registration.event_id == event_id,
+                Registration.status == REGISTRATION_CONFIRMED,
+            )
+        )
+        index = EventCheckIns()
+        for reg_id, checked_in_at in rows:
+            index.valid.add(reg_id)
+            if checked_in_at is not None:
+                index.checked_in[reg_id] = checked_in_at
+        with self._lock:
+            self._events[event_id] = index
+            self._events.move_to_end(event_id)
+            while len(self._events) > self.max_events:
+                self._events.popitem(last=False)
+        return index
+
+    async def get_or_load(self, db: AsyncSession, event_id: str) -> EventCheckIns:
+        index = self.get(event_id)
+        if index is None:
+            index = await self.load(db, event_id)
+        return index
+
+    def discard(self, event_id: str, reg_id: str):
+        index = self.get(event_id)
+        if index is not None:
+            index.valid.discard(reg_id)
+            index.checked_in.pop(reg_id, None)
+
+
+checkin_index = CheckInIndex(max_events=settings.CHECKIN_MAX_EVENTS)
+
+
+def _result(status: str, reg_id=None, checked_in_at=None) -> dict:
+    return {"status": status, "registration_id": reg_id, "checked_in_at": checked_in_at}
+
+
+async def check_in(db: AsyncSession, event_id: str, payload: str) -> dict:
+    """Validate one scanned payload against the event's index and check it in.
+
+    Signature, event and membership are checked in memory; only the first
+    scan of a ticket writes, and that write is conditional so two gates
+    (or two workers) can't both admit the same ticket.
+    """
+    try:
+        reg_id, payload_event_id = parse_qr_payload(payload)
+    except ValueError:
+        return _result(INVALID)
+    if payload_event_id != event_id:
+        return _result(WRONG_EVENT, reg_id)
+
+    index = await checkin_index.get_or_load(db, event_id)
+    if reg_id not in index.valid:
+        # Registered or promoted off the waitlist since the preload
+        row = (await db.execute(
+            select(Registration.checked_in_at).where(
+                Registration.id == reg_id,
+                Registration.event_id == event_id,
+                Registration.status == REGISTRATION_CONFIRMED,
+            )
+        )).first()
+        if row is None:
+            return _result(NOT_FOUND, reg_id)
+        index.valid.add(reg_id)
+        if row.checked_in_at is not None:
+            index.checked_in[reg_id] = row.checked_in_at
+
+    checked_in_at = index.checked_in.get(reg_id)
+    if checked_in_at is not None:
+        return _result(ALREADY_CHECKED_IN, reg_id, checked_in_at)
+
+    now = datetime.utcnow()
+    result = await db.execute(
+        update(Registration)
+        .where(Registration.id == reg_id, Registration.checked_in_at.is_(None))
+        .values(checked_in_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    if result.rowcount == 0:
+        # Checked in elsewhere since the preload, or deleted
+        checked_in_at = await db.scalar(select(Registration.checked_in_at).where(Registration.id == reg_id))
+        if checked_in_at is None:
+            checkin_index.discard(event_id, reg_id)
+            return _result(NOT_FOUND, reg_id)
+        index.checked_in[reg_id] = checked_in_at
+        return _result(ALREADY_CHECKED_IN, reg_id, checked_in_at)
+    index.checked_in[reg_id] = now
+    return _result(CHECKED_IN, reg_id, now)
+
+
+async def sync_check_ins(db: AsyncSession, event_id: str, scans: list) -> list:
+    """Apply a batch of offline (payload, scanned_at) scans and return one result per scan.
+
+    The earliest scan of a ticket wins, including over a later live
+    check-in, and the whole batch is one SELECT and one executemany UPDATE.
+    """
+    parsed = []
+    earliest = {}
+    for payload, scanned_at in scans:
+        scanned_at = utc_naive(scanned_at) if scanned_at else datetime.utcnow()
+        try:
+            reg_id, payload_event_id = parse_qr_payload(payload)
+        except ValueError:
+            parsed.append((INVALID, None, None))
+            continue
+        if payload_event_id != event_id:
+            parsed.append((WRONG_EVENT, reg_id, None))
+            continue
+        parsed.append((None, reg_id, scanned_at))
+        if reg_id not in earliest or scanned_at < earliest[reg_id]:
+            earliest[reg_id] = scanned_at
+
+    current = {}
+    if earliest:
+        current = dict((await db.execute(
+            select(Registration.id, Registration.checked_in_at).where(
+                Registration.id.in_(earliest),
+                Registration.event_id == event_id,
+                Registration.status == REGISTRATION_CONFIRMED,
+            )
+        )).all())
+
+    final = {}
+    updates = []
+    for reg_id, scanned_at in earliest.items():
+        if reg_id not in current:
+            continue
+        stored = current[reg_id]
+        final[reg_id] = scanned_at if stored is None or scanned_at < stored else stored
+        if final[reg_id] != stored:
+            updates.append({"reg_id": reg_id, "scanned_at": scanned_at})
+
+    if updates:
+        table = Registration.__table__
+        await db.execute(
+            update(table)
+            .where(
+                table.c.id == bindparam("reg_id"),
+                or_(table.c.checked_in_at.is_(None), table.c.checked_in_at > bindparam("scanned_at")),
+            )
+            .values(checked_in_at=bindparam("scanned_at")),
+            updates,
+        )
+        await db.commit()
+
+    index = checkin_index.get(event_id)
+    if index is not None:
+        for reg_id, checked_in_at in final.items():
+            index.valid.add(reg_id)
+            index.checked_in[reg_id] = checked_in_at
+
+    results = []
+    admitted = set()
+    for status, reg_id, scanned_at in parsed:
+        if status is None:
+            if reg_id not in final:
+                status = NOT_FOUND
+            elif current[reg_id] is None and reg_id not in admitted and scanned_at == earliest[reg_id]:
+                status = CHECKED_IN
+                admitted.add(reg_id)
+            else:
+                status = ALREADY_CHECKED_IN
+        results.append(_result(status, reg_id, final.get(reg_id)))
+    return results
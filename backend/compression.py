@@ -0,0 +1,144 @@
+# backend/compression.py
+import zlib
+from starlette.datastructures import Headers, MutableHeaders
+
+# Already-compressed formats like PNG gain nothing from a second pass
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/x-ndjson", "application/javascript")
+
+
+class _GzipEncoder:
+    def __init__(self, level: int):
+        # wbits=16+MAX_WBITS writes a gzip header and trailer
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliEncoder:
+    def __init__(self, brotli, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def _accepted_encodings(header: str) -> set:
+    accepted = set()
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q=") and params[2:] in ("0", "0.0", "0.00", "0.000"):
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+class CompressionMiddleware:
+    """Pure ASGI gzip/brotli compression, streamed so exports stay flat in memory.
+
+    Brotli is preferred when the `brotli` package is installed and the
+    client accepts it. Bodies under `minimum_size` that arrive in a single
+    message, responses that already carry a Content-Encoding and
+    non-compressible media types pass through untouched.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6,
+                 brotli: bool = True, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self._brotli = None
+        if brotli:
+            try:
+                import brotli as brotli_module
+                self._brotli = brotli_module
+            except ImportError:
+                pass
+
+    def _negotiate(self, scope):
+        accepted = _accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        if self._brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    def _encoder(self, encoding: str):
+        if encoding == "br":
+            return _BrotliEncoder(self._brotli, self.brotli_quality)
+        return _GzipEncoder(self.gzip_level)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = self._negotiate(scope)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        compressing = None
+        encoder = None
+
+        async def send_compressed(message):
+            nonlocal start_message, compressing, encoder
+            if message["type"] == "http.response.start":
+                # Held back until the first body chunk shows whether to compress
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressing is None:
+                headers = MutableHeaders(raw=list(start_message.get("headers", [])))
+                media_type = headers.get("content-type", "")
+                compressing = (
+                    "content-encoding" not in headers
+                    and media_type.startswith(COMPRESSIBLE_TYPES)
+                    and (more_body or len(body) >= self.minimum_size)
+                )
+                if not compressing:
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                encoder = self._encoder(encoding)
+                headers["content-encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                # A strong validator no longer describes the encoded bytes
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["etag"] = f"W/{etag}"
+                if more_body:
+                    del headers["content-length"]
+                else:
+                    body = encoder.compress(body) + encoder.finish()
+                    headers["content-length"] = str(len(body))
+                start_message["headers"] = headers.raw
+                await send(start_message)
+                if not more_body:
+                    await send({"type": "http.response.body", "body": body})
+                    return
+
+            if not compressing:
+                await send(message)
+                return
+            chunk = encoder.compress(body)
+            if not more_body:
+                chunk += encoder.finish()
+            if chunk or not more_body:
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,234 @@
+# backend/crud.py
+import uuid
+from datetime import datetime, timedelta
+from fastapi import HTTPException
+from sqlalchemy import insert, literal, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.models import Base, Event, Registration, User, REGISTRATION_CONFIRMED, REGISTRATION_WAITLISTED
+from backend.schemas import RegistrationCreate, RegistrationOut
+from backend.qr import qr_url
+from backend import analytics, stats
+
+# Exactly the columns RegistrationOut needs, so listings never hydrate ORM
+# objects or lazy-load reg.user per row
+REGISTRATION_COLUMNS = (
+    Registration.id,
+    Registration.event_id,
+    Registration.user_id,
+    User.name.label("user_name"),
+    User.email.label("user_email"),
+    Registration.team_name,
+    Registration.qr_code,
+    Registration.status,
+    Registration.registered_at,
+)
+
+
+# Newest registered_at handed out by registration_times() in this process
+_last_registered_at = datetime.min
+
+
+def registration_times(n: int) -> list:
+    """`n` strictly increasing naive UTC timestamps, each later than any handed out before.
+
+    The waitlist is promoted in (registered_at, id) order, so rows written
+    together in one batch must not share a timestamp, or they would be
+    promoted in random id order instead of file or arrival order.
+    """
+    global _last_registered_at
+    start = max(datetime.utcnow(), _last_registered_at + timedelta(microseconds=1))
+    times = [start + timedelta(microseconds=i) for i in range(n)]
+    if times:
+        _last_registered_at = times[-1]
+    return times
+
+
+# Constraints a registration can trip that are the client's doing
+DUPLICATE_REGISTRATION = "uq_registrations_user_event"
+USER_ID_TAKEN = "users_pkey"
+
+
+def violated_constraint(error: IntegrityError):
+    """Name of the constraint behind an IntegrityError, or None if it can't be told.
+
+    PostgreSQL drivers report the name directly. SQLite only lists the
+    columns, so they are matched against the unique indexes and primary
+    keys in the models, and primary keys get PostgreSQL's `<table>_pkey`.
+    """
+    orig = error.orig
+    for candidate in (orig, getattr(orig, "__cause__", None)):
+        name = getattr(candidate, "constraint_name", None) or getattr(
+            getattr(candidate, "diag", None), "constraint_name", None
+        )
+        if name:
+            return name
+
+    message = str(orig)
+    if not message.startswith("UNIQUE constraint failed: "):
+        return None
+    qualified = [c.strip() for c in message[len("UNIQUE constraint failed: "):].split(",")]
+    table = Base.metadata.tables.get(qualified[0].split(".")[0])
+    if table is None:
+        return None
+    columns = [c.split(".", 1)[-1] for c in qualified]
+    if columns == [c.name for c in table.primary_key.columns]:
+        return f"{table.name}_pkey"
+    for index in table.indexes:
+        if index.unique and columns == [c.name for c in index.columns]:
+            return index.name
+    return None
+
+
+def registration_conflict(error: IntegrityError) -> HTTPException:
+    """Turn an IntegrityError from registering into the client error it stands for.
+
+    Anything that isn't a known client mistake is re-raised as is.
+    """
+    constraint = violated_constraint(error)
+    if constraint == DUPLICATE_REGISTRATION:
+        return HTTPException(status_code=400, detail="User already registered for this event")
+    if constraint == USER_ID_TAKEN:
+        return HTTPException(status_code=409, detail="user_id already belongs to another user")
+    raise error
+
+
+def dialect_insert(db: AsyncSession, model):
+    """Return an INSERT construct that supports ON CONFLICT for the bound dialect."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+        return pg_insert(model)
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+        return sqlite_insert(model)
+    return None
+
+
+async def require_event(db: AsyncSession, event_id: str):
+    """Raise a 404 unless the event exists."""
+    if not await db.scalar(select(Event.id).where(Event.id == event_id)):
+        raise HTTPException(status_code=404, detail="Event not found")
+
+
+async def upsert_user(db: AsyncSession, user_id: str, name: str, email: str):
+    """Insert the user unless the email already exists.
+
+    Returns the (id, name, email) row and whether it was created. New users
+    cost a single round-trip. Existing users keep their stored name.
+    """
+    values = dict(id=user_id, name=name, email=email, registered_at=datetime.utcnow())
+    existing = select(User.id, User.name, User.email).where(User.email == email)
+
+    stmt = dialect_insert(db, User)
+    if stmt is None:
+        # No ON CONFLICT support, the unique index on email still protects us
+        row = (await db.execute(existing)).first()
+        if row is not None:
+            return row, False
+        await db.execute(insert(User).values(**values))
+        return (await db.execute(existing)).first(), True
+
+    row = (await db.execute(
+        stmt.values(**values)
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User.id, User.name, User.email)
+    )).first()
+    if row is not None:
+        return row, True
+    return (await db.execute(existing)).first(), False
+
+
+async def insert_registration(
+    db: AsyncSession,
+    reg_id: str,
+    user_id: str,
+    event_id: str,
+    team_name=None,
+    phone=None,
+    qr_code=None,
+    status=REGISTRATION_CONFIRMED,
+    registered_at=None,
+) -> bool:
+    """Insert a registration if the event exists; return False if it does not.
+
+    The event check is folded into the INSERT ... SELECT, and duplicate
+    registrations surface as an IntegrityError from the unique index.
+    """
+    columns = ["id", "user_id", "event_id", "team_name", "phone", "qr_code", "status", "registered_at"]
+    source = select(
+        literal(reg_id),
+        literal(user_id),
+        Event.id,
+        literal(team_name),
+        literal(phone),
+        literal(qr_code),
+        literal(status),
+        literal(registered_at or datetime.utcnow()),
+    ).where(Event.id == event_id)
+    result = await db.execute(insert(Registration).from_select(columns, source))
+    return result.rowcount == 1
+
+
+async def create_registration(db: AsyncSession, data: RegistrationCreate) -> RegistrationOut:
+    """Register one user for one event in its own transaction."""
+    reg_id = str(uuid.uuid4())
+
+    # Everything happens in one transaction; the unique index on
+    # (user_id, event_id) rejects double-submits instead of a pre-check,
+    # and rolling back also hands back the seat claimed for it
+    try:
+        user, user_created = await upsert_user(
+            db,
+            user_id=data.user_id if data.user_id else str(uuid.uuid4()),
+            name=data.name,
+            email=data.email
+        )
+        # One conditional UPDATE of the event's counter row decides between
+        # a seat and the waitlist; concurrent claims queue on its row lock
+        claimed = await stats.claim_seats(db, data.event_id)
+        if claimed is None:
+            await db.rollback()
+            raise HTTPException(status_code=404, detail="Event not found")
+        status = REGISTRATION_CONFIRMED if claimed else REGISTRATION_WAITLISTED
+        registered_at = registration_times(1)[0]
+        await insert_registration(
+            db,
+            reg_id=reg_id,
+            user_id=user.id,
+            event_id=data.event_id,
+            team_name=data.team_name,
+            phone=data.phone,
+            qr_code=qr_url(reg_id),  # Rendered on demand by routes/qr_codes.py
+            status=status,
+            registered_at=registered_at
+        )
+        await analytics.record(db, [(data.event_id, registered_at)])
+        await stats.bump(db, registrations=1, users=int(user_created))
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        raise registration_conflict(e)
+
+    return RegistrationOut.model_validate({
+        "id": reg_id,
+        "user": user._mapping,
+        "team_name": data.team_name,
+        "event_id": data.event_id,
+        "qr_code": qr_url(reg_id),
+        "status": status
+    })
+
+
+def select_registrations():
+    """SELECT for registration listings joined to their user, one row per registration."""
+    return select(*REGISTRATION_COLUMNS).join(User, Registration.user_id == User.id)
+
+
+def registration_out(row) -> RegistrationOut:
+    # One validation pass straight from the row mapping; extra columns are ignored
+    fields = row._mapping
+    return RegistrationOut.model_validate({
+        **fields,
+        "user": {"id": fields["user_id"], "name": fields["user_name"], "email": fields["user_email"]},
+    })
@@ -1,21 +1,51 @@
 # backend/main.py
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from backend.routes import events, register, admin_dashboard, admin_auth
+from backend.routes import events, register, admin_dashboard, admin_auth, admin_import, admin_search, admin_analytics, checkin, qr_codes, monitoring
 from backend.routers import user
 import backend.models as models
-from backend.database import engine
+from backend.database import engine, async_engine
 from backend.config import settings
-import os
+from backend.qr import qr_renderer
+from backend.auth.hashing import hashing_pool
+from backend.registration_queue import registration_queue
+from backend.metrics import MetricsMiddleware, request_metrics
+from backend.profiler import SQLProfiler, SQLProfilerMiddleware
+from backend.responses import default_response_class
+from backend.compression import CompressionMiddleware
+from backend import stats
+import asyncio
 
-# Create tables
-models.Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Nothing touches the database at import time; Alembic owns the schema
+    if settings.DB_CREATE_ALL:
+        await asyncio.to_thread(models.Base.metadata.create_all, bind=engine)
+
+    # Runs once immediately, which also seeds the counters on a fresh database
+    app.state.stats_reconciler = asyncio.create_task(
+        stats.reconcile_periodically(settings.STATS_RECONCILE_INTERVAL)
+    )
+    if registration_queue.enabled:
+        registration_queue.start()
+    try:
+        yield
+    finally:
+        # Flush accepted registrations before the engines are disposed
+        await registration_queue.stop()
+        app.state.stats_reconciler.cancel()
+        qr_renderer.shutdown()
+        hashing_pool.shutdown()
+        await async_engine.dispose()
+        engine.dispose()
 
 app = FastAPI(
     title="Zettabyte Hub Backend",
     description="Event Management System for Zettabyte Hub",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=default_response_class,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -27,17 +57,41 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Ensure absolute path to qr_codes folder
-qr_codes_path = os.path.join(os.path.dirname(__file__), settings.QR_CODE_DIR)
-os.makedirs(qr_codes_path, exist_ok=True)
-app.mount("/qr_codes", StaticFiles(directory=qr_codes_path), name="qr_codes")
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli=settings.COMPRESSION_BROTLI,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
+if settings.SQL_PROFILE:
+    sql_profiler = SQLProfiler(
+        slow_query_ms=settings.SQL_SLOW_QUERY_MS,
+        n_plus_one_threshold=settings.SQL_N_PLUS_ONE_THRESHOLD,
+        explain=settings.SQL_EXPLAIN_SLOW,
+    )
+    sql_profiler.instrument(engine)
+    sql_profiler.instrument(async_engine.sync_engine)
+    app.add_middleware(SQLProfilerMiddleware, profiler=sql_profiler)
+
+# Added last so it wraps everything else, including CORS preflights
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, metrics=request_metrics)
 
 # Register routes
 app.include_router(events.router, prefix="/api", tags=["Events"])
 app.include_router(register.router, prefix="/api", tags=["Registration"])
 app.include_router(admin_auth.router, prefix="/api", tags=["Admin Auth"])
 app.include_router(admin_dashboard.router, prefix="/api", tags=["Admin Dashboard"])
+app.include_router(admin_import.router, prefix="/api", tags=["Admin Import"])
+app.include_router(admin_search.router, prefix="/api", tags=["Admin Search"])
+app.include_router(admin_analytics.router, prefix="/api", tags=["Admin Analytics"])
+app.include_router(checkin.router, prefix="/api", tags=["Check-in"])
 app.include_router(user.router, prefix="/api", tags=["Users"])
+app.include_router(qr_codes.router, tags=["QR Codes"])
+app.include_router(monitoring.router, tags=["Monitoring"])
 
 # Health check endpoint
 @app.get("/health")
@@ -0,0 +1,192 @@
+# backend/metrics.py
+import time
+from bisect import bisect_left
+from collections import defaultdict
+
+# Upper bounds in seconds; the +Inf bucket is implied
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Requests that matched no route share one label, so scanners can't blow up cardinality
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RequestMetrics:
+    """Per-route request counters and latency histograms.
+
+    Only the event loop thread records into these, so plain ints and dicts
+    are enough and the hot path takes no lock. A histogram is a list of
+    per-bucket counts (made cumulative when rendered) followed by the sum.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.in_flight = 0
+        self.requests = defaultdict(int)
+        self.exceptions = defaultdict(int)
+        self.durations = {}
+
+    def observe(self, method: str, route: str, status: int, seconds: float):
+        self.requests[(method, route, status)] += 1
+        histogram = self.durations.get((method, route))
+        if histogram is None:
+            histogram = self.durations[(method, route)] = [0] * (len(self.buckets) + 2)
+        histogram[bisect_left(self.buckets, seconds)] += 1
+        histogram[-1] += seconds
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware, so streaming responses are timed to their last byte."""
+
+    def __init__(self, app, metrics: RequestMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        metrics = self.metrics
+        metrics.in_flight += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception:
+            metrics.exceptions[(scope["method"], _route(scope))] += 1
+            raise
+        finally:
+            metrics.in_flight -= 1
+            metrics.observe(scope["method"], _route(scope), status, time.perf_counter() - start)
+
+
+def _route(scope) -> str:
+    # The router stores the matched route in the shared scope dict
+    route = scope.get("route")
+    return route.path if route is not None else UNMATCHED_ROUTE
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+class Exposition:
+    """Builds the Prometheus text format, one metric family at a time."""
+
+    def __init__(self):
+        self.lines = []
+
+    def family(self, name: str, kind: str, help_text: str):
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, value, **labels):
+        self.lines.append(f"{name}{_labels(**labels)} {value}")
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def _format_le(bound: float) -> str:
+    return repr(float(bound))
+
+
+def render_request_metrics(out: Exposition, metrics: RequestMetrics):
+    out.family("http_requests_in_flight", "gauge", "Requests currently being served.")
+    out.sample("http_requests_in_flight", metrics.in_flight)
+
+    out.family("http_requests_total", "counter", "Requests served, by route and status.")
+    for (method, route, status), count in sorted(metrics.requests.items()):
+        out.sample("http_requests_total", count, method=method, route=route, status=status)
+
+    out.family("http_request_exceptions_total", "counter", "Requests that raised instead of responding.")
+    for (method, route), count in sorted(metrics.exceptions.items()):
+        out.sample("http_request_exceptions_total", count, method=method, route=route)
+
+    out.family("http_request_duration_seconds", "histogram", "Time to the last byte of the response.")
+    for (method, route), histogram in sorted(metrics.durations.items()):
+        cumulative = 0
+        for bound, count in zip(metrics.buckets, histogram):
+            cumulative += count
+            out.sample("http_request_duration_seconds_bucket", cumulative, method=method, route=route, le=_format_le(bound))
+        cumulative += histogram[len(metrics.buckets)]
+        out.sample("http_request_duration_seconds_bucket", cumulative, method=method, route=route, le="+Inf")
+        out.sample("http_request_duration_seconds_sum", round(histogram[-1], 6), method=method, route=route)
+        out.sample("http_request_duration_seconds_count", cumulative, method=method, route=route)
+
+
+# (pool_status() key, metric name, type, help)
+POOL_METRICS = (
+    ("checked_out", "db_pool_checked_out", "gauge", "Connections currently checked out."),
+    ("overflow", "db_pool_overflow", "gauge", "Connections open beyond pool_size."),
+    ("size", "db_pool_size", "gauge", "Configured pool size."),
+    ("checkouts", "db_pool_checkouts_total", "counter", "Connections checked out since start."),
+    ("checkout_timeouts", "db_pool_checkout_timeouts_total", "counter", "Checkouts that gave up waiting."),
+    ("checkout_wait_total_seconds", "db_pool_checkout_wait_seconds_total", "counter", "Time spent waiting for a connection."),
+)
+
+
+def render_runtime_metrics(out: Exposition):
+    """Gauges read from the app's pools and caches at scrape time."""
+    import anyio.to_thread
+    from backend.database import engine, async_engine, pool_status
+    from backend.auth.hashing import hashing_pool
+    from backend.auth.jwt import token_cache
+    from backend.registration_queue import registration_queue
+    from backend.qr import qr_renderer
+
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    out.family("threadpool_threads_busy", "gauge", "Threads of the shared threadpool in use.")
+    out.sample("threadpool_threads_busy", limiter.borrowed_tokens)
+    out.family("threadpool_threads_max", "gauge", "Size of the shared threadpool.")
+    out.sample("threadpool_threads_max", limiter.total_tokens)
+
+    pools = {"async": pool_status(async_engine), "sync": pool_status(engine)}
+    for key, name, kind, help_text in POOL_METRICS:
+        out.family(name, kind, help_text)
+        for engine_name, status in pools.items():
+            if key in status:
+                out.sample(name, status[key], engine=engine_name)
+
+    hashing = hashing_pool.stats()
+    out.family("bcrypt_pending", "gauge", "Password hashes running or queued.")
+    out.sample("bcrypt_pending", hashing["pending"])
+    out.family("bcrypt_rejected_total", "counter", "Hashes refused because the queue was full.")
+    out.sample("bcrypt_rejected_total", hashing["rejected"])
+
+    queue = registration_queue.stats()
+    out.family("registration_queue_depth", "gauge", "Registrations waiting to be flushed.")
+    out.sample("registration_queue_depth", queue["queued"])
+    out.family("registration_queue_rejected_total", "counter", "Registrations refused with 429.")
+    out.sample("registration_queue_rejected_total", queue["rejected"])
+
+    tokens = token_cache.stats()
+    out.family("token_cache_lookups_total", "counter", "Verified-token cache lookups.")
+    out.sample("token_cache_lookups_total", tokens["hits"], result="hit")
+    out.sample("token_cache_lookups_total", tokens["misses"], result="miss")
+
+    out.family("qr_cache_bytes", "gauge", "Bytes of rendered QR codes held in memory.")
+    out.sample("qr_cache_bytes", qr_renderer.cache.size)
+
+
+def render_metrics(metrics: RequestMetrics) -> str:
+    out = Exposition()
+    render_request_metrics(out, metrics)
+    render_runtime_metrics(out)
+    return out.render()
+
+
+request_metrics = RequestMetrics()
@@ -1,12 +1,19 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean, Index, DDL, event
 from sqlalchemy.orm import relationship
 from backend.database import Base
+from backend.search import SEARCH_COLUMNS, sqlite_search_ddl
 from datetime import datetime
 import uuid
 
 def generate_uuid():
     return str(uuid.uuid4())
 
+def trigram_index(name: str, column: str):
+    # Serves ILIKE '%term%' and 'term%' on PostgreSQL; SQLite uses FTS5 instead, see below
+    return Index(
+        name, column, postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"}
+    ).ddl_if(dialect="postgresql")
+
 class User(Base):
     __tablename__ = "users"
     id = Column(String, primary_key=True, default=generate_uuid)
@@ -17,6 +24,12 @@ class User(Base):
 
     registrations = relationship("Registration", back_populates="user")
 
+    __table_args__ = (
+        Index("ix_users_registered_at_id", "registered_at", "id"),
+        trigram_index("ix_users_name_trgm", "name"),
+        trigram_index("ix_users_email_trgm", "email"),
+    )
+
 class Event(Base):
     __tablename__ = "events"
     id = Column(String, primary_key=True, default=generate_uuid)
@@ -24,20 +37,45 @@ class Event(Base):
     description = Column(String)
     date = Column(DateTime, nullable=False)
     max_team_size = Column(Integer, default=1)
+    # Seats available to confirmed registrations; None means unlimited
+    capacity = Column(Integer, nullable=True)
     solo = Column(Boolean, default=True)
     created_by = Column(String, nullable=False)
 
     registrations = relationship("Registration", back_populates="event")
 
+    __table_args__ = (
+        Index("ix_events_date_id", "date", "id"),
+        trigram_index("ix_events_title_trgm", "title"),
+    )
+
+REGISTRATION_CONFIRMED = "confirmed"
+REGISTRATION_WAITLISTED = "waitlisted"
+
 class Registration(Base):
     __tablename__ = "registrations"
+    # The unique index leads with user_id, so it also serves lookups by user.
+    # The (event_id, registered_at, id) index serves per-event lookups and
+    # keyset pagination of an event's registrations.
+    __table_args__ = (
+        Index("uq_registrations_user_event", "user_id", "event_id", unique=True),
+        Index("ix_registrations_registered_at_id", "registered_at", "id"),
+        Index("ix_registrations_event_registered_at_id", "event_id", "registered_at", "id"),
+        # max(updated_at) is half of the listing ETag, see stats.table_version()
+        Index("ix_registrations_updated_at", "updated_at"),
+        trigram_index("ix_registrations_team_name_trgm", "team_name"),
+        trigram_index("ix_registrations_phone_trgm", "phone"),
+    )
     id = Column(String, primary_key=True, default=generate_uuid)
     event_id = Column(String, ForeignKey("events.id"), nullable=False)
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
     team_name = Column(String, nullable=True)
     phone = Column(String, nullable=True)
     qr_code = Column(String, unique=True)
+    status = Column(String, nullable=False, default=REGISTRATION_CONFIRMED, server_default=REGISTRATION_CONFIRMED)
     registered_at = Column(DateTime, default=datetime.utcnow)
+    checked_in_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     user = relationship("User", back_populates="registrations")
     event = relationship("Event", back_populates="registrations")
@@ -47,4 +85,40 @@ class Admin(Base):
     __tablename__ = "admins"
     id= Column(Integer, primary_key=True,  index=True)
     username = Column(String, unique=True, index=True)
-    hashed_password = Column(String)
\ No newline at end of file
+    hashed_password = Column(String)
+
+
+# Dashboard counters, maintained in the same transaction as the writes
+# they count and periodically reconciled by backend/stats.py
+class GlobalStats(Base):
+    __tablename__ = "global_stats"
+    id = Column(Integer, primary_key=True)
+    total_events = Column(Integer, nullable=False, default=0)
+    total_registrations = Column(Integer, nullable=False, default=0)
+    total_users = Column(Integer, nullable=False, default=0)
+
+
+class EventStats(Base):
+    __tablename__ = "event_stats"
+    event_id = Column(String, ForeignKey("events.id", ondelete="CASCADE"), primary_key=True)
+    registration_count = Column(Integer, nullable=False, default=0)
+    # capacity minus confirmed registrations, claimed with a conditional
+    # UPDATE so concurrent registrations can't oversell; None when unlimited
+    seats_remaining = Column(Integer, nullable=True)
+
+
+# Registrations per event per time bucket, maintained with the inserts they
+# count by backend/analytics.py so charts never GROUP BY the live table
+class RegistrationRollup(Base):
+    __tablename__ = "registration_rollups"
+    event_id = Column(String, ForeignKey("events.id", ondelete="CASCADE"), primary_key=True)
+    bucket_seconds = Column(Integer, primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    registrations = Column(Integer, nullable=False, default=0)
+
+
+# Admin search: pg_trgm for the trigram indexes, FTS5 tables from backend/search.py on SQLite
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"))
+for _table, _columns in SEARCH_COLUMNS.items():
+    for _statement in sqlite_search_ddl(_table, _columns):
+        event.listen(Base.metadata.tables[_table], "after_create", DDL(_statement).execute_if(dialect="sqlite"))
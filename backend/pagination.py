@@ -0,0 +1,70 @@
+# backend/pagination.py
+import base64
+import json
+from datetime import datetime
+from typing import Optional
+from fastapi import HTTPException, Query
+from sqlalchemy import DateTime, tuple_
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+class PageParams:
+    """Common `limit`/`cursor` query parameters for keyset-paginated listings."""
+
+    def __init__(
+        self,
+        limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+        cursor: Optional[str] = None
+    ):
+        self.limit = limit
+        self.cursor = cursor
+
+
+def encode_cursor(values) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError
+        return [
+            datetime.fromisoformat(v) if isinstance(col.type, DateTime) and v is not None else v
+            for col, v in zip(columns, values)
+        ]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _selects_entity(stmt) -> bool:
+    columns = stmt.column_descriptions
+    return len(columns) == 1 and columns[0]["expr"] is columns[0]["entity"]
+
+
+async def paginate(db, stmt, order_by, page: PageParams, descending: bool = False):
+    """Apply keyset pagination to `stmt`, execute it and return (rows, next_cursor).
+
+    `order_by` must end with a unique column so the ordering is total. The
+    cursor holds the sort key of the last row, so every page is a single
+    index range scan no matter how deep the client pages. Selecting a single
+    entity returns ORM objects, anything else returns rows.
+    """
+    if page.cursor:
+        values = decode_cursor(page.cursor, order_by)
+        key = tuple_(*order_by)
+        stmt = stmt.where(key < tuple_(*values) if descending else key > tuple_(*values))
+
+    stmt = stmt.order_by(*[col.desc() if descending else col.asc() for col in order_by])
+    result = await db.execute(stmt.limit(page.limit + 1))
+    rows = result.scalars().all() if _selects_entity(stmt) else result.all()
+
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        next_cursor = encode_cursor([getattr(rows[-1], col.key) for col in order_by])
+    return rows, next_cursor
@@ -0,0 +1,129 @@
+# backend/profiler.py
+import contextvars
+import logging
+import re
+import time
+from collections import Counter
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+_current = contextvars.ContextVar("sql_profile", default=None)
+
+# Expanded IN lists differ in length per call; fold them so they share a shape
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%s|\$\d+|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%s|\$\d+|%\(\w+\)s|:\w+))+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    return _PLACEHOLDER_LIST.sub("(?, ...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def _truncate(value, limit: int = 500) -> str:
+    text = repr(value)
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+class RequestProfile:
+    __slots__ = ("queries", "db_time", "shapes")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.shapes = Counter()
+
+
+class SQLProfiler:
+    """Opt-in per-request SQL instrumentation, hooked on engine events.
+
+    Counts statements and DB time for the request in progress (tracked in
+    a contextvar, so it follows the request into the threadpool and the
+    async engine's greenlets), logs statements slower than `slow_query_ms`
+    with their parameters and query plan, and warns when one statement
+    shape runs `n_plus_one_threshold` or more times in a single request.
+    """
+
+    def __init__(self, slow_query_ms: float, n_plus_one_threshold: int, explain: bool = True):
+        self.slow_query = slow_query_ms / 1000
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.explain = explain
+
+    def instrument(self, engine):
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        context._profiler_start = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._profiler_start
+        profile = _current.get()
+        if profile is not None:
+            profile.queries += 1
+            profile.db_time += elapsed
+            profile.shapes[statement_shape(statement)] += 1
+        if elapsed >= self.slow_query:
+            plan = None
+            if self.explain and not executemany:
+                plan = self._explain(conn, statement, parameters)
+            logger.warning(
+                "Slow query (%.1f ms): %s\nParameters: %s%s",
+                elapsed * 1000, statement, _truncate(parameters),
+                f"\nPlan:\n{plan}" if plan else "",
+            )
+
+    def _explain(self, conn, statement: str, parameters):
+        if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            return None
+        prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+        # A raw DBAPI cursor, so the EXPLAIN itself doesn't re-enter these hooks
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(prefix + statement, parameters)
+            return "\n".join(" | ".join(str(col) for col in row) for row in cursor.fetchall())
+        except Exception as e:
+            return f"(EXPLAIN failed: {e.__class__.__name__}: {e})"
+        finally:
+            cursor.close()
+
+    def report(self, method: str, route: str, profile: RequestProfile):
+        for shape, count in profile.shapes.items():
+            if count >= self.n_plus_one_threshold:
+                logger.warning(
+                    "Possible N+1 in %s %s: %d queries of the same shape: %s",
+                    method, route, count, shape[:300],
+                )
+
+
+class SQLProfilerMiddleware:
+    """Profiles each HTTP request and reports DB cost in a Server-Timing header."""
+
+    def __init__(self, app, profiler: SQLProfiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile()
+        token = _current.set(profile)
+        start = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                total = (time.perf_counter() - start) * 1000
+                timing = (
+                    f'db;dur={profile.db_time * 1000:.1f};desc="{profile.queries} queries", '
+                    f"app;dur={total:.1f}"
+                )
+                message["headers"] = list(message.get("headers", [])) + [(b"server-timing", timing.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            route = scope.get("route")
+            self.profiler.report(scope["method"], route.path if route is not None else scope["path"], profile)
@@ -0,0 +1,251 @@
+# backend/qr.py
+import asyncio
+import base64
+import hashlib
+import hmac
+import io
+import logging
+import os
+import secrets
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+QR_DIR = os.path.join(os.path.dirname(__file__), settings.QR_CODE_DIR)
+
+# Bump when the rendering parameters change so cached images are invalidated
+QR_RENDER_VERSION = "2"
+
+# ZB1 packs two canonical UUIDs; ZB2 carries any other ids as length-prefixed UTF-8
+QR_PAYLOAD_PREFIX = "ZB1:"
+QR_TEXT_PAYLOAD_PREFIX = "ZB2:"
+QR_SIGNATURE_BYTES = 8
+
+if settings.QR_SIGNING_KEY:
+    QR_SIGNING_KEY = settings.QR_SIGNING_KEY.encode()
+else:
+    QR_SIGNING_KEY = secrets.token_bytes(32)
+    logger.warning(
+        "Neither QR_SIGNING_KEY nor SECRET_KEY is set; signing check-in QR codes with a random "
+        "key that other workers and restarts won't accept"
+    )
+
+
+def qr_url(reg_id: str) -> str:
+    return f"/qr_codes/{reg_id}.png"
+
+
+def _qr_signature(body: bytes) -> bytes:
+    return hmac.new(QR_SIGNING_KEY, body, hashlib.sha256).digest()[:QR_SIGNATURE_BYTES]
+
+
+def _uuid_bytes(value: str):
+    """The 16 bytes of a canonical UUID string, or None if `value` isn't one."""
+    try:
+        parsed = uuid.UUID(value)
+    except (ValueError, TypeError, AttributeError):
+        return None
+    return parsed.bytes if str(parsed) == value else None
+
+
+def _b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _unb64(token: str) -> bytes:
+    try:
+        return base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except (ValueError, TypeError):
+        raise ValueError("Malformed QR payload")
+
+
+def build_qr_payload(reg_id: str, event_id: str) -> str:
+    """Signed check-in payload: both ids plus a truncated HMAC.
+
+    UUID ids pack into 58 characters. Other ids, such as imported ones,
+    fall back to a longer length-prefixed form; ValueError if the
+    registration id is over 255 bytes. Scanners can check either offline
+    with the signing key, and nothing personal is printed on the ticket.
+    """
+    reg_uuid, event_uuid = _uuid_bytes(reg_id), _uuid_bytes(event_id)
+    if reg_uuid is not None and event_uuid is not None:
+        body = reg_uuid + event_uuid
+        return QR_PAYLOAD_PREFIX + _b64(body + _qr_signature(body))
+
+    reg_bytes = reg_id.encode()
+    if len(reg_bytes) > 255:
+        raise ValueError("Registration id too long for a QR payload")
+    body = bytes([len(reg_bytes)]) + reg_bytes + event_id.encode()
+    # The prefix is signed too, so a ZB2 body can never pass as a ZB1 one
+    signature = _qr_signature(QR_TEXT_PAYLOAD_PREFIX.encode() + body)
+    return QR_TEXT_PAYLOAD_PREFIX + _b64(body + signature)
+
+
+def parse_qr_payload(payload: str):
+    """Return (registration_id, event_id) from a signed payload; ValueError if it isn't one."""
+    if payload.startswith(QR_PAYLOAD_PREFIX):
+        raw = _unb64(payload[len(QR_PAYLOAD_PREFIX):])
+        if len(raw) != 32 + QR_SIGNATURE_BYTES:
+            raise ValueError("Malformed QR payload")
+        body, signature = raw[:32], raw[32:]
+        if not hmac.compare_digest(signature, _qr_signature(body)):
+            raise ValueError("Bad QR signature")
+        return str(uuid.UUID(bytes=body[:16])), str(uuid.UUID(bytes=body[16:]))
+
+    if payload.startswith(QR_TEXT_PAYLOAD_PREFIX):
+        raw = _unb64(payload[len(QR_TEXT_PAYLOAD_PREFIX):])
+        if len(raw) <= QR_SIGNATURE_BYTES:
+            raise ValueError("Malformed QR payload")
+        body, signature = raw[:-QR_SIGNATURE_BYTES], raw[-QR_SIGNATURE_BYTES:]
+        if not hmac.compare_digest(signature, _qr_signature(QR_TEXT_PAYLOAD_PREFIX.encode() + body)):
+            raise ValueError("Bad QR signature")
+        reg_end = 1 + body[0]
+        try:
+            return body[1:reg_end].decode(), body[reg_end:].decode()
+        except UnicodeDecodeError:
+            raise ValueError("Malformed QR payload")
+
+    raise ValueError("Unknown QR payload format")
+
+
+def qr_etag(payload: str) -> str:
+    # Rendering is deterministic, so the payload alone identifies the image
+    digest = hashlib.sha256(f"{QR_RENDER_VERSION}:{payload}".encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def render_qr_png(payload: str) -> bytes:
+    import qrcode
+
+    img = qrcode.make(payload)
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class QRCache:
+    """Size-bounded LRU of rendered PNGs, keyed by ETag."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            png = self._items.get(key)
+            if png is not None:
+                self._items.move_to_end(key)
+            return png
+
+    def put(self, key: str, png: bytes):
+        if len(png) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._items[key] = png
+            self.size += len(png)
+            while self.size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= len(evicted)
+
+    def __len__(self):
+        return len(self._items)
+
+
+class QRRenderer:
+    """Renders QR codes on demand on a bounded process pool.
+
+    Images are served from the in-memory LRU first, then from the optional
+    content-addressed disk cache, and only rendered when both miss.
+    Concurrent requests for the same image share a single render.
+    """
+
+    def __init__(self, max_workers: int, cache: QRCache, disk_dir=None):
+        self.max_workers = max_workers
+        self.cache = cache
+        self.disk_dir = disk_dir
+        self._executor = None
+        self._lock = threading.Lock()
+        self._inflight = {}
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _disk_path(self, etag: str) -> str:
+        digest = etag.strip('"')
+        return os.path.join(self.disk_dir, f"{digest}.png")
+
+    def _read_disk(self, etag: str):
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._disk_path(etag), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_disk(self, etag: str, png: bytes):
+        if not self.disk_dir:
+            return
+        path = self._disk_path(etag)
+        os.makedirs(self.disk_dir, exist_ok=True)
+        # Write to a temp file first so readers never see half a PNG
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(png)
+        os.replace(tmp_path, path)
+
+    async def render(self, payload: str, etag: str = None) -> bytes:
+        etag = etag or qr_etag(payload)
+        png = self.cache.get(etag)
+        if png is not None:
+            return png
+
+        if self.disk_dir:
+            png = await asyncio.to_thread(self._read_disk, etag)
+            if png is not None:
+                self.cache.put(etag, png)
+                return png
+
+        with self._lock:
+            future = self._inflight.get(etag)
+            owner = future is None
+            if owner:
+                future = self._get_executor().submit(render_qr_png, payload)
+                self._inflight[etag] = future
+        try:
+            png = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)), settings.QR_RENDER_TIMEOUT
+            )
+        finally:
+            if owner:
+                with self._lock:
+                    self._inflight.pop(etag, None)
+
+        if owner:
+            self.cache.put(etag, png)
+            if self.disk_dir:
+                await asyncio.to_thread(self._write_disk, etag, png)
+        return png
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+qr_renderer = QRRenderer(
+    max_workers=settings.QR_RENDER_WORKERS,
+    cache=QRCache(max_bytes=settings.QR_CACHE_MAX_BYTES),
+    disk_dir=QR_DIR if settings.QR_DISK_CACHE else None,
+)
@@ -0,0 +1,255 @@
+# backend/registration_queue.py
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from fastapi import HTTPException
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.config import settings
+from backend.crud import create_registration, registration_times, upsert_user
+from backend.database import open_session
+from backend.models import Event, Registration, REGISTRATION_CONFIRMED, REGISTRATION_WAITLISTED
+from backend.schemas import RegistrationCreate, RegistrationOut
+from backend.qr import qr_url
+from backend import analytics, stats
+
+logger = logging.getLogger(__name__)
+
+
+class RegistrationQueueFull(Exception):
+    """Raised when the write-behind queue has no room for another registration."""
+
+
+class Ticket:
+    __slots__ = ("id", "data", "result", "error", "expires_at")
+
+    def __init__(self, data: RegistrationCreate):
+        self.id = str(uuid.uuid4())
+        self.data = data
+        self.result = None
+        self.error = None
+        self.expires_at = None
+
+
+async def register_batch(db: AsyncSession, tickets: list):
+    """Register a batch of tickets in one transaction, resolving each ticket.
+
+    Same rules as crud.create_registration, but missing events and
+    duplicates are found up front and the counters are bumped once per
+    batch. Anything unexpected
+    (such as a racing insert tripping the unique index) propagates with
+    the tickets unresolved, so the caller can retry them one by one.
+    """
+    outcomes = {}
+    pending = []
+    seen = set()
+    users_created = 0
+    users = {}
+    event_ids = {ticket.data.event_id for ticket in tickets}
+    known_events = set(await db.scalars(select(Event.id).where(Event.id.in_(event_ids))))
+    for ticket in tickets:
+        data = ticket.data
+        if data.event_id not in known_events:
+            outcomes[ticket.id] = HTTPException(status_code=404, detail="Event not found")
+            continue
+        if (data.email, data.event_id) in seen:
+            outcomes[ticket.id] = HTTPException(status_code=400, detail="User already registered for this event")
+            continue
+        seen.add((data.email, data.event_id))
+        if data.email not in users:
+            users[data.email], created = await upsert_user(
+                db,
+                user_id=data.user_id if data.user_id else str(uuid.uuid4()),
+                name=data.name,
+                email=data.email
+            )
+            users_created += int(created)
+        pending.append(ticket)
+
+    pairs = {(users[t.data.email].id, t.data.event_id) for t in pending}
+    existing = set()
+    if pairs:
+        existing = set((await db.execute(
+            select(Registration.user_id, Registration.event_id).where(
+                tuple_(Registration.user_id, Registration.event_id).in_(pairs)
+            )
+        )).all())
+
+    by_event = defaultdict(list)
+    for ticket in pending:
+        if (users[ticket.data.email].id, ticket.data.event_id) in existing:
+            outcomes[ticket.id] = HTTPException(status_code=400, detail="User already registered for this event")
+        else:
+            by_event[ticket.data.event_id].append(ticket)
+
+    # One seat claim per event; tickets past capacity are waitlisted in arrival order
+    rows = []
+    times = iter(registration_times(sum(len(event_tickets) for event_tickets in by_event.values())))
+    for event_id, event_tickets in by_event.items():
+        claimed = await stats.claim_seats(db, event_id, len(event_tickets))
+        for i, ticket in enumerate(event_tickets):
+            if claimed is None:
+                outcomes[ticket.id] = HTTPException(status_code=404, detail="Event not found")
+                continue
+            data, user = ticket.data, users[ticket.data.email]
+            reg_id = str(uuid.uuid4())
+            status = REGISTRATION_CONFIRMED if i < claimed else REGISTRATION_WAITLISTED
+            row = {
+                "id": reg_id,
+                "user_id": user.id,
+                "event_id": event_id,
+                "team_name": data.team_name,
+                "phone": data.phone,
+                "qr_code": qr_url(reg_id),
+                "status": status,
+                "registered_at": next(times),
+            }
+            rows.append(row)
+            outcomes[ticket.id] = RegistrationOut.model_validate({**row, "user": user._mapping})
+
+    if rows:
+        await db.execute(insert(Registration), rows)
+        await analytics.record(db, [(row["event_id"], row["registered_at"]) for row in rows])
+    await stats.bump(db, registrations=len(rows), users=users_created)
+    await db.commit()
+    return outcomes
+
+
+class RegistrationQueue:
+    """Bounded write-behind queue for POST /register.
+
+    Registrations are flushed once `batch_size` are waiting or `window`
+    seconds after the first one arrived, whichever comes first, so a burst
+    costs one commit per batch instead of one per request. Results are kept
+    on their ticket for `ticket_ttl` seconds after the flush.
+    """
+
+    def __init__(self, enabled: bool, max_size: int, batch_size: int, window: float, ticket_ttl: float):
+        self.enabled = enabled
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.window = window
+        self.ticket_ttl = ticket_ttl
+        self.flushed_batches = 0
+        self.rejected = 0
+        self._queue = None
+        self._worker = None
+        self._closing = False
+        self._tickets = {}
+        # Finished tickets in expiry order
+        self._finished = OrderedDict()
+
+    def start(self):
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._closing = False
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop taking registrations and flush everything already accepted."""
+        if self._worker is None:
+            return
+        self._closing = True
+        await self._queue.join()
+        self._worker.cancel()
+        self._worker = None
+
+    def submit(self, data: RegistrationCreate) -> str:
+        if self._worker is None or self._closing:
+            raise RegistrationQueueFull()
+        ticket = Ticket(data)
+        try:
+            self._queue.put_nowait(ticket)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise RegistrationQueueFull()
+        self._tickets[ticket.id] = ticket
+        self._expire_tickets()
+        return ticket.id
+
+    def get_ticket(self, ticket_id: str):
+        self._expire_tickets()
+        return self._tickets.get(ticket_id)
+
+    def _expire_tickets(self):
+        now = time.monotonic()
+        while self._finished:
+            ticket_id, expires_at = next(iter(self._finished.items()))
+            if expires_at > now:
+                break
+            del self._finished[ticket_id]
+            self._tickets.pop(ticket_id, None)
+
+    def _finish(self, ticket: Ticket, outcome):
+        if isinstance(outcome, HTTPException):
+            ticket.error = outcome
+        else:
+            ticket.result = outcome
+        ticket.data = None
+        self._finished[ticket.id] = time.monotonic() + self.ticket_ttl
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: list):
+        # Tickets without an outcome when this is done get a 500
+        outcomes = {}
+        try:
+            async with open_session() as db:
+                try:
+                    outcomes = await register_batch(db, batch)
+                except Exception:
+                    await db.rollback()
+                    logger.warning("Registration batch of %d failed, retrying one by one", len(batch), exc_info=True)
+                    for ticket in batch:
+                        try:
+                            outcomes[ticket.id] = await create_registration(db, ticket.data)
+                        except HTTPException as e:
+                            outcomes[ticket.id] = e
+                        except Exception:
+                            # Tickets already committed keep their results
+                            logger.exception("Registration ticket %s could not be written", ticket.id)
+                            await db.rollback()
+            self.flushed_batches += 1
+        except Exception:
+            logger.exception("Registration batch of %d could not be written", len(batch))
+        for ticket in batch:
+            self._finish(ticket, outcomes.get(ticket.id) or HTTPException(
+                status_code=500, detail="Registration could not be saved"
+            ))
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_size": self.max_size,
+            "tickets": len(self._tickets),
+            "flushed_batches": self.flushed_batches,
+            "rejected": self.rejected,
+        }
+
+
+registration_queue = RegistrationQueue(
+    enabled=settings.REGISTRATION_QUEUE,
+    max_size=settings.REGISTRATION_QUEUE_SIZE,
+    batch_size=settings.REGISTRATION_BATCH_SIZE,
+    window=settings.REGISTRATION_BATCH_WINDOW,
+    ticket_ttl=settings.REGISTRATION_TICKET_TTL,
+)
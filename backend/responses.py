@@ -0,0 +1,38 @@
+# backend/responses.py
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from backend.config import settings
+
+
+def _default(obj):
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson; pydantic models may appear anywhere in the content."""
+
+    def render(self, content) -> bytes:
+        import orjson
+
+        # OPT_UTC_Z matches pydantic's "Z" suffix for UTC datetimes
+        return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
+
+
+def trusted(content, response: Response = None):
+    """Mark a handler's return value as already validated.
+
+    With FAST_JSON on it is rendered directly, skipping the response_model
+    validation and serialization FastAPI would otherwise repeat. Only pass
+    models the app built itself; the declared response_model still
+    documents the shape. Headers set on the handler's injected `response`
+    are kept either way.
+    """
+    if settings.FAST_JSON:
+        return FastJSONResponse(content, headers=dict(response.headers) if response else None)
+    return content
+
+
+default_response_class = FastJSONResponse if settings.FAST_JSON else JSONResponse
@@ -1,7 +1,8 @@
 # backend/routers/user.py
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from backend import models, database
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend import models, database, stats
 from pydantic import BaseModel, EmailStr
 import uuid
 
@@ -15,9 +16,9 @@ class UserCreate(BaseModel):
     email: EmailStr
 
 @router.post("/")
-def create_user(user: UserCreate, db: Session = Depends(database.get_db)):
+async def create_user(user: UserCreate, db: AsyncSession = Depends(database.get_db)):
     # Check if user already exists
-    db_user = db.query(models.User).filter(models.User.email == user.email).first()
+    db_user = await db.scalar(select(models.User).where(models.User.email == user.email))
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
 
@@ -27,6 +28,7 @@ def create_user(user: UserCreate, db: Session = Depends(database.get_db)):
         email=user.email
     )
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await stats.bump(db, users=1)
+    await db.commit()
+    await db.refresh(new_user)
     return new_user
@@ -0,0 +1,72 @@
+# backend/routes/admin_analytics.py
+from datetime import datetime, timedelta
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.database import get_db
+from backend.crud import require_event
+from backend.schemas import RegistrationSeries, RegistrationBucket
+from backend.auth.dependencies import get_current_admin
+from backend import analytics
+
+router = APIRouter(
+    prefix="/admin/events",
+    tags=["Admin"]
+)
+
+DEFAULT_BUCKETS = 60
+MAX_BUCKETS = 1440
+
+
+@router.get("/{event_id}/analytics/registrations", response_model=RegistrationSeries)
+async def get_registration_series(
+    event_id: str,
+    resolution: str = Query("minute", pattern="^(minute|hour)$"),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    current_admin: str = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    """Registrations per bucket in [start, end), zero-filled, with running totals.
+
+    Bounds with an offset are converted to UTC, naive ones are taken as UTC,
+    and both widen to bucket edges; the default window is the last 60
+    buckets up to now.
+    """
+    await require_event(db, event_id)
+    seconds = analytics.RESOLUTIONS[resolution]
+    width = timedelta(seconds=seconds)
+    # Round end up so the bucket containing it (by default the current one) is included
+    end = analytics.utc_naive(end) if end else datetime.utcnow()
+    aligned_end = analytics.bucket_start(end, seconds)
+    end = aligned_end if aligned_end == end else aligned_end + width
+    start = analytics.bucket_start(analytics.utc_naive(start), seconds) if start else end - width * DEFAULT_BUCKETS
+    if start >= end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+    if (end - start) / width > MAX_BUCKETS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BUCKETS} buckets per request")
+
+    cumulative, rows = await analytics.series(db, event_id, resolution, start, end)
+    counts = dict(rows)
+    buckets = []
+    bucket = start
+    while bucket < end:
+        registrations = counts.get(bucket, 0)
+        cumulative += registrations
+        buckets.append(RegistrationBucket(start=bucket, registrations=registrations, cumulative=cumulative))
+        bucket += width
+
+    return RegistrationSeries(
+        event_id=event_id, resolution=resolution, start=start, end=end, total=cumulative, buckets=buckets
+    )
+
+
+@router.post("/{event_id}/analytics/rebuild")
+async def rebuild_registration_rollups(
+    event_id: str,
+    current_admin: str = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    await require_event(db, event_id)
+    counted = await analytics.rebuild(db, event_id)
+    return {"event_id": event_id, "registrations": counted}
@@ -1,27 +1,69 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from ..schemas import AdminCreate, AdminLogin
 from ..models import Admin
 from ..database import get_db
-from ..auth.jwt import create_access_token
-from ..auth.hashing import hash_password, verify_password
+from ..auth.jwt import create_access_token, revoke_token, token_cache
+from ..auth.dependencies import get_current_admin, oauth2_scheme
+from ..auth.hashing import HashingBusy, hashing_pool, hash_password_async, verify_and_update_async
 
 router = APIRouter()
 
+def _busy():
+    return HTTPException(
+        status_code=503,
+        detail="Too many concurrent logins, try again shortly",
+        headers={"Retry-After": "1"}
+    )
+
 @router.post("/admin/signup")
-def signup(admin: AdminCreate, db: Session = Depends(get_db)):
-    existing = db.query(Admin).filter(Admin.username == admin.username).first()
+async def signup(admin: AdminCreate, db: AsyncSession = Depends(get_db)):
+    existing = await db.scalar(select(Admin).where(Admin.username == admin.username))
     if existing:
         raise HTTPException(status_code=400, detail="Username already exists")
-    new_admin = Admin(username=admin.username, hashed_password=hash_password(admin.password))
+    try:
+        hashed_password = await hash_password_async(admin.password)
+    except HashingBusy:
+        raise _busy()
+    new_admin = Admin(username=admin.username, hashed_password=hashed_password)
     db.add(new_admin)
-    db.commit()
+    await db.commit()
     return {"msg": "Admin created"}
 
 @router.post("/admin/login")
-def login(admin: AdminLogin, db: Session = Depends(get_db)):
-    db_admin = db.query(Admin).filter(Admin.username == admin.username).first()
-    if not db_admin or not verify_password(admin.password, db_admin.hashed_password):
+async def login(admin: AdminLogin, db: AsyncSession = Depends(get_db)):
+    db_admin = await db.scalar(select(Admin).where(Admin.username == admin.username))
+    if not db_admin:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    try:
+        valid, new_hash = await verify_and_update_async(admin.password, db_admin.hashed_password)
+    except HashingBusy:
+        raise _busy()
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid credentials")
+    if new_hash:
+        # Stored at an old cost factor; upgrade it while we have the plaintext
+        db_admin.hashed_password = new_hash
+        await db.commit()
     token = create_access_token({"sub": db_admin.username})
     return {"access_token": token, "token_type": "bearer"}
+
+@router.post("/admin/logout")
+async def logout(token: str = Depends(oauth2_scheme), current_admin: str = Depends(get_current_admin)):
+    revoke_token(token)
+    return {"msg": "Logged out"}
+
+@router.post("/admin/{username}/revoke-tokens")
+async def revoke_admin_tokens(username: str, current_admin: str = Depends(get_current_admin)):
+    # Forces every token issued so far for `username` to expire
+    token_cache.revoke_subject(username)
+    return {"msg": f"Tokens for {username} revoked"}
+
+@router.get("/admin/auth/token-cache")
+async def get_token_cache_stats(current_admin: str = Depends(get_current_admin)):
+    return token_cache.stats()
+
+@router.get("/admin/auth/hashing")
+async def get_hashing_stats(current_admin: str = Depends(get_current_admin)):
+    return hashing_pool.stats()
@@ -1,12 +1,27 @@
 # backend/routes/admin_dashboard.py
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from backend.database import get_db
-from backend.models import Event, Registration, User, Admin
-from backend.schemas import EventCreate, EventOut, RegistrationOut, UserOut
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.database import get_db, open_session, engine, async_engine, pool_status
+from backend.models import (
+    Event, EventStats, GlobalStats, Registration, RegistrationRollup, User, Admin, REGISTRATION_CONFIRMED
+)
+from backend.schemas import EventCreate, EventOut, RegistrationOut, UserOut, Page
 from backend.auth.dependencies import get_current_admin
+from backend.pagination import PageParams, paginate
+from backend import analytics, stats
+from backend.config import settings
+from backend.crud import select_registrations, registration_out
+from backend.cache import events_cache, etag_matches, weak_etag
+from backend.registration_queue import registration_queue
+from backend.checkin import checkin_index
+from backend.responses import trusted
 from datetime import datetime
+from typing import Optional
+import csv
+import io
+import json
 import uuid
 
 router = APIRouter(
@@ -14,52 +29,92 @@ router = APIRouter(
     tags=["Admin"]
 )
 
+async def _not_modified(request: Request, response: Response, db: AsyncSession, counter, timestamp):
+    """Tag a listing with a weak ETag from its table's version.
+
+    Returns a ready 304 when the client's copy is current, so nothing is
+    queried or serialized; otherwise sets the headers on `response`.
+    """
+    version = await stats.table_version(db, counter, timestamp)
+    # The query string carries the filters, page size and cursor
+    etag = weak_etag(request.url.path, request.url.query, version)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
 # Dashboard overview
 @router.get("/dashboard")
-def get_dashboard_stats(
+async def get_dashboard_stats(
     current_admin: str = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    total_events = db.query(Event).count()
-    total_registrations = db.query(Registration).count()
-    total_users = db.query(User).count()
-    
+    totals = await stats.get_global_stats(db)
+
     # Recent registrations
-    recent_registrations = db.query(Registration).join(User).join(Event).order_by(
+    recent_registrations = (await db.execute(select(
+        Registration.id, User.name, Event.title, Registration.registered_at
+    ).join(User, Registration.user_id == User.id).join(Event, Registration.event_id == Event.id).order_by(
         Registration.registered_at.desc()
-    ).limit(5).all()
+    ).limit(5))).all()
     
     return {
         "message": f"Welcome, Admin {current_admin}!",
         "stats": {
-            "total_events": total_events,
-            "total_registrations": total_registrations,
-            "total_users": total_users
+            "total_events": totals.total_events,
+            "total_registrations": totals.total_registrations,
+            "total_users": totals.total_users
         },
         "recent_registrations": [
             {
                 "id": reg.id,
-                "user_name": reg.user.name,
-                "event_title": reg.event.title,
+                "user_name": reg.name,
+                "event_title": reg.title,
                 "registered_at": reg.registered_at
             }
             for reg in recent_registrations
         ]
     }
 
+# Database connection pools
+@router.get("/db/pool")
+async def get_pool_status(current_admin: str = Depends(get_current_admin)):
+    return {
+        "async": settings.DB_ASYNC,
+        "engines": {
+            "async": pool_status(async_engine),
+            "sync": pool_status(engine)
+        }
+    }
+
+# Write-behind registration queue
+@router.get("/registrations/queue")
+async def get_registration_queue_status(current_admin: str = Depends(get_current_admin)):
+    return registration_queue.stats()
+
 # Event Management
-@router.get("/events", response_model=list[EventOut])
-def get_all_events(
+@router.get("/events", response_model=Page[EventOut])
+async def get_all_events(
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    page: PageParams = Depends(),
     current_admin: str = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    return db.query(Event).all()
+    stmt = select(Event)
+    if date_from:
+        stmt = stmt.where(Event.date >= date_from)
+    if date_to:
+        stmt = stmt.where(Event.date < date_to)
+    events, next_cursor = await paginate(db, stmt, [Event.date, Event.id], page)
+    return Page(items=events, next_cursor=next_cursor)
 
 @router.post("/events", response_model=EventOut)
-def create_event(
+async def create_event(
     event: EventCreate,
     current_admin: str = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     db_event = Event(
         id=str(uuid.uuid4()),
@@ -67,22 +122,25 @@ def create_event(
         description=event.description,
         date=event.date,
         max_team_size=event.max_team_size,
+        capacity=event.capacity,
         solo=event.solo,
         created_by=current_admin
     )
     db.add(db_event)
-    db.commit()
-    db.refresh(db_event)
+    db.add(EventStats(event_id=db_event.id, registration_count=0, seats_remaining=event.capacity))
+    await stats.bump(db, events=1)
+    await db.commit()
+    await events_cache.invalidate()
     return db_event
 
 @router.put("/events/{event_id}", response_model=EventOut)
-def update_event(
+async def update_event(
     event_id: str,
     event: EventCreate,
     current_admin: str = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    db_event = db.query(Event).filter(Event.id == event_id).first()
+    db_event = await db.get(Event, event_id)
     if not db_event:
         raise HTTPException(status_code=404, detail="Event not found")
     
@@ -91,135 +149,226 @@ def update_event(
     db_event.date = event.date
     db_event.max_team_size = event.max_team_size
     db_event.solo = event.solo
+    if event.capacity != db_event.capacity:
+        db_event.capacity = event.capacity
+        await stats.set_capacity(db, event_id, event.capacity)
     
-    db.commit()
-    db.refresh(db_event)
+    await db.commit()
+    await events_cache.invalidate()
     return db_event
 
 @router.delete("/events/{event_id}")
-def delete_event(
+async def delete_event(
     event_id: str,
     current_admin: str = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    db_event = db.query(Event).filter(Event.id == event_id).first()
+    db_event = await db.get(Event, event_id)
     if not db_event:
         raise HTTPException(status_code=404, detail="Event not found")
     
     # Check if there are registrations for this event
-    registrations_count = db.query(Registration).filter(Registration.event_id == event_id).count()
+    registrations_count = await stats.get_event_registration_count(db, event_id)
     if registrations_count > 0:
         raise HTTPException(
             status_code=400, 
             detail=f"Cannot delete event with {registrations_count} registrations"
         )
     
-    db.delete(db_event)
-    db.commit()
+    await db.execute(delete(EventStats).where(EventStats.event_id == event_id))
+    # Deleted registrations can leave zero-count buckets behind
+    await db.execute(delete(RegistrationRollup).where(RegistrationRollup.event_id == event_id))
+    await db.delete(db_event)
+    await stats.bump(db, events=-1)
+    await db.commit()
+    await events_cache.invalidate()
     return {"message": "Event deleted successfully"}
 
 # Registration Management
-@router.get("/registrations", response_model=list[RegistrationOut])
-def get_all_registrations(
+@router.get("/registrations", response_model=Page[RegistrationOut])
+async def get_all_registrations(
+    request: Request,
+    response: Response,
+    event_id: Optional[str] = None,
+    registered_from: Optional[datetime] = None,
+    registered_to: Optional[datetime] = None,
+    page: PageParams = Depends(),
     current_admin: str = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    registrations = db.query(Registration).join(User).all()
-    return [
-        RegistrationOut(
-            id=reg.id,
-            user={
-                "id": reg.user.id,
-                "name": reg.user.name,
-                "email": reg.user.email
-            },
-            team_name=reg.team_name,
-            event_id=reg.event_id,
-            qr_code=reg.qr_code
-        )
-        for reg in registrations
-    ]
+    not_modified = await _not_modified(request, response, db, GlobalStats.total_registrations, Registration.updated_at)
+    if not_modified:
+        return not_modified
+
+    stmt = select_registrations()
+    if event_id:
+        stmt = stmt.where(Registration.event_id == event_id)
+    if registered_from:
+        stmt = stmt.where(Registration.registered_at >= registered_from)
+    if registered_to:
+        stmt = stmt.where(Registration.registered_at < registered_to)
+    registrations, next_cursor = await paginate(
+        db, stmt, [Registration.registered_at, Registration.id], page, descending=True
+    )
+    items = [registration_out(row) for row in registrations]
+    return trusted(Page(items=items, next_cursor=next_cursor), response)
 
-@router.get("/registrations/event/{event_id}", response_model=list[RegistrationOut])
-def get_event_registrations_admin(
+@router.get("/registrations/event/{event_id}", response_model=Page[RegistrationOut])
+async def get_event_registrations_admin(
     event_id: str,
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
     current_admin: str = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    registrations = db.query(Registration).join(User).filter(
+    not_modified = await _not_modified(request, response, db, GlobalStats.total_registrations, Registration.updated_at)
+    if not_modified:
+        return not_modified
+
+    stmt = select_registrations().where(
         Registration.event_id == event_id
-    ).all()
-    
-    return [
-        RegistrationOut(
-            id=reg.id,
-            user={
-                "id": reg.user.id,
-                "name": reg.user.name,
-                "email": reg.user.email
-            },
-            team_name=reg.team_name,
-            event_id=reg.event_id,
-            qr_code=reg.qr_code
-        )
-        for reg in registrations
-    ]
+    )
+    registrations, next_cursor = await paginate(
+        db, stmt, [Registration.registered_at, Registration.id], page, descending=True
+    )
+
+    items = [registration_out(row) for row in registrations]
+    return trusted(Page(items=items, next_cursor=next_cursor), response)
+
+EXPORT_COLUMNS = [
+    "registration_id", "event_id", "user_id", "name", "email",
+    "team_name", "phone", "qr_code", "status", "registered_at"
+]
+EXPORT_CHUNK_SIZE = 1000
+
+async def _export_rows(event_id: str, format: str):
+    stmt = select(
+        Registration.id, Registration.event_id, User.id, User.name, User.email,
+        Registration.team_name, Registration.phone, Registration.qr_code, Registration.status,
+        Registration.registered_at
+    ).join(User, Registration.user_id == User.id).where(
+        Registration.event_id == event_id
+    ).order_by(Registration.registered_at, Registration.id)
+
+    if format == "csv":
+        yield ",".join(EXPORT_COLUMNS) + "\n"
+
+    async with open_session() as db:
+        # yield_per streams from a server-side cursor, so memory stays flat
+        result = await db.stream(stmt.execution_options(yield_per=EXPORT_CHUNK_SIZE))
+        async for rows in result.partitions():
+            buf = io.StringIO()
+            if format == "csv":
+                writer = csv.writer(buf)
+                writer.writerows(
+                    [*row[:-1], row[-1].isoformat() if row[-1] else ""] for row in rows
+                )
+            else:
+                for row in rows:
+                    record = dict(zip(EXPORT_COLUMNS, row))
+                    if record["registered_at"]:
+                        record["registered_at"] = record["registered_at"].isoformat()
+                    buf.write(json.dumps(record) + "\n")
+            yield buf.getvalue()
+
+@router.get("/events/{event_id}/registrations/export")
+async def export_event_registrations(
+    event_id: str,
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    current_admin: str = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    if not await db.scalar(select(Event.id).where(Event.id == event_id)):
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        _export_rows(event_id, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="registrations-{event_id}.{format}"'}
+    )
 
 @router.delete("/registrations/{registration_id}")
-def delete_registration(
+async def delete_registration(
     registration_id: str,
     current_admin: str = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    registration = db.query(Registration).filter(Registration.id == registration_id).first()
+    registration = await db.get(Registration, registration_id)
     if not registration:
         raise HTTPException(status_code=404, detail="Registration not found")
     
-    db.delete(registration)
-    db.commit()
+    await db.delete(registration)
+    # Same lock order as the create paths: event_stats, rollups, then global_stats
+    await stats.release_seat(db, registration.event_id, registration.status == REGISTRATION_CONFIRMED)
+    await analytics.record(db, [(registration.event_id, registration.registered_at)], delta=-1)
+    await stats.bump(db, registrations=-1)
+    await db.commit()
+    checkin_index.discard(registration.event_id, registration_id)
     return {"message": "Registration deleted successfully"}
 
 # User Management
-@router.get("/users", response_model=list[UserOut])
-def get_all_users(
+@router.get("/users", response_model=Page[UserOut])
+async def get_all_users(
+    request: Request,
+    response: Response,
+    registered_from: Optional[datetime] = None,
+    registered_to: Optional[datetime] = None,
+    page: PageParams = Depends(),
     current_admin: str = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    return db.query(User).all()
+    # Users are never edited, so their newest registered_at stands in for updated_at
+    not_modified = await _not_modified(request, response, db, GlobalStats.total_users, User.registered_at)
+    if not_modified:
+        return not_modified
+
+    stmt = select(User)
+    if registered_from:
+        stmt = stmt.where(User.registered_at >= registered_from)
+    if registered_to:
+        stmt = stmt.where(User.registered_at < registered_to)
+    users, next_cursor = await paginate(db, stmt, [User.registered_at, User.id], page, descending=True)
+    return Page(items=users, next_cursor=next_cursor)
 
 @router.get("/users/{user_id}", response_model=UserOut)
-def get_user(
+async def get_user(
     user_id: str,
     current_admin: str = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
 # Event Statistics
 @router.get("/events/{event_id}/stats")
-def get_event_stats(
+async def get_event_stats(
     event_id: str,
     current_admin: str = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = await db.get(Event, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     
-    registration_count = db.query(Registration).filter(Registration.event_id == event_id).count()
+    counters = await db.get(EventStats, event_id)
+    if counters is None:
+        await stats.reconcile(db)
+        counters = await db.get(EventStats, event_id)
     
     return {
         "event": {
             "id": event.id,
             "title": event.title,
             "date": event.date,
-            "max_team_size": event.max_team_size
+            "max_team_size": event.max_team_size,
+            "capacity": event.capacity
         },
         "registrations": {
-            "total": registration_count,
-            "available_spots": max(0, event.max_team_size - registration_count) if event.max_team_size > 0 else "unlimited"
+            "total": counters.registration_count,
+            "available_spots": max(0, counters.seats_remaining) if event.capacity is not None else "unlimited"
         }
     }
\ No newline at end of file
@@ -0,0 +1,252 @@
+# backend/routes/admin_import.py
+import codecs
+import csv
+import json
+import uuid
+from collections import defaultdict
+from typing import Optional
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from backend.database import open_session
+from backend.models import Event, Registration, User, REGISTRATION_CONFIRMED, REGISTRATION_WAITLISTED
+from backend.schemas import RegistrationCreate
+from backend.auth.dependencies import get_current_admin
+from backend.config import settings
+from backend.crud import registration_times
+from backend.qr import qr_url
+from backend import analytics, stats
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"]
+)
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+
+def _detect_format(upload: UploadFile, format: Optional[str]) -> str:
+    if format:
+        return format
+    filename = (upload.filename or "").lower()
+    content_type = (upload.content_type or "").lower()
+    if filename.endswith((".ndjson", ".jsonl")) or "ndjson" in content_type:
+        return "ndjson"
+    return "csv"
+
+
+def _iter_rows(upload: UploadFile, format: str):
+    """Yield (row_number, dict) pairs without reading the whole upload into memory."""
+    # The multipart parser spools large uploads to disk, so this reads incrementally
+    lines = codecs.iterdecode(upload.file, "utf-8-sig")
+    if format == "csv":
+        for row_number, row in enumerate(csv.DictReader(lines), start=1):
+            yield row_number, row
+    else:
+        row_number = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            row_number += 1
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                row = e
+            yield row_number, row
+
+
+def _until_unreadable(rows):
+    """Pass (row_number, row) pairs through, ending with the error if the upload can't be decoded or parsed.
+
+    A bad byte sequence or broken CSV quoting leaves the reader unable to
+    resync, so the error becomes the last row rather than escaping the report.
+    """
+    rows = iter(rows)
+    row_number = 0
+    while True:
+        try:
+            row_number, row = next(rows)
+        except StopIteration:
+            return
+        except (UnicodeDecodeError, csv.Error) as e:
+            yield row_number + 1, e
+            return
+        yield row_number, row
+
+
+def _batched(rows, size: int):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _parse_row(row, default_event_id: Optional[str]) -> RegistrationCreate:
+    if isinstance(row, UnicodeDecodeError):
+        raise ValueError("Unreadable upload: not UTF-8 text; no rows after this one were read")
+    if isinstance(row, csv.Error):
+        raise ValueError(f"Unreadable CSV: {row}; no rows after this one were read")
+    if isinstance(row, Exception):
+        raise ValueError(f"Invalid JSON: {row}")
+    if not isinstance(row, dict):
+        raise ValueError("Row must be an object")
+    data = {k.strip(): (v.strip() if isinstance(v, str) else v) for k, v in row.items() if k}
+    data = {k: v for k, v in data.items() if v not in ("", None)}
+    if default_event_id and "event_id" not in data:
+        data["event_id"] = default_event_id
+    return RegistrationCreate(**data)
+
+
+async def _import_batch(db: AsyncSession, batch, default_event_id: Optional[str], known_events: set):
+    """Insert one batch of rows in a single transaction and return its results."""
+    results = {}
+    parsed = []
+    for row_number, row in batch:
+        try:
+            parsed.append((row_number, _parse_row(row, default_event_id)))
+        except (ValidationError, ValueError, TypeError) as e:
+            message = e.errors()[0]["msg"] if isinstance(e, ValidationError) else str(e)
+            results[row_number] = {"row": row_number, "status": "error", "error": message}
+
+    # Resolve events once per import
+    unknown_events = {data.event_id for _, data in parsed} - known_events
+    if unknown_events:
+        known_events.update(await db.scalars(select(Event.id).where(Event.id.in_(unknown_events))))
+
+    # Resolve existing users by email in bulk
+    emails = {data.email for _, data in parsed}
+    users = {
+        email: user_id
+        for user_id, email in await db.execute(select(User.id, User.email).where(User.email.in_(emails)))
+    }
+    # A supplied user_id that another user already has would fail the whole
+    # batch on the primary key, so those rows are rejected up front
+    supplied_ids = {data.user_id for _, data in parsed if data.user_id and data.email not in users}
+    taken_ids = set()
+    if supplied_ids:
+        taken_ids = set(await db.scalars(select(User.id).where(User.id.in_(supplied_ids))))
+    new_users = []
+    for row_number, data in parsed:
+        if data.email not in users and data.event_id in known_events:
+            user_id = data.user_id or str(uuid.uuid4())
+            if user_id in taken_ids:
+                results[row_number] = {
+                    "row": row_number, "status": "error", "error": "user_id already belongs to another user"
+                }
+                continue
+            taken_ids.add(user_id)
+            users[data.email] = user_id
+            new_users.append({"id": user_id, "name": data.name, "email": data.email})
+
+    # Skip pairs that are already registered
+    pairs = {(users[data.email], data.event_id) for _, data in parsed if data.email in users}
+    existing = set()
+    if pairs:
+        existing = set((await db.execute(
+            select(Registration.user_id, Registration.event_id).where(
+                tuple_(Registration.user_id, Registration.event_id).in_(pairs)
+            )
+        )).all())
+
+    new_registrations = defaultdict(list)
+    for row_number, data in parsed:
+        if row_number in results:
+            continue
+        if data.event_id not in known_events:
+            results[row_number] = {"row": row_number, "status": "error", "error": "Event not found"}
+            continue
+        pair = (users[data.email], data.event_id)
+        if pair in existing:
+            results[row_number] = {"row": row_number, "status": "duplicate", "user_id": pair[0]}
+            continue
+        existing.add(pair)
+        reg_id = str(uuid.uuid4())
+        results[row_number] = {
+            "row": row_number, "status": "created", "registration_id": reg_id, "user_id": pair[0]
+        }
+        new_registrations[data.event_id].append(({
+            "id": reg_id,
+            "user_id": pair[0],
+            "event_id": data.event_id,
+            "team_name": data.team_name,
+            "phone": data.phone,
+            # QR codes are rendered on demand, nothing to generate here
+            "qr_code": qr_url(reg_id),
+        }, results[row_number]))
+
+    # One seat claim per event; rows beyond capacity are waitlisted in file order
+    registrations = []
+    times = iter(registration_times(sum(len(regs) for regs in new_registrations.values())))
+    for event_id, regs in new_registrations.items():
+        claimed = await stats.claim_seats(db, event_id, len(regs)) or 0
+        for i, (reg, result) in enumerate(regs):
+            reg["status"] = result["registration_status"] = (
+                REGISTRATION_CONFIRMED if i < claimed else REGISTRATION_WAITLISTED
+            )
+            reg["registered_at"] = next(times)
+            registrations.append(reg)
+
+    if new_users:
+        await db.execute(insert(User), new_users)
+    if registrations:
+        await db.execute(insert(Registration), registrations)
+        await analytics.record(db, [(reg["event_id"], reg["registered_at"]) for reg in registrations])
+    await stats.bump(db, registrations=len(registrations), users=len(new_users))
+    await db.commit()
+    return [results[row_number] for row_number, _ in batch]
+
+
+async def _import_report(upload: UploadFile, format: str, event_id: Optional[str], batch_size: int):
+    summary = {"rows": 0, "created": 0, "duplicate": 0, "error": 0}
+    known_events = set()
+    batches = _batched(_until_unreadable(_iter_rows(upload, format)), batch_size)
+    async with open_session() as db:
+        while True:
+            # Parsing reads the spooled file, so do it off the event loop
+            batch = await run_in_threadpool(next, batches, None)
+            if batch is None:
+                break
+            try:
+                results = await _import_batch(db, batch, event_id, known_events)
+            except Exception as e:
+                await db.rollback()
+                results = [
+                    {"row": row_number, "status": "error", "error": f"Batch failed: {e.__class__.__name__}"}
+                    for row_number, _ in batch
+                ]
+            for result in results:
+                summary["rows"] += 1
+                summary[result["status"]] += 1
+            yield "".join(json.dumps(result) + "\n" for result in results)
+    yield json.dumps({"summary": summary}) + "\n"
+
+
+@router.post("/registrations/import")
+async def import_registrations(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$"),
+    event_id: Optional[str] = None,
+    batch_size: int = Query(settings.IMPORT_BATCH_SIZE, ge=1, le=10000),
+    current_admin: str = Depends(get_current_admin)
+):
+    """Bulk-import registrations from a CSV or NDJSON upload.
+
+    Columns/keys: event_id, name, email, and optionally user_id, team_name,
+    phone. `event_id` may instead be given once as a query parameter.
+    The response is an NDJSON report with one line per input row, followed
+    by a summary line.
+    """
+    format = _detect_format(file, format)
+    if format not in IMPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="Unsupported import format")
+    return StreamingResponse(
+        _import_report(file, format, event_id, batch_size),
+        media_type="application/x-ndjson"
+    )
@@ -0,0 +1,78 @@
+# backend/routes/admin_search.py
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.database import get_db
+from backend.models import Event, Registration, User
+from backend.schemas import EventOut, RegistrationOut, UserOut, Page
+from backend.auth.dependencies import get_current_admin
+from backend.pagination import PageParams, paginate
+from backend.crud import select_registrations, registration_out
+from backend.responses import trusted
+from backend.search import search_clause, MIN_TERM_LENGTH
+
+router = APIRouter(
+    prefix="/admin/search",
+    tags=["Admin"]
+)
+
+
+class SearchParams:
+    """`q` and `match` query parameters shared by the search endpoints."""
+
+    def __init__(
+        self,
+        q: str = Query(..., min_length=MIN_TERM_LENGTH, max_length=100),
+        match: str = Query("contains", pattern="^(contains|prefix)$")
+    ):
+        self.q = q
+        self.match = match
+
+
+@router.get("/users", response_model=Page[UserOut])
+async def search_users(
+    search: SearchParams = Depends(),
+    page: PageParams = Depends(),
+    current_admin: str = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    stmt = select(User).where(
+        search_clause(db, User.__table__, [User.name, User.email], search.q, search.match)
+    )
+    users, next_cursor = await paginate(db, stmt, [User.registered_at, User.id], page, descending=True)
+    return Page(items=users, next_cursor=next_cursor)
+
+
+@router.get("/events", response_model=Page[EventOut])
+async def search_events(
+    search: SearchParams = Depends(),
+    page: PageParams = Depends(),
+    current_admin: str = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    stmt = select(Event).where(
+        search_clause(db, Event.__table__, [Event.title], search.q, search.match)
+    )
+    events, next_cursor = await paginate(db, stmt, [Event.date, Event.id], page)
+    return Page(items=events, next_cursor=next_cursor)
+
+
+@router.get("/registrations", response_model=Page[RegistrationOut])
+async def search_registrations(
+    event_id: Optional[str] = None,
+    search: SearchParams = Depends(),
+    page: PageParams = Depends(),
+    current_admin: str = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    stmt = select_registrations().where(
+        search_clause(db, Registration.__table__, [Registration.team_name, Registration.phone], search.q, search.match)
+    )
+    if event_id:
+        stmt = stmt.where(Registration.event_id == event_id)
+    registrations, next_cursor = await paginate(
+        db, stmt, [Registration.registered_at, Registration.id], page, descending=True
+    )
+    items = [registration_out(row) for row in registrations]
+    return trusted(Page(items=items, next_cursor=next_cursor))
@@ -0,0 +1,54 @@
+# backend/routes/checkin.py
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.database import get_db
+from backend.crud import require_event
+from backend.schemas import CheckInRequest, CheckInResult, CheckInSync
+from backend.auth.dependencies import get_current_admin
+from backend.checkin import checkin_index, check_in, sync_check_ins
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"]
+)
+
+# Load the event's confirmed registrations before the doors open
+@router.post("/events/{event_id}/checkin/preload")
+async def preload_check_in(
+    event_id: str,
+    current_admin: str = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    await require_event(db, event_id)
+    index = await checkin_index.load(db, event_id)
+    return {"event_id": event_id, "valid": len(index.valid), "checked_in": len(index.checked_in)}
+
+@router.get("/events/{event_id}/checkin")
+async def get_check_in_status(
+    event_id: str,
+    current_admin: str = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    await require_event(db, event_id)
+    index = await checkin_index.get_or_load(db, event_id)
+    return {"event_id": event_id, "valid": len(index.valid), "checked_in": len(index.checked_in)}
+
+@router.post("/events/{event_id}/checkin", response_model=CheckInResult)
+async def check_in_registration(
+    event_id: str,
+    scan: CheckInRequest,
+    current_admin: str = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    return await check_in(db, event_id, scan.payload)
+
+# Upload scans recorded while the scanner was offline
+@router.post("/events/{event_id}/checkin/sync", response_model=list[CheckInResult])
+async def sync_offline_check_ins(
+    event_id: str,
+    batch: CheckInSync,
+    current_admin: str = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    await require_event(db, event_id)
+    return await sync_check_ins(db, event_id, [(scan.payload, scan.scanned_at) for scan in batch.scans])
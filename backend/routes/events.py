@@ -1,35 +1,61 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from backend.database import SessionLocal
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.database import get_db
 from backend import models
 from backend import schemas
+from backend import stats
+from backend.pagination import PageParams, paginate
+from backend.cache import events_cache, etag_matches
+from datetime import datetime
+from typing import Optional
 import uuid
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+@router.get("/events", response_model=schemas.Page[schemas.EventOut])
+async def get_events(
+    request: Request,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db)
+):
+    # Read the version before querying, so a write that lands mid-query
+    # leaves this response cached under a version nobody asks for again
+    version = await events_cache.version()
+    key = f"{date_from}|{date_to}|{page.limit}|{page.cursor}"
+    headers = {"ETag": events_cache.etag(version, key), "Cache-Control": "no-cache"}
+    if etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
 
-@router.get("/events", response_model=list[schemas.EventOut])
-def get_events(db: Session = Depends(get_db)):
-    return db.query(models.Event).all()
+    body = events_cache.get(key, version)
+    if body is None:
+        stmt = select(models.Event)
+        if date_from:
+            stmt = stmt.where(models.Event.date >= date_from)
+        if date_to:
+            stmt = stmt.where(models.Event.date < date_to)
+        events, next_cursor = await paginate(db, stmt, [models.Event.date, models.Event.id], page)
+        body = schemas.Page[schemas.EventOut](items=events, next_cursor=next_cursor).model_dump_json().encode()
+        events_cache.put(key, version, body)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 @router.post("/events", response_model=schemas.EventOut)
-def create_event(event: schemas.EventCreate, db: Session = Depends(get_db)):
+async def create_event(event: schemas.EventCreate, db: AsyncSession = Depends(get_db)):
     db_event = models.Event(
         id=str(uuid.uuid4()),
         title=event.title,
         description=event.description,
         date=event.date,
         max_team_size=event.max_team_size,
+        capacity=event.capacity,
         solo=event.solo,
         created_by=event.created_by
     )
     db.add(db_event)
-    db.commit()
-    db.refresh(db_event)
+    db.add(models.EventStats(event_id=db_event.id, registration_count=0, seats_remaining=event.capacity))
+    await stats.bump(db, events=1)
+    await db.commit()
+    await events_cache.invalidate()
     return db_event
@@ -0,0 +1,27 @@
+# backend/routes/monitoring.py
+import asyncio
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse, PlainTextResponse
+from sqlalchemy import text
+from backend.database import open_session
+from backend.config import settings
+from backend.metrics import request_metrics, render_metrics
+
+router = APIRouter()
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(render_metrics(request_metrics), media_type="text/plain; version=0.0.4")
+
+async def _ping_database():
+    async with open_session() as db:
+        await db.execute(text("SELECT 1"))
+
+# Unlike /health, only ready once a pooled connection answers
+@router.get("/ready")
+async def readiness():
+    try:
+        await asyncio.wait_for(_ping_database(), settings.READINESS_TIMEOUT)
+    except Exception as e:
+        return JSONResponse(status_code=503, content={"status": "unavailable", "error": e.__class__.__name__})
+    return {"status": "ready"}
@@ -0,0 +1,36 @@
+# backend/routes/qr_codes.py
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.database import get_db
+from backend.models import Registration
+from backend.config import settings
+from backend.qr import qr_renderer, build_qr_payload, qr_etag
+from backend.cache import etag_matches
+
+router = APIRouter()
+
+@router.get("/qr_codes/{registration_id}.png")
+async def get_qr_code(registration_id: str, request: Request, db: AsyncSession = Depends(get_db)):
+    row = (await db.execute(
+        select(Registration.id, Registration.event_id).where(Registration.id == registration_id)
+    )).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Registration not found")
+
+    try:
+        payload = build_qr_payload(row.id, row.event_id)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    etag = qr_etag(payload)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.QR_CACHE_MAX_AGE}",
+    }
+
+    # The ETag is known before rendering, so revalidations never touch the renderer
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    png = await qr_renderer.render(payload, etag)
+    return Response(content=png, media_type="image/png", headers=headers)
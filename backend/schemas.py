@@ -1,8 +1,15 @@
 # backend/schemas.py
-from pydantic import BaseModel, EmailStr
-from typing import Optional
+from pydantic import BaseModel, EmailStr, Field
+from typing import Generic, Optional, TypeVar
 from datetime import datetime
 
+T = TypeVar("T")
+
+# Pagination
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: Optional[str] = None
+
 # User Schemas
 class UserOut(BaseModel):
     id: str
@@ -22,6 +29,7 @@ class EventCreate(BaseModel):
     description: Optional[str] = None
     date: datetime
     max_team_size: int = 1
+    capacity: Optional[int] = Field(None, ge=0)  # None means unlimited
     solo: bool = True  # Changed from int to bool
     created_by: str
 
@@ -31,6 +39,7 @@ class EventOut(BaseModel):
     description: Optional[str]
     date: datetime
     max_team_size: int
+    capacity: Optional[int] = None
     solo: bool
     created_by: str
 
@@ -52,10 +61,47 @@ class RegistrationOut(BaseModel):
     team_name: Optional[str]
     event_id: str
     qr_code: Optional[str]
+    status: str = "confirmed"
 
     class Config:
         from_attributes = True
 
+# Returned with 202 while a queued registration is pending
+class TicketOut(BaseModel):
+    ticket_id: str
+    status: str
+    status_url: str
+
+# Check-in Schemas
+class CheckInRequest(BaseModel):
+    payload: str
+
+class CheckInScan(BaseModel):
+    payload: str
+    scanned_at: Optional[datetime] = None
+
+class CheckInSync(BaseModel):
+    scans: list[CheckInScan] = Field(..., max_length=10000)
+
+class CheckInResult(BaseModel):
+    status: str
+    registration_id: Optional[str] = None
+    checked_in_at: Optional[datetime] = None
+
+# Analytics Schemas
+class RegistrationBucket(BaseModel):
+    start: datetime
+    registrations: int
+    cumulative: int
+
+class RegistrationSeries(BaseModel):
+    event_id: str
+    resolution: str
+    start: datetime
+    end: datetime
+    total: int
+    buckets: list[RegistrationBucket]
+
 # Admin Schemas
 class AdminCreate(BaseModel):
     username: str
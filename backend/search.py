@@ -0,0 +1,78 @@
+# backend/search.py
+from sqlalchemy import and_, column, or_, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Trigram indexes can't serve shorter terms, so the API rejects them
+MIN_TERM_LENGTH = 3
+
+# Columns covered by admin search. On SQLite each table gets a contentless
+# trigram FTS5 index kept in sync by triggers. String-keyed tables have no
+# stable rowid (VACUUM may renumber it), so the index is keyed by the
+# INTEGER PRIMARY KEY of a {table}_fts_keys(rowid, id) side table instead.
+SEARCH_COLUMNS = {
+    "users": ("name", "email"),
+    "events": ("title",),
+    "registrations": ("team_name", "phone"),
+}
+
+
+def sqlite_search_ddl(table: str, columns) -> list:
+    """Statements creating `table`'s FTS index and indexing the rows it already has."""
+    fts, keys = f"{table}_fts", f"{table}_fts_keys"
+    cols = ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+    insert_new = f"INSERT INTO {fts}(rowid, {cols}) SELECT rowid, {new} FROM {keys} WHERE id = new.id;"
+    # Contentless tables forget their text, so a delete has to repeat it
+    delete_old = f"INSERT INTO {fts}({fts}, rowid, {cols}) SELECT 'delete', rowid, {old} FROM {keys} WHERE id = old.id;"
+    return [
+        *sqlite_search_drop_ddl(table),
+        f"CREATE TABLE {keys} (rowid INTEGER PRIMARY KEY, id VARCHAR NOT NULL UNIQUE)",
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='', tokenize='trigram')",
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {keys}(id) VALUES (new.id); {insert_new} END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"{delete_old} DELETE FROM {keys} WHERE id = old.id; END",
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN {delete_old} {insert_new} END",
+        f"INSERT INTO {keys}(id) SELECT id FROM {table}",
+        f"INSERT INTO {fts}(rowid, {cols}) SELECT k.rowid, {', '.join(f't.{c}' for c in columns)} "
+        f"FROM {table} AS t JOIN {keys} AS k ON k.id = t.id",
+    ]
+
+
+def sqlite_search_drop_ddl(table: str) -> list:
+    fts = f"{table}_fts"
+    # Triggers go first, they would dangle without the FTS table
+    return [
+        *(f"DROP TRIGGER IF EXISTS {fts}_{suffix}" for suffix in ("ai", "ad", "au")),
+        f"DROP TABLE IF EXISTS {fts}",
+        f"DROP TABLE IF EXISTS {fts}_keys",
+    ]
+
+
+def _like_pattern(term: str, mode: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%" if mode == "prefix" else f"%{escaped}%"
+
+
+def _fts_ids(table: str, term: str):
+    fts, keys = f"{table}_fts", f"{table}_fts_keys"
+    # A quoted phrase, so the term is matched as plain text
+    phrase = '"' + term.replace('"', '""') + '"'
+    return text(
+        f"SELECT k.id FROM {fts} JOIN {keys} AS k ON k.rowid = {fts}.rowid WHERE {fts} MATCH :phrase"
+    ).bindparams(phrase=phrase).columns(column("id"))
+
+
+def search_clause(db: AsyncSession, table, columns, term: str, mode: str = "contains"):
+    """WHERE clause matching `term` against any of `columns` of `table`.
+
+    On PostgreSQL the ILIKE is served by the pg_trgm GIN indexes. On SQLite
+    the trigram FTS5 table narrows the search to candidate rows first, and
+    the ILIKE then applies the exact column and prefix semantics.
+    """
+    pattern = _like_pattern(term, mode)
+    clause = or_(*(col.ilike(pattern, escape="\\") for col in columns))
+    if db.get_bind().dialect.name == "sqlite":
+        clause = and_(table.c.id.in_(_fts_ids(table.name, term)), clause)
+    return clause
@@ -0,0 +1,259 @@
+# backend/stats.py
+import asyncio
+import logging
+from sqlalchemy import delete, exists, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.database import open_session
+from backend.models import (
+    Event, EventStats, GlobalStats, Registration, User,
+    REGISTRATION_CONFIRMED, REGISTRATION_WAITLISTED,
+)
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_STATS_ID = 1
+
+
+async def bump(db: AsyncSession, events: int = 0, registrations: int = 0, users: int = 0):
+    """Adjust the global counters inside the caller's transaction."""
+    if not (events or registrations or users):
+        return
+    result = await db.execute(
+        update(GlobalStats)
+        .where(GlobalStats.id == GLOBAL_STATS_ID)
+        .values(
+            total_events=GlobalStats.total_events + events,
+            total_registrations=GlobalStats.total_registrations + registrations,
+            total_users=GlobalStats.total_users + users,
+        )
+    )
+    if result.rowcount == 0:
+        # First write ever: seed from the tables. Sessions don't autoflush, so
+        # flush the caller's pending adds and deletes for the counts to include them
+        await db.flush()
+        await db.execute(insert(GlobalStats).values(id=GLOBAL_STATS_ID, **_global_counts()))
+
+
+def _event_stats(event_id):
+    return update(EventStats).where(EventStats.event_id == event_id)
+
+
+async def _seed_event_stats(db: AsyncSession, event_id: str) -> bool:
+    """Create a missing event_stats row from the tables; False if the event doesn't exist."""
+    result = await db.execute(
+        insert(EventStats).from_select(
+            ["event_id", "registration_count", "seats_remaining"],
+            select(
+                Event.id,
+                _event_count(Event.id).scalar_subquery(),
+                Event.capacity - _confirmed_count(Event.id).scalar_subquery(),
+            ).where(Event.id == event_id),
+        )
+    )
+    return result.rowcount == 1
+
+
+async def claim_seats(db: AsyncSession, event_id: str, n: int = 1):
+    """Count `n` new registrations for an event and take as many seats as are left.
+
+    Runs in the caller's transaction and returns how many of the `n` are
+    confirmed (the rest go on the waitlist), or None if the event doesn't
+    exist. The common case is one conditional UPDATE on the event's stats
+    row; its row lock is what keeps concurrent claims from overselling.
+    """
+    result = await db.execute(
+        _event_stats(event_id)
+        .where(or_(EventStats.seats_remaining.is_(None), EventStats.seats_remaining >= n))
+        .values(
+            registration_count=EventStats.registration_count + n,
+            seats_remaining=EventStats.seats_remaining - n,
+        )
+    )
+    if result.rowcount:
+        return n
+
+    # Fewer than n seats left, or no stats row yet
+    result = await db.execute(
+        _event_stats(event_id).values(registration_count=EventStats.registration_count + n)
+    )
+    if result.rowcount == 0:
+        if not await _seed_event_stats(db, event_id):
+            return None
+        # The seeded row doesn't count these registrations yet
+        return await claim_seats(db, event_id, n)
+
+    claimed = 0
+    if n > 1:
+        # Only reached when the event fills up partway through a bulk import
+        while claimed < n:
+            result = await db.execute(
+                _event_stats(event_id)
+                .where(EventStats.seats_remaining > 0)
+                .values(seats_remaining=EventStats.seats_remaining - 1)
+            )
+            if not result.rowcount:
+                break
+            claimed += 1
+    return claimed
+
+
+async def release_seat(db: AsyncSession, event_id: str, confirmed: bool):
+    """Count a deleted registration out of its event, in the caller's transaction.
+
+    A freed seat goes straight to the oldest waitlisted registration.
+    """
+    values = {"registration_count": EventStats.registration_count - 1}
+    if confirmed:
+        values["seats_remaining"] = EventStats.seats_remaining + 1
+    await db.execute(_event_stats(event_id).values(**values))
+    if confirmed:
+        await promote_waitlist(db, event_id)
+
+
+async def set_capacity(db: AsyncSession, event_id: str, capacity):
+    """Resize an event's seat counter after its capacity changed, in the caller's transaction."""
+    seats = None if capacity is None else capacity - _confirmed_count(event_id).scalar_subquery()
+    await db.execute(_event_stats(event_id).values(seats_remaining=seats))
+    await promote_waitlist(db, event_id)
+
+
+async def promote_waitlist(db: AsyncSession, event_id: str) -> int:
+    """Confirm waitlisted registrations, oldest first, while seats are free.
+
+    Callers update the event's stats row first, so its row lock serializes
+    promotions for the event.
+    """
+    seats = await db.scalar(select(EventStats.seats_remaining).where(EventStats.event_id == event_id))
+    if seats is not None and seats <= 0:
+        return 0
+    waiting = select(Registration.id).where(
+        Registration.event_id == event_id,
+        Registration.status == REGISTRATION_WAITLISTED,
+    ).order_by(Registration.registered_at, Registration.id)
+    if seats is not None:
+        waiting = waiting.limit(seats)
+    promoted = (await db.execute(
+        update(Registration)
+        .where(Registration.id.in_(waiting), Registration.status == REGISTRATION_WAITLISTED)
+        .values(status=REGISTRATION_CONFIRMED)
+        .execution_options(synchronize_session=False)
+    )).rowcount
+    if promoted and seats is not None:
+        await db.execute(
+            _event_stats(event_id).values(seats_remaining=EventStats.seats_remaining - promoted)
+        )
+    return promoted
+
+
+async def get_global_stats(db: AsyncSession) -> GlobalStats:
+    stats = await db.get(GlobalStats, GLOBAL_STATS_ID)
+    if stats is None:
+        await reconcile(db)
+        stats = await db.get(GlobalStats, GLOBAL_STATS_ID)
+    return stats
+
+
+async def table_version(db: AsyncSession, counter, timestamp) -> str:
+    """Cheap version string for a table: its global counter plus its newest timestamp.
+
+    Inserts and updates move the timestamp and deletes move the counter, so
+    any change yields a new version. Both halves are single index or row
+    lookups, never a scan.
+    """
+    count = select(counter).where(GlobalStats.id == GLOBAL_STATS_ID).scalar_subquery()
+    newest = select(func.max(timestamp)).scalar_subquery()
+    count, newest = (await db.execute(select(count, newest))).one()
+    return f"{count}:{newest.isoformat() if newest else ''}"
+
+
+async def get_event_registration_count(db: AsyncSession, event_id: str) -> int:
+    count = await db.scalar(select(EventStats.registration_count).where(EventStats.event_id == event_id))
+    if count is None:
+        count = await db.scalar(_event_count(event_id))
+    return count
+
+
+def _global_counts():
+    return {
+        "total_events": select(func.count()).select_from(Event).scalar_subquery(),
+        "total_registrations": select(func.count()).select_from(Registration).scalar_subquery(),
+        "total_users": select(func.count()).select_from(User).scalar_subquery(),
+    }
+
+
+def _event_count(event_id):
+    return select(func.count()).select_from(Registration).where(Registration.event_id == event_id)
+
+
+def _confirmed_count(event_id):
+    return _event_count(event_id).where(Registration.status == REGISTRATION_CONFIRMED)
+
+
+async def reconcile(db: AsyncSession):
+    """Recompute every counter from the base tables and commit.
+
+    Each step is a single set-based statement that only writes rows whose
+    counters differ from the tables, so correct counters are not rewritten.
+    """
+    counts = _global_counts()
+    actual = select(*(count.label(name) for name, count in counts.items())).subquery()
+    global_drifted = (await db.execute(
+        update(GlobalStats)
+        .where(
+            GlobalStats.id == GLOBAL_STATS_ID,
+            or_(*(getattr(GlobalStats, name) != actual.c[name] for name in counts)),
+        )
+        .values({name: actual.c[name] for name in counts})
+        .execution_options(synchronize_session=False)
+    )).rowcount
+    if not global_drifted and await db.scalar(
+        select(GlobalStats.id).where(GlobalStats.id == GLOBAL_STATS_ID)
+    ) is None:
+        await db.execute(insert(GlobalStats).values(id=GLOBAL_STATS_ID, **counts))
+
+    await db.execute(
+        insert(EventStats).from_select(
+            ["event_id", "registration_count", "seats_remaining"],
+            select(
+                Event.id,
+                _event_count(Event.id).scalar_subquery(),
+                Event.capacity - _confirmed_count(Event.id).scalar_subquery(),
+            ).where(
+                ~exists().where(EventStats.event_id == Event.id)
+            ),
+        )
+    )
+    actual = _event_count(EventStats.event_id).scalar_subquery()
+    actual_seats = (
+        select(Event.capacity).where(Event.id == EventStats.event_id).scalar_subquery()
+        - _confirmed_count(EventStats.event_id).scalar_subquery()
+    )
+    drifted = (await db.execute(
+        update(EventStats)
+        .where(or_(
+            EventStats.registration_count != actual,
+            EventStats.seats_remaining.is_distinct_from(actual_seats),
+        ))
+        .values(registration_count=actual, seats_remaining=actual_seats)
+        .execution_options(synchronize_session=False)
+    )).rowcount
+    await db.execute(
+        delete(EventStats)
+        .where(~exists().where(Event.id == EventStats.event_id))
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    if global_drifted:
+        logger.warning("Corrected drifted global stats counters")
+    if drifted:
+        logger.warning("Corrected %d drifted event stats counters", drifted)
+
+
+async def reconcile_periodically(interval: float):
+    while True:
+        try:
+            async with open_session() as db:
+                await reconcile(db)
+        except Exception:
+            logger.exception("Stats reconciliation failed")
+        await asyncio.sleep(interval)
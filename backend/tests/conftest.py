@@ -0,0 +1,69 @@
+# backend/tests/conftest.py
+import asyncio
+import os
+import tempfile
+
+# Settings are read once at import, so the test environment goes in first.
+# TEST_DATABASE_URL points the suite at another database (it is wiped).
+_workdir = tempfile.mkdtemp(prefix="zettabyte-tests-")
+os.environ["DATABASE_URL"] = os.getenv("TEST_DATABASE_URL", f"sqlite:///{os.path.join(_workdir, 'test.db')}")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("QR_SIGNING_KEY", "test-qr-signing-key")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("STATS_RECONCILE_INTERVAL", "3600")
+os.environ.setdefault("DB_CREATE_ALL", "false")
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import stats
+from backend.auth.jwt import token_cache
+from backend.cache import events_cache
+from backend.checkin import checkin_index
+from backend.database import engine
+from backend.main import app
+from backend.models import Base
+from backend.qr import qr_renderer
+from backend.registration_queue import registration_queue
+
+
+def _reset_singletons():
+    events_cache._entries.clear()
+    token_cache._entries.clear()
+    token_cache._revoked.clear()
+    token_cache._not_before.clear()
+    checkin_index._events.clear()
+    qr_renderer.cache._items.clear()
+    qr_renderer.cache.size = 0
+    registration_queue._tickets.clear()
+    registration_queue._finished.clear()
+
+
+@pytest.fixture(autouse=True)
+def database():
+    """A freshly created schema and empty in-process caches for every test."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    _reset_singletons()
+    yield engine
+
+
+async def _no_reconcile(interval: float):
+    await asyncio.Event().wait()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # The startup reconcile would race the test's own queries; tests call it directly
+    monkeypatch.setattr(stats, "reconcile_periodically", _no_reconcile)
+    # Entering the client runs the lifespan, which disposes the engines on exit
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def admin_headers(client):
+    credentials = {"username": "admin", "password": "correct horse"}
+    assert client.post("/api/admin/signup", json=credentials).status_code == 200
+    token = client.post("/api/admin/login", json=credentials).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,80 @@
+# backend/tests/helpers.py
+import asyncio
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, insert
+from backend.database import async_engine, engine
+from backend.main import app
+from backend.models import Event, EventStats, Registration, User
+
+
+def run(coro):
+    """Run `coro` on a fresh event loop, then drop the async engine's connections with it."""
+    async def main():
+        try:
+            # A disposed pool guards its first connect with a thread lock, which
+            # deadlocks if concurrent tasks race for it, so connect once up front
+            async with async_engine.connect():
+                pass
+            return await coro
+        finally:
+            await async_engine.dispose()
+    return asyncio.run(main())
+
+
+def async_client() -> AsyncClient:
+    """In-process client for firing concurrent requests at the app; no lifespan."""
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+def create_event(client, admin_headers, **fields) -> dict:
+    event = {"title": "Hackathon", "date": "2026-11-01T09:00:00", "created_by": "admin", **fields}
+    response = client.post("/api/admin/events", json=event, headers=admin_headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def registration(event_id: str, n: int, **fields) -> dict:
+    return {"event_id": event_id, "name": f"User {n}", "email": f"user{n}@example.com", **fields}
+
+
+def seed_registrations(event_id: str, n: int, start: int = 0, registered_at: datetime = None):
+    """Bulk-insert `n` users registered for an existing event, bypassing the API."""
+    registered_at = registered_at or datetime(2026, 10, 1)
+    users = [
+        {"id": f"user-{i}", "name": f"User {i}", "email": f"user{i}@example.com", "registered_at": registered_at}
+        for i in range(start, start + n)
+    ]
+    registrations = [
+        {"id": f"reg-{i}", "user_id": f"user-{i}", "event_id": event_id, "qr_code": f"/qr_codes/reg-{i}.png",
+         "registered_at": registered_at + timedelta(seconds=i)}
+        for i in range(start, start + n)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(User), users)
+        conn.execute(insert(Registration), registrations)
+
+
+def seed_event(event_id: str = "event-1", capacity=None):
+    with engine.begin() as conn:
+        conn.execute(insert(Event).values(
+            id=event_id, title="Seeded", date=datetime(2026, 11, 1), created_by="tests", capacity=capacity
+        ))
+        conn.execute(insert(EventStats).values(event_id=event_id, registration_count=0, seats_remaining=capacity))
+    return event_id
+
+
+@contextmanager
+def count_queries():
+    """Collect every statement the app's async engine sends while the block runs."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", record)
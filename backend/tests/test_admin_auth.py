@@ -0,0 +1,37 @@
+# backend/tests/test_admin_auth.py
+from backend.auth.jwt import token_cache
+
+CREDENTIALS = {"username": "admin", "password": "correct horse"}
+
+
+def _login(client) -> dict:
+    response = client.post("/api/admin/login", json=CREDENTIALS)
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def test_logout_revokes_only_that_token(client, admin_headers):
+    other = _login(client)
+    assert client.get("/api/admin/auth/token-cache", headers=admin_headers).status_code == 200
+
+    assert client.post("/api/admin/logout", headers=admin_headers).status_code == 200
+    # Rejected even though the token was cached as valid a moment ago
+    assert client.get("/api/admin/auth/token-cache", headers=admin_headers).status_code == 401
+    assert client.get("/api/admin/auth/token-cache", headers=other).status_code == 200
+    assert token_cache.stats()["revoked"] == 1
+
+
+def test_revoke_tokens_rejects_every_earlier_token(client, admin_headers):
+    other = _login(client)
+    response = client.post("/api/admin/admin/revoke-tokens", headers=admin_headers)
+    assert response.status_code == 200
+
+    assert client.get("/api/admin/auth/token-cache", headers=admin_headers).status_code == 401
+    assert client.get("/api/admin/auth/token-cache", headers=other).status_code == 401
+    # Tokens issued after the revocation are accepted
+    assert client.get("/api/admin/auth/token-cache", headers=_login(client)).status_code == 200
+
+
+def test_invalid_token_is_rejected(client):
+    response = client.get("/api/admin/auth/token-cache", headers={"Authorization": "Bearer not-a-jwt"})
+    assert response.status_code == 401
@@ -0,0 +1,98 @@
+# backend/tests/test_admin_import.py
+import json
+from sqlalchemy import select
+from backend.database import engine
+from backend.models import Registration
+from backend.tests.helpers import create_event, registration
+
+IMPORT_URL = "/api/admin/registrations/import"
+
+
+def _import(client, admin_headers, filename, content, **params):
+    response = client.post(IMPORT_URL, params=params, files={"file": (filename, content)}, headers=admin_headers)
+    assert response.status_code == 200, response.text
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    return lines[:-1], lines[-1]["summary"]
+
+
+def _csv(*rows):
+    return "event_id,name,email,team_name\n" + "".join(f"{','.join(row)}\n" for row in rows)
+
+
+def test_csv_import_waitlists_and_promotes_in_file_order(client, admin_headers):
+    event_id = create_event(client, admin_headers, capacity=1)["id"]
+    upload = _csv(*[(event_id, f"User {n}", f"user{n}@example.com", f"Team {n}") for n in range(4)])
+    results, summary = _import(client, admin_headers, "rows.csv", upload)
+
+    assert summary == {"rows": 4, "created": 4, "duplicate": 0, "error": 0}
+    assert [r["row"] for r in results] == [1, 2, 3, 4]
+    assert [r["registration_status"] for r in results] == ["confirmed", "waitlisted", "waitlisted", "waitlisted"]
+    with engine.connect() as conn:
+        registered_at = dict(conn.execute(select(Registration.id, Registration.registered_at)).all())
+    times = [registered_at[r["registration_id"]] for r in results]
+    assert times == sorted(set(times))
+
+    # Each freed seat goes to the next row of the file
+    for freed, promoted in zip(results, results[1:]):
+        client.delete(f"/api/admin/registrations/{freed['registration_id']}", headers=admin_headers)
+        statuses = {r["id"]: r["status"] for r in client.get(f"/api/registrations/{event_id}").json()}
+        assert statuses[promoted["registration_id"]] == "confirmed"
+        assert list(statuses.values()).count("confirmed") == 1
+
+
+def test_ndjson_import_across_batches_with_default_event(client, admin_headers):
+    event_id = create_event(client, admin_headers)["id"]
+    rows = [{k: v for k, v in registration(event_id, n).items() if k != "event_id"} for n in range(5)]
+    upload = "".join(json.dumps(row) + "\n\n" for row in rows)
+    results, summary = _import(client, admin_headers, "rows.ndjson", upload, event_id=event_id, batch_size=2)
+
+    assert summary == {"rows": 5, "created": 5, "duplicate": 0, "error": 0}
+    assert [r["row"] for r in results] == [1, 2, 3, 4, 5]
+    assert len(client.get(f"/api/registrations/{event_id}").json()) == 5
+
+
+def test_row_errors_are_reported_without_failing_the_batch(client, admin_headers):
+    event_id = create_event(client, admin_headers)["id"]
+    lines = [
+        json.dumps(registration(event_id, 1)),
+        json.dumps(registration(event_id, 2, email="not-an-email")),
+        "{not json",
+        json.dumps(registration("no-such-event", 3)),
+        json.dumps({"event_id": event_id, "email": "user4@example.com"}),
+        json.dumps(registration(event_id, 1)),
+        json.dumps([1, 2]),
+        json.dumps(registration(event_id, 5)),
+    ]
+    results, summary = _import(client, admin_headers, "rows.ndjson", "\n".join(lines) + "\n")
+
+    assert [r["status"] for r in results] == [
+        "created", "error", "error", "error", "error", "duplicate", "error", "created"
+    ]
+    assert results[2]["error"].startswith("Invalid JSON")
+    assert results[3]["error"] == "Event not found"
+    assert results[5]["user_id"] == results[0]["user_id"]
+    assert results[6]["error"] == "Row must be an object"
+    assert summary == {"rows": 8, "created": 2, "duplicate": 1, "error": 5}
+
+
+def test_undecodable_upload_ends_with_an_error_row_and_summary(client, admin_headers):
+    event_id = create_event(client, admin_headers)["id"]
+    good = _csv(*[(event_id, f"User {n}", f"user{n}@example.com", "") for n in range(3)]).encode()
+    upload = good + f"{event_id},Jos\xe9,jose@example.com,\n".encode("latin-1")
+    results, summary = _import(client, admin_headers, "rows.csv", upload, batch_size=2)
+
+    assert [r["status"] for r in results] == ["created", "created", "created", "error"]
+    assert results[-1]["row"] == 4
+    assert results[-1]["error"].startswith("Unreadable upload")
+    assert summary == {"rows": 4, "created": 3, "duplicate": 0, "error": 1}
+
+
+def test_malformed_csv_ends_with_an_error_row_and_summary(client, admin_headers):
+    event_id = create_event(client, admin_headers)["id"]
+    # Longer than csv.field_size_limit(), which the reader refuses
+    upload = _csv((event_id, "User 1", "user1@example.com", ""), (event_id, "x" * 200000, "user2@example.com", ""))
+    results, summary = _import(client, admin_headers, "rows.csv", upload)
+
+    assert [r["status"] for r in results] == ["created", "error"]
+    assert results[-1]["error"].startswith("Unreadable CSV")
+    assert summary == {"rows": 2, "created": 1, "duplicate": 0, "error": 1}
@@ -0,0 +1,70 @@
+# backend/tests/test_admin_listings_cache.py
+import pytest
+from backend.checkin import CHECKED_IN
+from backend.qr import build_qr_payload
+from backend.tests.helpers import create_event, registration, seed_registrations
+
+
+def _register(client, event_id, n):
+    response = client.post("/api/register", json=registration(event_id, n))
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _assert_not_modified(client, url, headers):
+    first = client.get(url, headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith("W/")
+    again = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.headers["ETag"] == etag
+    return etag
+
+
+@pytest.mark.parametrize("url", ["/api/admin/registrations", "/api/admin/registrations/event/{event_id}"])
+def test_registration_listings_revalidate(client, admin_headers, url):
+    event_id = create_event(client, admin_headers)["id"]
+    url = url.format(event_id=event_id)
+    first = _register(client, event_id, 1)
+    etag = _assert_not_modified(client, url, admin_headers)
+
+    # An insert, an update and a delete must each change the tag
+    second = _register(client, event_id, 2)
+    etag_after_insert = _assert_not_modified(client, url, admin_headers)
+    assert etag_after_insert != etag
+
+    payload = client.get(f"/api/admin/registrations/event/{event_id}", headers=admin_headers).json()
+    assert {r["id"] for r in payload["items"]} == {first["id"], second["id"]}
+    scan = {"payload": build_qr_payload(first["id"], event_id)}
+    checked_in = client.post(f"/api/admin/events/{event_id}/checkin", json=scan, headers=admin_headers)
+    assert checked_in.json()["status"] == CHECKED_IN
+    etag_after_update = _assert_not_modified(client, url, admin_headers)
+    assert etag_after_update != etag_after_insert
+
+    assert client.delete(f"/api/admin/registrations/{second['id']}", headers=admin_headers).status_code == 200
+    assert _assert_not_modified(client, url, admin_headers) != etag_after_update
+
+
+def test_user_listing_revalidates(client, admin_headers):
+    event_id = create_event(client, admin_headers)["id"]
+    _register(client, event_id, 1)
+    etag = _assert_not_modified(client, "/api/admin/users", admin_headers)
+    _register(client, event_id, 2)
+    assert _assert_not_modified(client, "/api/admin/users", admin_headers) != etag
+
+
+def test_large_listing_is_compressed_and_still_revalidates(client, admin_headers):
+    event_id = create_event(client, admin_headers)["id"]
+    seed_registrations(event_id, 50)
+    url = "/api/admin/registrations?limit=50"
+    headers = {**admin_headers, "Accept-Encoding": "gzip"}
+
+    response = client.get(url, headers=headers)
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert len(response.json()["items"]) == 50
+
+    again = client.get(url, headers={**headers, "If-None-Match": response.headers["ETag"]})
+    assert again.status_code == 304
+
@@ -0,0 +1,59 @@
+# backend/tests/test_analytics.py
+from datetime import datetime
+from sqlalchemy import func, select
+from backend.database import engine
+from backend.models import RegistrationRollup
+from backend.tests.helpers import create_event, registration, seed_event, seed_registrations
+
+
+def _rollup_totals(event_id):
+    with engine.connect() as conn:
+        return dict(conn.execute(
+            select(RegistrationRollup.bucket_seconds, func.sum(RegistrationRollup.registrations))
+            .where(RegistrationRollup.event_id == event_id)
+            .group_by(RegistrationRollup.bucket_seconds)
+        ).all())
+
+
+def test_rollups_follow_registrations_and_deletes(client, admin_headers):
+    event_id = create_event(client, admin_headers)["id"]
+    registered = [client.post("/api/register", json=registration(event_id, n)).json() for n in range(3)]
+    assert _rollup_totals(event_id) == {60: 3, 3600: 3}
+
+    response = client.delete(f"/api/admin/registrations/{registered[0]['id']}", headers=admin_headers)
+    assert response.status_code == 200
+    assert _rollup_totals(event_id) == {60: 2, 3600: 2}
+
+    series = client.get(
+        f"/api/admin/events/{event_id}/analytics/registrations", params={"resolution": "hour"}, headers=admin_headers
+    ).json()
+    assert series["total"] == 2
+    assert sum(bucket["registrations"] for bucket in series["buckets"]) == 2
+
+
+def test_rebuild_counts_rows_loaded_behind_the_rollups(client, admin_headers):
+    event_id = seed_event()
+    seed_registrations(event_id, 5)
+    assert _rollup_totals(event_id) == {}
+
+    response = client.post(f"/api/admin/events/{event_id}/analytics/rebuild", headers=admin_headers)
+    assert response.json()["registrations"] == 5
+    assert _rollup_totals(event_id) == {60: 5, 3600: 5}
+
+
+def test_offset_aware_bounds_are_converted_to_utc(client, admin_headers):
+    event_id = seed_event()
+    # Registered from 2026-10-01 00:00:00 UTC, one second apart
+    seed_registrations(event_id, 5, registered_at=datetime(2026, 10, 1))
+    client.post(f"/api/admin/events/{event_id}/analytics/rebuild", headers=admin_headers)
+
+    url = f"/api/admin/events/{event_id}/analytics/registrations"
+    naive = client.get(url, headers=admin_headers, params={
+        "resolution": "hour", "start": "2026-09-30T23:00:00", "end": "2026-10-01T01:00:00",
+    })
+    aware = client.get(url, headers=admin_headers, params={
+        "resolution": "hour", "start": "2026-10-01T04:30:00+05:30", "end": "2026-10-01T06:30:00+05:30",
+    })
+    assert aware.status_code == 200, aware.text
+    assert aware.json() == naive.json()
+    assert [b["registrations"] for b in aware.json()["buckets"]] == [0, 5]
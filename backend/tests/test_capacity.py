@@ -0,0 +1,117 @@
+# backend/tests/test_capacity.py
+import asyncio
+from sqlalchemy import func, select
+from backend.database import open_session
+from backend.models import EventStats, Registration
+from backend.registration_queue import registration_queue
+from backend.tests.helpers import async_client, count_queries, registration, run, seed_event
+
+CAPACITY = 5
+REGISTRANTS = 20
+
+
+async def _watch_seats(event_id: str, done: asyncio.Event, seen: list):
+    """Sample the event's seat counter until `done` is set."""
+    while not done.is_set():
+        async with open_session() as db:
+            seen.append(await db.scalar(select(EventStats.seats_remaining).where(EventStats.event_id == event_id)))
+        await asyncio.sleep(0)
+
+
+async def _final_state(event_id: str):
+    async with open_session() as db:
+        statuses = dict((await db.execute(
+            select(Registration.status, func.count()).where(Registration.event_id == event_id)
+            .group_by(Registration.status)
+        )).all())
+        seats = await db.scalar(select(EventStats.seats_remaining).where(EventStats.event_id == event_id))
+    return statuses, seats
+
+
+def _assert_not_oversold(event_id: str, seen: list):
+    statuses, seats = run(_final_state(event_id))
+    assert statuses == {"confirmed": CAPACITY, "waitlisted": REGISTRANTS - CAPACITY}
+    assert seats == 0
+    assert seen and min(seen) >= 0
+
+
+def test_parallel_direct_registrations_do_not_oversell():
+    event_id = seed_event(capacity=CAPACITY)
+    seen = []
+
+    async def burst():
+        done = asyncio.Event()
+        watcher = asyncio.create_task(_watch_seats(event_id, done, seen))
+        async with async_client() as client:
+            responses = await asyncio.gather(*(
+                client.post("/api/register", json=registration(event_id, n)) for n in range(REGISTRANTS)
+            ))
+        done.set()
+        await watcher
+        return responses
+
+    responses = run(burst())
+    assert all(r.status_code == 200 for r in responses), [r.text for r in responses if r.status_code != 200]
+    statuses = [r.json()["status"] for r in responses]
+    assert statuses.count("confirmed") == CAPACITY
+    _assert_not_oversold(event_id, seen)
+
+
+def test_parallel_queued_registrations_do_not_oversell(monkeypatch):
+    event_id = seed_event(capacity=CAPACITY)
+    # Small batches, so the event fills up partway through one of them
+    monkeypatch.setattr(registration_queue, "enabled", True)
+    monkeypatch.setattr(registration_queue, "batch_size", 3)
+    seen = []
+
+    async def burst():
+        registration_queue.start()
+        done = asyncio.Event()
+        watcher = asyncio.create_task(_watch_seats(event_id, done, seen))
+        async with async_client() as client:
+            accepted = await asyncio.gather(*(
+                client.post("/api/register", json=registration(event_id, n)) for n in range(REGISTRANTS)
+            ))
+            await registration_queue.stop()
+            results = await asyncio.gather(*(
+                client.get(r.headers["Location"]) for r in accepted
+            ))
+        done.set()
+        await watcher
+        return accepted, results
+
+    accepted, results = run(burst())
+    assert all(r.status_code == 202 for r in accepted)
+    assert all(r.status_code == 200 for r in results), [r.text for r in results if r.status_code != 200]
+    statuses = [r.json()["status"] for r in results]
+    assert statuses.count("confirmed") == CAPACITY
+    _assert_not_oversold(event_id, seen)
+
+
+def test_freed_seat_goes_to_the_oldest_waitlisted(client, admin_headers):
+    event_id = seed_event(capacity=1)
+    first = client.post("/api/register", json=registration(event_id, 1)).json()
+    second = client.post("/api/register", json=registration(event_id, 2)).json()
+    third = client.post("/api/register", json=registration(event_id, 3)).json()
+    assert [first["status"], second["status"], third["status"]] == ["confirmed", "waitlisted", "waitlisted"]
+
+    assert client.delete(f"/api/admin/registrations/{first['id']}", headers=admin_headers).status_code == 200
+    statuses = {r["id"]: r["status"] for r in client.get(f"/api/registrations/{event_id}").json()}
+    assert statuses == {second["id"]: "confirmed", third["id"]: "waitlisted"}
+    assert run(_final_state(event_id))[1] == 0
+
+
+def _first_write(statements, table):
+    return next(i for i, s in enumerate(statements) if s.lstrip().upper().startswith(f"UPDATE {table.upper()}"))
+
+
+def test_register_and_delete_lock_stats_rows_in_the_same_order(client, admin_headers):
+    event_id = seed_event(capacity=1)
+    with count_queries() as register_statements:
+        created = client.post("/api/register", json=registration(event_id, 1)).json()
+    with count_queries() as delete_statements:
+        assert client.delete(f"/api/admin/registrations/{created['id']}", headers=admin_headers).status_code == 200
+
+    # Opposite orders would let a delete and a registration for one event deadlock
+    for statements in (register_statements, delete_statements):
+        assert _first_write(statements, "event_stats") < _first_write(statements, "global_stats")
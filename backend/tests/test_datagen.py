@@ -0,0 +1,33 @@
+# backend/tests/test_datagen.py
+import pytest
+from sqlalchemy import func, select
+from backend.benchmarks import datagen
+from backend.database import create_db_engine
+from backend.models import Registration, RegistrationRollup
+
+
+def test_reset_needs_an_explicit_database_url():
+    with pytest.raises(SystemExit) as exc:
+        datagen.main(["--reset", "--users", "10"])
+    assert exc.value.code == 2
+
+
+def test_rollups_flushed_per_chunk_match_the_registrations(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'datagen.db'}")
+    try:
+        # Chunks far smaller than the hot events split their buckets across flushes
+        written = datagen.generate(engine, users=200, events=5, registrations=600, seed=3, chunk_size=7)
+        with engine.connect() as conn:
+            registrations = dict(conn.execute(
+                select(Registration.event_id, func.count()).group_by(Registration.event_id)
+            ).all())
+            for seconds in datagen.RESOLUTIONS.values():
+                rollups = dict(conn.execute(
+                    select(RegistrationRollup.event_id, func.sum(RegistrationRollup.registrations))
+                    .where(RegistrationRollup.bucket_seconds == seconds)
+                    .group_by(RegistrationRollup.event_id)
+                ).all())
+                assert rollups == registrations
+        assert sum(registrations.values()) == written["registrations"] == 600
+    finally:
+        engine.dispose()
@@ -0,0 +1,68 @@
+# backend/tests/test_events_cache.py
+from backend import cache
+from backend.cache import LocalVersionBackend, events_cache
+from backend.tests.helpers import create_event, run
+
+
+def test_unchanged_listing_is_answered_with_304(client, admin_headers):
+    create_event(client, admin_headers)
+    first = client.get("/api/events")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    again = client.get("/api/events", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.headers["ETag"] == etag
+    assert again.content == b""
+
+
+def test_event_write_changes_the_etag(client, admin_headers):
+    create_event(client, admin_headers, title="First")
+    etag = client.get("/api/events").headers["ETag"]
+
+    create_event(client, admin_headers, title="Second")
+    response = client.get("/api/events", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert {e["title"] for e in response.json()["items"]} == {"First", "Second"}
+
+
+def test_listing_is_served_from_the_cache(client, admin_headers):
+    create_event(client, admin_headers)
+    client.get("/api/events")
+    hits = events_cache.hits
+    assert client.get("/api/events").json()["items"]
+    assert events_cache.hits == hits + 1
+
+
+def test_local_versions_expire_in_workers_that_missed_the_write(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "time", lambda: now[0])
+    worker_a, worker_b = LocalVersionBackend(max_age=5), LocalVersionBackend(max_age=5)
+    b_version = run(worker_b.get("events"))
+
+    run(worker_a.bump("events"))
+    # Worker B never saw the write, but its version rolls over within max_age
+    assert run(worker_b.get("events")) == b_version
+    now[0] += 5
+    assert run(worker_b.get("events")) != b_version
+
+
+def test_single_worker_versions_never_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "time", lambda: now[0])
+    worker = LocalVersionBackend(max_age=0)
+    version = run(worker.get("events"))
+    now[0] += 3600
+    assert run(worker.get("events")) == version
+    run(worker.bump("events"))
+    assert run(worker.get("events")) != version
+
+
+def test_listing_still_revalidates_later_by_default(client, admin_headers, monkeypatch):
+    create_event(client, admin_headers)
+    etag = client.get("/api/events").headers["ETag"]
+
+    later = cache.time.time() + 3600
+    monkeypatch.setattr(cache.time, "time", lambda: later)
+    assert client.get("/api/events", headers={"If-None-Match": etag}).status_code == 304
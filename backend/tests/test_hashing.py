@@ -0,0 +1,50 @@
+# backend/tests/test_hashing.py
+from passlib.hash import bcrypt
+from sqlalchemy import insert, select
+from backend.auth.hashing import hashing_pool
+from backend.config import settings
+from backend.database import engine
+from backend.models import Admin
+
+
+def _stored_hash() -> str:
+    with engine.connect() as conn:
+        return conn.scalar(select(Admin.hashed_password).where(Admin.username == "admin"))
+
+
+def _add_admin(rounds: int):
+    with engine.begin() as conn:
+        conn.execute(insert(Admin).values(
+            username="admin", hashed_password=bcrypt.using(rounds=rounds, ident="2b").hash("correct horse")
+        ))
+
+
+def test_login_rehashes_at_the_configured_cost(client):
+    _add_admin(settings.BCRYPT_ROUNDS + 1)
+
+    response = client.post("/api/admin/login", json={"username": "admin", "password": "correct horse"})
+    assert response.status_code == 200
+    upgraded = _stored_hash()
+    assert upgraded.startswith(f"$2b${settings.BCRYPT_ROUNDS:02d}$")
+
+    # Already at the target cost, so the next login leaves it alone
+    client.post("/api/admin/login", json={"username": "admin", "password": "correct horse"})
+    assert _stored_hash() == upgraded
+
+
+def test_failed_login_does_not_rehash(client):
+    _add_admin(settings.BCRYPT_ROUNDS + 1)
+    original = _stored_hash()
+
+    response = client.post("/api/admin/login", json={"username": "admin", "password": "wrong"})
+    assert response.status_code == 401
+    assert _stored_hash() == original
+
+
+def test_login_is_shed_when_the_hashing_queue_is_full(client, monkeypatch):
+    _add_admin(settings.BCRYPT_ROUNDS)
+    monkeypatch.setattr(hashing_pool, "max_pending", 0)
+
+    response = client.post("/api/admin/login", json={"username": "admin", "password": "correct horse"})
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
@@ -0,0 +1,63 @@
+# backend/tests/test_listings.py
+from datetime import datetime
+import pytest
+from sqlalchemy import insert
+from backend.database import engine
+from backend.models import Event, Registration, User
+from backend.tests.helpers import count_queries, seed_event, seed_registrations
+
+SIZES = (1, 10, 1000)
+
+
+def _queries_per_listing(client, path, headers=None):
+    counts = {}
+    for n, url in path.items():
+        with count_queries() as statements:
+            response = client.get(url, headers=headers)
+        assert response.status_code == 200, response.text
+        counts[n] = len(statements)
+    return counts
+
+
+def test_event_listing_query_count_is_independent_of_size(client):
+    urls = {}
+    for n in SIZES:
+        event_id = seed_event(f"event-{n}")
+        seed_registrations(event_id, n, start=n * 10)
+        urls[n] = f"/api/registrations/{event_id}"
+
+    counts = _queries_per_listing(client, urls)
+    assert len(set(counts.values())) == 1, counts
+
+
+def test_admin_event_listing_query_count_is_independent_of_size(client, admin_headers):
+    urls = {}
+    for n in SIZES:
+        event_id = seed_event(f"event-{n}")
+        seed_registrations(event_id, n, start=n * 10)
+        urls[n] = f"/api/admin/registrations/event/{event_id}?limit=500"
+
+    counts = _queries_per_listing(client, urls, admin_headers)
+    assert len(set(counts.values())) == 1, counts
+
+
+def test_user_listing_query_count_is_independent_of_size(client):
+    urls = {}
+    for n in SIZES:
+        user_id = f"user-{n}"
+        events = [
+            {"id": f"event-{n}-{i}", "title": "Seeded", "date": datetime(2026, 11, 1), "created_by": "tests"}
+            for i in range(n)
+        ]
+        registrations = [
+            {"id": f"reg-{n}-{i}", "user_id": user_id, "event_id": event["id"], "qr_code": f"/qr/{n}-{i}.png"}
+            for i, event in enumerate(events)
+        ]
+        with engine.begin() as conn:
+            conn.execute(insert(User).values(id=user_id, name="User", email=f"{user_id}@example.com"))
+            conn.execute(insert(Event), events)
+            conn.execute(insert(Registration), registrations)
+        urls[n] = f"/api/registrations/user/{user_id}"
+
+    counts = _queries_per_listing(client, urls)
+    assert len(set(counts.values())) == 1, counts
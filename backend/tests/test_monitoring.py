@@ -0,0 +1,42 @@
+# backend/tests/test_monitoring.py
+from backend.metrics import UNMATCHED_ROUTE, request_metrics
+from backend.routes import monitoring
+
+
+def _sample(body: str, prefix: str) -> float:
+    for line in body.splitlines():
+        if line.startswith(prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+def test_metrics_count_requests_by_route_template(client):
+    request_metrics.requests.clear()
+    for _ in range(3):
+        assert client.get("/api/events").status_code == 200
+    client.get("/no/such/path")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert _sample(body, 'http_requests_total{method="GET",route="/api/events",status="200"}') == 3
+    assert _sample(body, f'http_requests_total{{method="GET",route="{UNMATCHED_ROUTE}",status="404"}}') == 1
+    assert _sample(body, 'http_request_duration_seconds_count{method="GET",route="/api/events"}') >= 3
+    assert "db_pool_checked_out" in body
+
+
+def test_ready_once_the_database_answers(client):
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready"}
+
+
+def test_not_ready_when_the_database_fails(client, monkeypatch):
+    async def unreachable():
+        raise ConnectionRefusedError()
+
+    monkeypatch.setattr(monitoring, "_ping_database", unreachable)
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json() == {"status": "unavailable", "error": "ConnectionRefusedError"}
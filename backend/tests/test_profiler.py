@@ -0,0 +1,73 @@
+# backend/tests/test_profiler.py
+import logging
+import re
+from contextlib import asynccontextmanager
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.config import settings
+from backend.database import async_engine, get_db
+from backend.models import Event
+from backend.profiler import SQLProfiler, SQLProfilerMiddleware
+
+THRESHOLD = settings.SQL_N_PLUS_ONE_THRESHOLD
+
+
+@pytest.fixture
+def profiled_client():
+    """A small app wired up the way main.py does it when SQL_PROFILE is on."""
+    profiler = SQLProfiler(slow_query_ms=60000, n_plus_one_threshold=THRESHOLD)
+    profiler.instrument(async_engine.sync_engine)
+
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        # Pooled aiosqlite connections keep their threads, and the process, alive
+        await async_engine.dispose()
+
+    app = FastAPI(lifespan=lifespan)
+
+    @app.get("/lookups/{n}")
+    async def lookups(n: int, db: AsyncSession = Depends(get_db)):
+        # One lookup per id, the loop the N+1 warning exists to catch
+        for i in range(n):
+            await db.scalar(select(Event.id).where(Event.id == f"event-{i}"))
+        return {"lookups": n}
+
+    app.add_middleware(SQLProfilerMiddleware, profiler=profiler)
+    try:
+        with TestClient(app) as client:
+            yield client
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", profiler._before_cursor_execute)
+        event.remove(async_engine.sync_engine, "after_cursor_execute", profiler._after_cursor_execute)
+
+
+def _server_timing(response):
+    match = re.fullmatch(
+        r'db;dur=(\d+\.\d);desc="(\d+) queries", app;dur=(\d+\.\d)', response.headers["server-timing"]
+    )
+    assert match, response.headers["server-timing"]
+    return float(match[1]), int(match[2]), float(match[3])
+
+
+def test_server_timing_reports_queries_and_db_time(profiled_client):
+    db_ms, queries, app_ms = _server_timing(profiled_client.get("/lookups/3"))
+    assert queries == 3
+    assert 0 <= db_ms <= app_ms
+
+
+def test_n_plus_one_warning_fires_at_the_threshold(profiled_client, caplog, monkeypatch):
+    # Alembic's fileConfig in the migration tests disables loggers that already exist
+    monkeypatch.setattr(logging.getLogger("backend.profiler"), "disabled", False)
+    with caplog.at_level(logging.WARNING, logger="backend.profiler"):
+        profiled_client.get(f"/lookups/{THRESHOLD - 1}")
+    assert not [r for r in caplog.records if "Possible N+1" in r.message]
+
+    with caplog.at_level(logging.WARNING, logger="backend.profiler"):
+        profiled_client.get(f"/lookups/{THRESHOLD}")
+    warnings = [r.getMessage() for r in caplog.records if "Possible N+1" in r.getMessage()]
+    assert len(warnings) == 1
+    assert f"GET /lookups/{{n}}: {THRESHOLD} queries of the same shape" in warnings[0]
@@ -0,0 +1,118 @@
+# backend/tests/test_qr.py
+import base64
+import hashlib
+import hmac
+import uuid
+import pytest
+from backend.checkin import ALREADY_CHECKED_IN, CHECKED_IN, INVALID, NOT_FOUND, WRONG_EVENT
+from backend.qr import QR_PAYLOAD_PREFIX, QR_TEXT_PAYLOAD_PREFIX, build_qr_payload, parse_qr_payload
+from backend.tests.helpers import count_queries, seed_event, seed_registrations
+
+
+def _tamper(payload: str) -> str:
+    # Flip one character in the middle of the signed body
+    i = len(payload) // 2
+    return payload[:i] + ("A" if payload[i] != "A" else "B") + payload[i + 1:]
+
+
+def test_uuid_ids_use_the_compact_payload():
+    reg_id, event_id = str(uuid.uuid4()), str(uuid.uuid4())
+    payload = build_qr_payload(reg_id, event_id)
+    assert payload.startswith(QR_PAYLOAD_PREFIX) and len(payload) == 58
+    assert parse_qr_payload(payload) == (reg_id, event_id)
+
+
+@pytest.mark.parametrize("reg_id, event_id", [
+    ("reg-0", "event-1"),
+    (str(uuid.uuid4()).upper(), str(uuid.uuid4())),
+    (str(uuid.uuid4()), "imported:42"),
+])
+def test_other_ids_round_trip(reg_id, event_id):
+    payload = build_qr_payload(reg_id, event_id)
+    assert payload.startswith(QR_TEXT_PAYLOAD_PREFIX)
+    assert parse_qr_payload(payload) == (reg_id, event_id)
+
+
+def test_oversized_registration_id_is_refused():
+    with pytest.raises(ValueError):
+        build_qr_payload("r" * 256, "event-1")
+
+
+def test_forged_payloads_are_rejected():
+    uuid_payload = build_qr_payload(str(uuid.uuid4()), str(uuid.uuid4()))
+    text_payload = build_qr_payload("reg-0", "event-1")
+    body = bytes([5]) + b"reg-0" + b"event-1"
+    wrong_key = hmac.new(b"guessed-key", QR_TEXT_PAYLOAD_PREFIX.encode() + body, hashlib.sha256).digest()[:8]
+    forgeries = [
+        _tamper(uuid_payload),
+        _tamper(text_payload),
+        QR_TEXT_PAYLOAD_PREFIX + base64.urlsafe_b64encode(body + wrong_key).decode().rstrip("="),
+        # A valid ZB1 body and signature must not pass under the other prefix
+        QR_TEXT_PAYLOAD_PREFIX + uuid_payload[len(QR_PAYLOAD_PREFIX):],
+        QR_PAYLOAD_PREFIX + "not base64!",
+        "ZB9:" + text_payload[4:],
+        "",
+    ]
+    for payload in forgeries:
+        with pytest.raises(ValueError):
+            parse_qr_payload(payload)
+
+
+def test_check_in_rejects_forged_and_accepts_signed(client, admin_headers):
+    event_id = seed_event()
+    seed_registrations(event_id, 1)
+    url = f"/api/admin/events/{event_id}/checkin"
+    payload = build_qr_payload("reg-0", event_id)
+
+    forged = client.post(url, json={"payload": _tamper(payload)}, headers=admin_headers)
+    assert forged.json()["status"] == INVALID
+
+    signed = client.post(url, json={"payload": payload}, headers=admin_headers)
+    assert signed.json()["status"] == CHECKED_IN
+    assert signed.json()["registration_id"] == "reg-0"
+
+
+def test_qr_image_for_non_uuid_registration(client):
+    event_id = seed_event()
+    seed_registrations(event_id, 1)
+    response = client.get("/qr_codes/reg-0.png")
+    assert response.status_code == 200
+    assert response.content.startswith(b"\x89PNG")
+    assert client.get("/qr_codes/reg-0.png", headers={"If-None-Match": response.headers["etag"]}).status_code == 304
+
+
+def test_offline_sync_keeps_the_earliest_scan_in_one_update(client, admin_headers):
+    event_id = seed_event()
+    other_event = seed_event("event-2")
+    seed_registrations(event_id, 3)
+    url = f"/api/admin/events/{event_id}/checkin"
+    # reg-1 was checked in live at the gate, after the offline scans below
+    live = client.post(url, json={"payload": build_qr_payload("reg-1", event_id)}, headers=admin_headers)
+    assert live.json()["status"] == CHECKED_IN
+
+    scans = [
+        {"payload": build_qr_payload("reg-0", event_id), "scanned_at": "2026-01-01T09:05:00"},
+        # Same moment as 09:00 UTC, sent with an offset
+        {"payload": build_qr_payload("reg-0", event_id), "scanned_at": "2026-01-01T14:30:00+05:30"},
+        {"payload": build_qr_payload("reg-1", event_id), "scanned_at": "2026-01-01T08:00:00"},
+        {"payload": build_qr_payload("reg-2", other_event), "scanned_at": "2026-01-01T09:00:00"},
+        {"payload": build_qr_payload("reg-9", event_id), "scanned_at": "2026-01-01T09:00:00"},
+        {"payload": "ZB1:forged", "scanned_at": "2026-01-01T09:00:00"},
+    ]
+    with count_queries() as statements:
+        response = client.post(f"{url}/sync", json={"scans": scans}, headers=admin_headers)
+    assert response.status_code == 200, response.text
+    results = response.json()
+
+    assert [r["status"] for r in results] == [
+        ALREADY_CHECKED_IN, CHECKED_IN, ALREADY_CHECKED_IN, WRONG_EVENT, NOT_FOUND, INVALID
+    ]
+    # Both reg-0 scans report the earlier one; the offline scan beats the later live check-in
+    assert results[0]["checked_in_at"] == results[1]["checked_in_at"] == "2026-01-01T09:00:00"
+    assert results[2]["checked_in_at"] == "2026-01-01T08:00:00"
+    assert len([s for s in statements if s.lstrip().upper().startswith("UPDATE")]) == 1
+
+    # A later scan uploaded afterwards doesn't move the stored time forward
+    stale = [{"payload": build_qr_payload("reg-0", event_id), "scanned_at": "2026-01-01T10:00:00"}]
+    again = client.post(f"{url}/sync", json={"scans": stale}, headers=admin_headers).json()
+    assert again == [{"status": ALREADY_CHECKED_IN, "registration_id": "reg-0", "checked_in_at": "2026-01-01T09:00:00"}]
@@ -0,0 +1,41 @@
+# backend/tests/test_registration.py
+import json
+from backend.tests.helpers import create_event, registration
+
+
+def test_register_and_reject_duplicate(client, admin_headers):
+    event = create_event(client, admin_headers)
+    first = client.post("/api/register", json=registration(event["id"], 1))
+    assert first.status_code == 200
+    assert first.json()["status"] == "confirmed"
+
+    again = client.post("/api/register", json=registration(event["id"], 1))
+    assert again.status_code == 400
+    assert again.json()["detail"] == "User already registered for this event"
+
+
+def test_taken_user_id_is_not_reported_as_duplicate(client, admin_headers):
+    event = create_event(client, admin_headers)
+    user_id = client.post("/api/register", json=registration(event["id"], 1)).json()["user"]["id"]
+
+    # Same id, different email: a primary key collision on users
+    response = client.post("/api/register", json=registration(event["id"], 2, user_id=user_id))
+    assert response.status_code == 409
+    assert response.json()["detail"] == "user_id already belongs to another user"
+
+
+def test_import_rejects_taken_user_id_without_failing_the_batch(client, admin_headers):
+    event = create_event(client, admin_headers)
+    user_id = client.post("/api/register", json=registration(event["id"], 1)).json()["user"]["id"]
+
+    rows = [registration(event["id"], 2, user_id=user_id), registration(event["id"], 3)]
+    upload = "".join(json.dumps(row) + "\n" for row in rows)
+    response = client.post(
+        "/api/admin/registrations/import?format=ndjson",
+        files={"file": ("rows.ndjson", upload, "application/x-ndjson")},
+        headers=admin_headers,
+    )
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[0] == {"row": 1, "status": "error", "error": "user_id already belongs to another user"}
+    assert lines[1]["status"] == "created"
+    assert lines[-1]["summary"] == {"rows": 2, "created": 1, "duplicate": 0, "error": 1}
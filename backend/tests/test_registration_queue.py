@@ -0,0 +1,96 @@
+# backend/tests/test_registration_queue.py
+from sqlalchemy import select
+from backend import registration_queue as queue_module
+from backend.database import open_session
+from backend.models import Registration, User
+from backend.registration_queue import registration_queue
+from backend.tests.helpers import async_client, registration, run, seed_event
+
+
+def _submit_and_flush(monkeypatch, registrations):
+    """POST each registration with the queue on; return the 202s and the ticket results."""
+    monkeypatch.setattr(registration_queue, "enabled", True)
+
+    async def flow():
+        registration_queue.start()
+        async with async_client() as client:
+            accepted = [await client.post("/api/register", json=data) for data in registrations]
+            pending = await client.get(accepted[0].headers["Location"])
+            await registration_queue.stop()
+            results = [await client.get(r.json()["status_url"]) for r in accepted]
+        return accepted, pending, results
+
+    return run(flow())
+
+
+def test_ticket_flow(monkeypatch):
+    event_id = seed_event()
+    accepted, pending, results = _submit_and_flush(
+        monkeypatch, [registration(event_id, 1), registration(event_id, 1), registration(event_id, 2)]
+    )
+
+    assert [r.status_code for r in accepted] == [202, 202, 202]
+    ticket = accepted[0].json()
+    assert ticket["status"] == "pending"
+    assert accepted[0].headers["Location"] == ticket["status_url"]
+    # The batch window hasn't closed yet, so the ticket is still pending
+    assert pending.status_code == 202
+
+    assert [r.status_code for r in results] == [200, 400, 200]
+    assert results[0].json()["user"]["email"] == "user1@example.com"
+    assert results[1].json()["detail"] == "User already registered for this event"
+
+
+def test_unknown_ticket_is_404(client):
+    assert client.get("/api/register/tickets/nope").status_code == 404
+
+
+def test_unknown_event_leaves_no_user_behind(monkeypatch):
+    event_id = seed_event()
+    _, _, results = _submit_and_flush(
+        monkeypatch, [registration("missing", 1), registration(event_id, 2)]
+    )
+    assert [r.status_code for r in results] == [404, 200]
+
+    async def emails():
+        async with open_session() as db:
+            return set(await db.scalars(select(User.email)))
+    assert run(emails()) == {"user2@example.com"}
+
+
+def test_failed_retry_keeps_results_already_committed(monkeypatch):
+    event_id = seed_event()
+
+    async def failing_batch(db, tickets):
+        raise RuntimeError("batch failed")
+
+    create_registration = queue_module.create_registration
+
+    async def flaky_create(db, data):
+        if data.email == "user2@example.com":
+            raise RuntimeError("lost the connection")
+        return await create_registration(db, data)
+
+    monkeypatch.setattr(queue_module, "register_batch", failing_batch)
+    monkeypatch.setattr(queue_module, "create_registration", flaky_create)
+    _, _, results = _submit_and_flush(
+        monkeypatch, [registration(event_id, 1), registration(event_id, 2), registration(event_id, 3)]
+    )
+
+    assert [r.status_code for r in results] == [200, 500, 200]
+    assert results[1].json()["detail"] == "Registration could not be saved"
+
+
+def test_batch_keeps_arrival_order_for_the_waitlist(monkeypatch):
+    event_id = seed_event(capacity=1)
+    _, _, results = _submit_and_flush(monkeypatch, [registration(event_id, n) for n in range(4)])
+    reg_ids = [r.json()["id"] for r in results]
+    assert [r.json()["status"] for r in results] == ["confirmed", "waitlisted", "waitlisted", "waitlisted"]
+
+    async def registered_at():
+        async with open_session() as db:
+            return dict((await db.execute(select(Registration.id, Registration.registered_at))).all())
+    stored = run(registered_at())
+    times = [stored[reg_id] for reg_id in reg_ids]
+    # Distinct and increasing, so promotion by (registered_at, id) follows arrival
+    assert times == sorted(set(times))
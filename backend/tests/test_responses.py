@@ -0,0 +1,34 @@
+# backend/tests/test_responses.py
+import json
+from datetime import datetime, timezone
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from backend import responses
+from backend.responses import FastJSONResponse, trusted
+from backend.schemas import Page, UserOut
+
+
+def _page():
+    return Page(items=[UserOut(id="u-1", name="Ada", email="ada@example.com")], next_cursor="abc")
+
+
+def test_fast_json_renders_models_like_the_standard_path():
+    content = {"page": _page(), "at": datetime(2026, 10, 1, 12, 30, tzinfo=timezone.utc)}
+    standard = JSONResponse({"page": _page().model_dump(mode="json"), "at": "2026-10-01T12:30:00Z"}).body
+    assert json.loads(FastJSONResponse(content).body) == json.loads(standard)
+
+
+def test_trusted_passes_content_through_when_fast_json_is_off(monkeypatch):
+    monkeypatch.setattr(responses.settings, "FAST_JSON", False)
+    page = _page()
+    assert trusted(page) is page
+
+
+def test_trusted_renders_directly_and_keeps_headers(monkeypatch):
+    monkeypatch.setattr(responses.settings, "FAST_JSON", True)
+    handler_response = Response()
+    handler_response.headers["ETag"] = 'W/"v1"'
+    rendered = trusted(_page(), handler_response)
+    assert isinstance(rendered, FastJSONResponse)
+    assert rendered.headers["etag"] == 'W/"v1"'
+    assert json.loads(rendered.body)["items"][0]["email"] == "ada@example.com"
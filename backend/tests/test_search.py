@@ -0,0 +1,52 @@
+# backend/tests/test_search.py
+from datetime import datetime
+import pytest
+from sqlalchemy import delete, insert
+from backend.database import engine
+from backend.models import Registration, User
+from backend.tests.helpers import seed_event, seed_registrations
+
+
+def _seed_users(*names):
+    with engine.begin() as conn:
+        conn.execute(insert(User), [
+            {"id": f"named-{i}", "name": name, "email": f"named{i}@example.com", "registered_at": datetime(2026, 10, 1)}
+            for i, name in enumerate(names)
+        ])
+
+
+def _search(client, admin_headers, q, match="contains"):
+    response = client.get("/api/admin/search/users", params={"q": q, "match": match}, headers=admin_headers)
+    assert response.status_code == 200, response.text
+    return sorted(user["name"] for user in response.json()["items"])
+
+
+@pytest.mark.parametrize("q, match, expected", [
+    ("100%", "contains", ["Ran 100% Real"]),
+    ("0% R", "contains", ["Ran 100% Real"]),
+    ("a_b", "contains", ["Team a_b"]),
+    ("Team a_", "prefix", ["Team a_b"]),
+    ("a\\b", "contains", ["Slash a\\b"]),
+    ("Team", "prefix", ["Team a_b", "Team axb"]),
+])
+def test_wildcards_in_the_term_match_literally(client, admin_headers, q, match, expected):
+    _seed_users("Ran 100% Real", "Ran 1000 Real", "Team a_b", "Team axb", "Slash a\\b", "Slash axb")
+    assert _search(client, admin_headers, q, match) == expected
+
+
+def test_search_is_not_keyed_on_rowids(client, admin_headers):
+    event_id = seed_event()
+    seed_registrations(event_id, 40)
+    with engine.begin() as conn:
+        if conn.dialect.name != "sqlite":
+            pytest.skip("FTS5 indexes are SQLite's")
+        gone = [f"user-{i}" for i in range(0, 40, 2)]
+        conn.execute(delete(Registration).where(Registration.user_id.in_(gone)))
+        conn.execute(delete(User).where(User.id.in_(gone)))
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("VACUUM")
+        # VACUUM may renumber implicit rowids; renumber them outright so the test doesn't depend on when
+        conn.exec_driver_sql("UPDATE users SET rowid = rowid + 1000")
+
+    assert _search(client, admin_headers, "User 3") == ["User 3", "User 31", "User 33", "User 35", "User 37", "User 39"]
+    assert _search(client, admin_headers, "User 2") == ["User 21", "User 23", "User 25", "User 27", "User 29"]
@@ -0,0 +1,73 @@
+# backend/tests/test_stats.py
+from sqlalchemy import delete, event, update
+from backend import stats
+from backend.database import async_engine, engine, open_session
+from backend.models import GlobalStats
+from backend.tests.helpers import create_event, registration, run, seed_event, seed_registrations
+
+
+def _reconcile() -> int:
+    """Run reconcile() and return how many rows its writes touched."""
+    written = []
+
+    def count_rows(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("UPDATE", "INSERT", "DELETE")):
+            written.append(cursor.rowcount)
+
+    async def reconcile():
+        async with open_session() as db:
+            await stats.reconcile(db)
+
+    event.listen(async_engine.sync_engine, "after_cursor_execute", count_rows)
+    try:
+        run(reconcile())
+    finally:
+        event.remove(async_engine.sync_engine, "after_cursor_execute", count_rows)
+    return sum(written)
+
+
+def _global_stats():
+    async def read():
+        async with open_session() as db:
+            row = await db.get(GlobalStats, stats.GLOBAL_STATS_ID)
+            return row.total_events, row.total_registrations, row.total_users
+    return run(read())
+
+
+def test_reconcile_leaves_correct_counters_alone():
+    seed_event()
+    seed_registrations("event-1", 3)
+
+    assert _reconcile() > 0
+    assert _global_stats() == (1, 3, 3)
+    assert _reconcile() == 0
+
+
+def test_reconcile_corrects_drifted_counters():
+    seed_event()
+    seed_registrations("event-1", 2)
+    _reconcile()
+
+    async def drift():
+        async with open_session() as db:
+            await db.execute(update(GlobalStats).values(total_registrations=40))
+            await db.commit()
+    run(drift())
+
+    assert _reconcile() == 1
+    assert _global_stats() == (1, 2, 2)
+
+
+def _dashboard_totals(client, admin_headers):
+    return client.get("/api/admin/dashboard", headers=admin_headers).json()["stats"]
+
+
+def test_first_write_seeds_counters_that_include_it(client, admin_headers):
+    event_id = create_event(client, admin_headers)["id"]
+    assert _dashboard_totals(client, admin_headers) == {"total_events": 1, "total_registrations": 0, "total_users": 0}
+
+    # The registration path seeds the row too when it's missing
+    with engine.begin() as conn:
+        conn.execute(delete(GlobalStats))
+    assert client.post("/api/register", json=registration(event_id, 1)).status_code == 200
+    assert _dashboard_totals(client, admin_headers) == {"total_events": 1, "total_registrations": 1, "total_users": 1}